@@ -0,0 +1,76 @@
+"""
+Filter Kernels Module
+Fused match filter predicate, compiled with numba when it is available.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to NumPy masks
+    njit = None
+
+
+# Open date bounds, as int64 microseconds since the epoch
+DATE_MIN = np.iinfo(np.int64).min
+DATE_MAX = np.iinfo(np.int64).max
+
+
+def _range_mask_kernel(mask, category, select, wanted, dates, date_lo, date_hi,
+                       times, time_lo, time_hi, check_time):
+    """One pass over the rows still selected, written for numba"""
+    for i in range(mask.shape[0]):
+        if not mask[i]:
+            continue
+        if (category[i] & select) != wanted or dates[i] < date_lo or dates[i] > date_hi:
+            mask[i] = False
+        # NaN (no time) fails both comparisons, like the NumPy version
+        elif check_time and not (times[i] >= time_lo and times[i] <= time_hi):
+            mask[i] = False
+    return mask
+
+
+def _range_mask_numpy(mask, category, select, wanted, dates, date_lo, date_hi,
+                      times, time_lo, time_hi, check_time):
+    """Same results as the kernel, one NumPy comparison per active bound"""
+    if select:
+        mask &= (category & select) == wanted
+    if date_lo != DATE_MIN:
+        mask &= dates >= date_lo
+    if date_hi != DATE_MAX:
+        mask &= dates <= date_hi
+    if check_time:
+        mask &= (times >= time_lo) & (times <= time_hi)
+    return mask
+
+
+if njit is not None:
+    _range_mask = njit(cache=True)(_range_mask_kernel)
+else:
+    _range_mask = _range_mask_numpy
+
+
+def range_mask(mask, category, select, wanted, dates, date_lo=DATE_MIN, date_hi=DATE_MAX,
+               times=None, time_lo=None, time_hi=None):
+    """
+    Narrow a match mask by the packed category bits and the date and time ranges.
+
+    Args:
+        mask: Boolean row mask, updated in place
+        category: Packed category column; rows need (category & select) == wanted
+        select: Category bits to test, 0 for none
+        wanted: Required values of those bits
+        dates: Dates as int64 microseconds
+        date_lo, date_hi: Inclusive date bounds, DATE_MIN/DATE_MAX when open
+        times: Match times in ms with NaN for no time
+        time_lo, time_hi: Inclusive time bounds, None when open; any time
+            bound also drops rows without a time
+
+    Returns:
+        The updated mask
+    """
+    check_time = time_lo is not None or time_hi is not None
+    return _range_mask(mask, category, np.int64(select), np.int64(wanted), dates,
+                       np.int64(date_lo), np.int64(date_hi), times,
+                       -np.inf if time_lo is None else float(time_lo),
+                       np.inf if time_hi is None else float(time_hi), check_time)
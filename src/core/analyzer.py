@@ -8,10 +8,13 @@ from datetime import datetime, timedelta
 import time
 import json
 import os
-from typing import List, Dict, Optional, Any
+from functools import cached_property
+from typing import List, Dict, Optional, Any, Tuple
 import statistics
+import numpy as np
 
 from .match import Match
+from ._filter_kernels import range_mask, DATE_MIN, DATE_MAX
 from .rate_limiter import RateLimitTracker, load_rate_limit_state, save_rate_limit_state
 
 
@@ -21,11 +24,29 @@ class MCSRAnalyzer:
     # Cache directory for all JSON files (relative to project root)
     CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "cache")
     
-    def __init__(self, username: str):
+    # Bumped whenever self.matches or its segment data changes; class-level
+    # default so instances created without __init__ still have it
+    matches_version = 0
+    
+    # (matches list, length, matches_version, columns) behind filter_matches
+    _match_columns = None
+    
+    # Layout of the packed 'category' match column: season code, seed type
+    # code and the private room flag, so sidebar filters test it in one pass
+    CATEGORY_CODE_MASK = 0xFFFF
+    CATEGORY_SEASON_SHIFT = 0
+    CATEGORY_SEED_SHIFT = 16
+    CATEGORY_PRIVATE_SHIFT = 32
+    
+    def __init__(self, username: str, shared_cache: Optional[Dict[str, List[dict]]] = None):
         self.username = username
         self.base_url = "https://api.mcsrranked.com/"
         self.matches: List[Match] = []
         
+        # Optional in-process cache of parsed match JSON keyed by username,
+        # shared between analyzers so repeat loads skip the disk read
+        self.shared_cache = shared_cache
+        
         # Ensure cache directory exists
         os.makedirs(self.CACHE_DIR, exist_ok=True)
         
@@ -38,6 +59,39 @@ class MCSRAnalyzer:
         # Load rate limit state if exists
         load_rate_limit_state(self.rate_limiter, self.rate_limit_file)
     
+    def _load_match_cache(self) -> Optional[List[dict]]:
+        """Load parsed match cache data, preferring the shared in-process cache"""
+        if self.shared_cache is not None and self.username in self.shared_cache:
+            return self.shared_cache[self.username]
+        if not os.path.exists(self.cache_file):
+            return None
+        with open(self.cache_file, 'r') as f:
+            cached_data = json.load(f)
+        if self.shared_cache is not None:
+            self.shared_cache[self.username] = cached_data
+        return cached_data
+    
+    def _invalidate_shared_cache(self):
+        """Drop this user's entry from the shared cache after the cache file changes"""
+        if self.shared_cache is not None:
+            self.shared_cache.pop(self.username, None)
+    
+    @cached_property
+    def detailed_matches(self) -> List[Match]:
+        """Matches that have segment timeline data (cached until matches change)"""
+        return [m for m in self.matches if m.has_detailed_data]
+    
+    @cached_property
+    def _breakdown_cache(self) -> Dict[tuple, Dict]:
+        """Basic stats and season/seed type breakdowns keyed by their arguments (cached until matches change)"""
+        return {}
+    
+    def _on_matches_changed(self):
+        """Drop values derived from self.matches after it is replaced or mutated"""
+        self.__dict__.pop('detailed_matches', None)
+        self.__dict__.pop('_breakdown_cache', None)
+        self.matches_version += 1
+    
     def _load_segment_cache(self) -> Dict[int, Dict]:
         """Load cached segment data"""
         try:
@@ -109,6 +163,7 @@ class MCSRAnalyzer:
             print(f"DEBUG: Recalculated split times for {recalculated_count} matches")
             self._save_segment_cache(segment_cache)
         
+        self._on_matches_changed()
         return applied_count
     
     def fetch_matches_for_seasons(self, seasons: List[int] = None, use_cache: bool = True, max_matches: int = None) -> List[Match]:
@@ -200,11 +255,10 @@ class MCSRAnalyzer:
         print(f"DEBUG: fetch_all_matches called for user {self.username}, use_cache={use_cache}")
         print(f"DEBUG: cache_file path: {self.cache_file}")
         
-        if use_cache and os.path.exists(self.cache_file):
+        if use_cache:
             try:
-                with open(self.cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                    
+                cached_data = self._load_match_cache()
+                if cached_data is not None:
                     # Detect cache format - new format has 'analyzed_username' field
                     if cached_data and 'analyzed_username' in cached_data[0]:
                         # New format: already processed Match objects
@@ -214,7 +268,12 @@ class MCSRAnalyzer:
                             if match_dict.get('category') != 'ANY':
                                 continue
                             match = Match.__new__(Match)  # Create without calling __init__
-                            match.__dict__.update(match_dict)
+                            # Copy list/dict attributes (segments, elo_changes, ...) so in-place
+                            # updates stay on this match and out of the shared cache
+                            match.__dict__.update({
+                                key: value.copy() if isinstance(value, (list, dict)) else value
+                                for key, value in match_dict.items()
+                            })
                             # Convert datetime string back to datetime object if needed
                             if isinstance(match.datetime_obj, str):
                                 match.datetime_obj = datetime.fromisoformat(match.datetime_obj.replace('Z', '+00:00'))
@@ -246,7 +305,7 @@ class MCSRAnalyzer:
                 self.matches = []
                 for i, season in enumerate(seasons):
                     if progress_callback:
-                        progress_callback(f"Fetching season {season} ({i+1}/{len(seasons)})")
+                        progress_callback("Fetching season %d (%d/%d)", season, i + 1, len(seasons))
                     season_matches = self._fetch_season_data(season, 5000)
                     self.matches.extend([Match(data, self.username) for data in season_matches])
         else:
@@ -254,8 +313,11 @@ class MCSRAnalyzer:
             self.matches = self._fetch_incremental_data(max_matches)
         
         # Cache the data
+        self._invalidate_shared_cache()
         try:
-            match_data = [match.__dict__ for match in self.matches]
+            # Skip private attributes such as memoised display strings
+            match_data = [{k: v for k, v in match.__dict__.items() if not k.startswith('_')}
+                          for match in self.matches]
             with open(self.cache_file, 'w') as f:
                 json.dump(match_data, f, indent=2, default=str)
         except Exception:
@@ -272,7 +334,7 @@ class MCSRAnalyzer:
         
         for season in range(3, 15):  # Check seasons 3-14
             if progress_callback:
-                progress_callback(f"Checking season {season}...")
+                progress_callback("Checking season %d...", season)
             if not self.rate_limiter.can_make_request():
                 wait_time = self.rate_limiter.get_wait_time()
                 if wait_time > 0:
@@ -372,124 +434,227 @@ class MCSRAnalyzer:
         filter_params = locals().copy()
         filter_params.pop('self')
         
-        filtered = self.matches.copy()
-        filtered = self._apply_completion_filters(filtered, **filter_params)
-        filtered = self._apply_time_filters(filtered, **filter_params)
-        filtered = self._apply_match_type_filters(filtered, **filter_params)
-        filtered = self._apply_categorical_filters(filtered, **filter_params)
-        filtered = self._apply_date_filters(filtered, **filter_params)
-        return self._sort_matches(filtered, sort_by, sort_descending)
+        # Every filter narrows one boolean mask over the columnar match store
+        cols = self._get_match_columns()
+        mask = np.ones(len(cols['matches']), dtype=bool)
+        mask = self._apply_completion_filters(cols, mask, **filter_params)
+        mask = self._apply_time_filters(cols, mask, **filter_params)
+        mask = self._apply_match_type_filters(cols, mask, **filter_params)
+        mask, select, wanted = self._apply_categorical_filters(cols, mask, **filter_params)
+        mask = self._apply_range_filters(cols, mask, select, wanted, **filter_params)
+        
+        if sort_by == 'date':
+            # Walk the cached date order, keeping the rows the mask selects
+            order = self._get_date_order(cols, sort_descending)
+            return cols['matches'][order[mask[order]]].tolist()
+        
+        selected = np.flatnonzero(mask)
+        keys = self._get_sort_keys(cols, sort_by)
+        if keys is not None:
+            keys = keys[selected]
+            # Stable like list.sort(reverse=...): equal keys keep list order either way
+            selected = selected[np.argsort(-keys if sort_descending else keys, kind='stable')]
+        return cols['matches'][selected].tolist()
     
-    def _apply_completion_filters(self, matches: List[Match], **kwargs) -> List[Match]:
-        """Apply completion-based filters (completed_only, user_completed, wins, losses, draws, forfeits)"""
-        filtered = matches
+    def _get_match_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Column arrays of the match fields used by filter_matches, aligned with self.matches.
+        
+        Rebuilt when self.matches is replaced, grows or shrinks, or matches_version changes.
+        """
+        matches = self.matches
+        cached = self._match_columns
+        if (cached is not None and cached[0] is matches and cached[1] == len(matches)
+                and cached[2] == self.matches_version):
+            return cached[3]
+        
+        n = len(matches)
+        match_array = np.empty(n, dtype=object)
+        match_array[:] = matches
+        
+        def column(attr, dtype):
+            return np.fromiter((getattr(m, attr) for m in matches), dtype=dtype, count=n)
+        
+        def codes(attr):
+            # Categorical column: small ints plus the value -> code mapping
+            mapping = {}
+            values = np.fromiter((mapping.setdefault(getattr(m, attr), len(mapping)) for m in matches),
+                                 dtype=np.int32, count=n)
+            return values, mapping
+        
+        times = [m.match_time for m in matches]
+        season_codes, season_map = codes('season')
+        seed_codes, seed_map = codes('seed_type')
+        match_types = column('match_type', np.int64)
+        player_counts = column('player_count', np.int64)
+        # Private rooms, matching include_private_rooms=False
+        private = (match_types == 3) | (player_counts > 2)
+        cols = {
+            'matches': match_array,
+            'date': column('date', np.int64),
+            # Naive wall-clock datetimes as int64 microseconds, for the date range filter
+            'date_us': np.array([m.datetime_obj for m in matches], dtype='datetime64[us]').view(np.int64),
+            'has_time': np.fromiter((t is not None for t in times), dtype=bool, count=n),
+            'time': np.fromiter((np.nan if t is None else t for t in times), dtype=np.float64, count=n),
+            'user_completed': column('user_completed', bool),
+            'is_draw': column('is_draw', bool),
+            'forfeited': column('forfeited', bool),
+            # is_user_win as 1 (won), 0 (lost) or -1 (no clear winner)
+            'win': np.fromiter((-1 if m.is_user_win is None else int(m.is_user_win) for m in matches),
+                               dtype=np.int8, count=n),
+            'match_type': match_types,
+            'player_count': player_counts,
+            'has_uuid': np.fromiter((m.user_uuid is not None for m in matches), dtype=bool, count=n),
+            'has_detailed_data': column('has_detailed_data', bool),
+            'season': season_codes,
+            'season_map': season_map,
+            'seed_type': seed_codes,
+            'seed_type_map': seed_map,
+            # Season code, seed type code and private flag packed per CATEGORY_*
+            'category': (season_codes.astype(np.int64) << self.CATEGORY_SEASON_SHIFT)
+                        | (seed_codes.astype(np.int64) << self.CATEGORY_SEED_SHIFT)
+                        | (private.astype(np.int64) << self.CATEGORY_PRIVATE_SHIFT),
+        }
+        self._match_columns = (matches, n, self.matches_version, cols)
+        return cols
+    
+    @staticmethod
+    def _get_date_order(cols: Dict[str, np.ndarray], descending: bool) -> np.ndarray:
+        """
+        Row indices of the match columns sorted by date, cached alongside them.
         
+        Stable, so ties keep list order exactly like list.sort(key=date, reverse=...).
+        """
+        key = 'date_desc_order' if descending else 'date_asc_order'
+        order = cols.get(key)
+        if order is None:
+            dates = cols['date']
+            order = cols[key] = np.argsort(-dates if descending else dates, kind='stable')
+        return order
+    
+    @staticmethod
+    def _isin_codes(codes: np.ndarray, mapping: Dict, values) -> np.ndarray:
+        """Mask of rows whose categorical value is one of values"""
+        wanted = [mapping[v] for v in values if v in mapping]
+        return np.isin(codes, wanted)
+    
+    def _apply_completion_filters(self, cols: Dict[str, np.ndarray], mask: np.ndarray, **kwargs) -> np.ndarray:
+        """Apply completion-based filters (completed_only, user_completed, wins, losses, draws, forfeits)"""
         # Apply completed_only filter first (most restrictive)
         if kwargs.get('completed_only', False):
-            filtered = [m for m in filtered if (
-                m.user_completed and
-                m.match_time is not None and
-                not m.is_draw
-            )]
+            mask &= cols['user_completed'] & cols['has_time'] & ~cols['is_draw']
         
         # User completion filter
         user_completed = kwargs.get('user_completed')
         if user_completed is not None:
-            filtered = [m for m in filtered if m.user_completed == user_completed]
+            mask &= cols['user_completed'] == bool(user_completed)
         
         # Win/loss/draw filters
         if not kwargs.get('include_draws', True):
-            filtered = [m for m in filtered if not m.is_draw]
+            mask &= ~cols['is_draw']
         if not kwargs.get('include_forfeits', True):
-            filtered = [m for m in filtered if not m.forfeited]
+            mask &= ~cols['forfeited']
         if not kwargs.get('include_wins', True):
-            filtered = [m for m in filtered if m.is_user_win is not True]
+            mask &= cols['win'] != 1
         if not kwargs.get('include_losses', True):
-            filtered = [m for m in filtered if m.is_user_win is not False]
+            mask &= cols['win'] != 0
         
-        return filtered
+        return mask
     
-    def _apply_time_filters(self, matches: List[Match], **kwargs) -> List[Match]:
-        """Apply time-based filters (require_time, min_time_ms, max_time_ms)"""
-        filtered = matches
-        
+    def _apply_time_filters(self, cols: Dict[str, np.ndarray], mask: np.ndarray, **kwargs) -> np.ndarray:
+        """Apply time-based filters (require_time; the time range is in _apply_range_filters)"""
         if kwargs.get('require_time', False):
-            filtered = [m for m in filtered if m.match_time is not None]
+            mask &= cols['has_time']
         
-        min_time_ms = kwargs.get('min_time_ms')
-        if min_time_ms is not None:
-            filtered = [m for m in filtered if m.match_time is not None and m.match_time >= min_time_ms]
-        
-        max_time_ms = kwargs.get('max_time_ms')
-        if max_time_ms is not None:
-            filtered = [m for m in filtered if m.match_time is not None and m.match_time <= max_time_ms]
-        
-        return filtered
+        return mask
     
-    def _apply_match_type_filters(self, matches: List[Match], **kwargs) -> List[Match]:
-        """Apply match type filters (include_private_rooms, match_types, max_player_count, require_user_identified)"""
-        filtered = matches
-        
-        if not kwargs.get('include_private_rooms', True):
-            filtered = [m for m in filtered if not (m.match_type == 3 or m.player_count > 2)]
-        
+    def _apply_match_type_filters(self, cols: Dict[str, np.ndarray], mask: np.ndarray, **kwargs) -> np.ndarray:
+        """Apply match type filters (match_types, max_player_count, require_user_identified)"""
         match_types = kwargs.get('match_types')
         if match_types is not None:
-            filtered = [m for m in filtered if m.match_type in match_types]
+            mask &= np.isin(cols['match_type'], list(match_types))
         
         max_player_count = kwargs.get('max_player_count')
         if max_player_count is not None:
-            filtered = [m for m in filtered if m.player_count <= max_player_count]
+            mask &= cols['player_count'] <= max_player_count
         
         if kwargs.get('require_user_identified', False):
-            filtered = [m for m in filtered if m.user_uuid is not None or m.player_count == 1]
+            mask &= cols['has_uuid'] | (cols['player_count'] == 1)
         
         # Data availability filters
         has_detailed_data = kwargs.get('has_detailed_data')
         if has_detailed_data is not None:
-            filtered = [m for m in filtered if m.has_detailed_data == has_detailed_data]
+            mask &= cols['has_detailed_data'] == bool(has_detailed_data)
         
-        return filtered
+        return mask
     
-    def _apply_categorical_filters(self, matches: List[Match], **kwargs) -> List[Match]:
-        """Apply categorical filters (seasons, seed_types)"""
-        filtered = matches
+    def _apply_categorical_filters(self, cols: Dict[str, np.ndarray], mask: np.ndarray,
+                                   **kwargs) -> Tuple[np.ndarray, int, int]:
+        """
+        Apply categorical filters (seasons, seed_types, include_private_rooms).
         
-        seasons = kwargs.get('seasons')
-        if seasons is not None:
-            filtered = [m for m in filtered if m.season in seasons]
+        Returns:
+            (mask, select, wanted), where rows must also satisfy
+            (category & select) == wanted, tested by _apply_range_filters
+        """
+        # Single-valued selections and the private flag become bits that must
+        # match in the packed category column; multi-value lists fall back to isin
+        select = 0
+        wanted = 0
+        for key, column, shift in (('seasons', 'season', self.CATEGORY_SEASON_SHIFT),
+                                   ('seed_types', 'seed_type', self.CATEGORY_SEED_SHIFT)):
+            values = kwargs.get(key)
+            if values is None:
+                continue
+            mapping = cols[f'{column}_map']
+            codes = {mapping[v] for v in values if v in mapping}
+            if len(codes) == 1:
+                select |= self.CATEGORY_CODE_MASK << shift
+                wanted |= codes.pop() << shift
+            else:
+                mask &= self._isin_codes(cols[column], mapping, values)
         
-        seed_types = kwargs.get('seed_types')
-        if seed_types is not None:
-            filtered = [m for m in filtered if m.seed_type in seed_types]
+        if not kwargs.get('include_private_rooms', True):
+            select |= 1 << self.CATEGORY_PRIVATE_SHIFT
         
-        return filtered
+        return mask, select, wanted
     
-    def _apply_date_filters(self, matches: List[Match], **kwargs) -> List[Match]:
-        """Apply date range filters (date_from, date_to)"""
-        filtered = matches
-        
+    def _apply_range_filters(self, cols: Dict[str, np.ndarray], mask: np.ndarray,
+                             select: int, wanted: int, **kwargs) -> np.ndarray:
+        """Apply the packed category test, date range and time range (min_time_ms, max_time_ms) in one pass"""
+        # datetime64 compares naive wall-clock values exactly like datetime does
         date_from = kwargs.get('date_from')
-        if date_from is not None:
-            filtered = [m for m in filtered if m.datetime_obj >= date_from]
-        
         date_to = kwargs.get('date_to')
-        if date_to is not None:
-            filtered = [m for m in filtered if m.datetime_obj <= date_to]
+        date_lo = DATE_MIN if date_from is None else np.datetime64(date_from, 'us').astype(np.int64)
+        date_hi = DATE_MAX if date_to is None else np.datetime64(date_to, 'us').astype(np.int64)
         
-        return filtered
+        # Missing times are NaN, so a time bound also drops them
+        return range_mask(mask, cols['category'], select, wanted, cols['date_us'], date_lo, date_hi,
+                          cols['time'], kwargs.get('min_time_ms'), kwargs.get('max_time_ms'))
     
-    def _sort_matches(self, matches: List[Match], sort_by: str = 'date', sort_descending: bool = True) -> List[Match]:
-        """Sort matches by specified criteria"""
-        if sort_by == 'date':
-            matches.sort(key=lambda x: x.date, reverse=sort_descending)
-        elif sort_by == 'time':
-            matches.sort(key=lambda x: x.match_time if x.match_time is not None else float('inf'), 
-                        reverse=sort_descending)
-        elif sort_by == 'season':
-            matches.sort(key=lambda x: x.season, reverse=sort_descending)
-        
-        return matches
+    @staticmethod
+    def _get_sort_keys(cols: Dict[str, np.ndarray], sort_by: str) -> Optional[np.ndarray]:
+        """
+        Numeric sort key per match for the non-date sort_by options, cached in cols.
+        
+        Matches without a time sort last, and seasons sort by value rather than
+        by their code. Returns None for an unknown sort_by (list order is kept).
+        """
+        key = f'{sort_by}_sort_key'
+        keys = cols.get(key)
+        if keys is None:
+            if sort_by == 'time':
+                times = cols['time']
+                keys = np.where(np.isnan(times), np.inf, times)
+            elif sort_by == 'season':
+                ranks = np.empty(len(cols['season_map']), dtype=np.int64)
+                for rank, value in enumerate(sorted(cols['season_map'])):
+                    ranks[cols['season_map'][value]] = rank
+                keys = ranks[cols['season']]
+            else:
+                return None
+            cols[key] = keys
+        return keys
     
     def get_completed_matches(self, include_private_rooms: bool = True, min_time_seconds: int = 60) -> List[Match]:
         """Get matches where user actually completed the run"""
@@ -509,7 +674,15 @@ class MCSRAnalyzer:
         )
     
     def season_breakdown(self, include_private_rooms: bool = True, seed_type_filter: str = None) -> Dict[int, Dict]:
-        """Get statistics breakdown by season"""
+        """Get statistics breakdown by season (memoised per arguments until matches change)"""
+        key = ('season', include_private_rooms, seed_type_filter)
+        cached = self._breakdown_cache.get(key)
+        if cached is None:
+            cached = self._breakdown_cache[key] = self._compute_season_breakdown(include_private_rooms, seed_type_filter)
+        return cached
+    
+    def _compute_season_breakdown(self, include_private_rooms: bool, seed_type_filter: Optional[str]) -> Dict[int, Dict]:
+        """Build the statistics breakdown by season"""
         filters = {
             'include_private_rooms': include_private_rooms,
             'completed_only': True
@@ -544,7 +717,15 @@ class MCSRAnalyzer:
         return seasons
     
     def seed_type_breakdown(self, include_private_rooms: bool = True, season_filter: int = None) -> Dict[str, Dict]:
-        """Get statistics breakdown by seed type"""
+        """Get statistics breakdown by seed type (memoised per arguments until matches change)"""
+        key = ('seed_type', include_private_rooms, season_filter)
+        cached = self._breakdown_cache.get(key)
+        if cached is None:
+            cached = self._breakdown_cache[key] = self._compute_seed_type_breakdown(include_private_rooms, season_filter)
+        return cached
+    
+    def _compute_seed_type_breakdown(self, include_private_rooms: bool, season_filter: Optional[int]) -> Dict[str, Dict]:
+        """Build the statistics breakdown by seed type"""
         filters = {
             'include_private_rooms': include_private_rooms,
             'completed_only': True
@@ -673,7 +854,7 @@ class MCSRAnalyzer:
             
             # Update progress
             if progress_callback:
-                progress_callback(f"Fetching segment data: {fetched_count + 1}/{total_to_fetch}")
+                progress_callback("Fetching segment data: %d/%d", fetched_count + 1, total_to_fetch)
             
             url = f"{self.base_url}matches/{match.id}"
             
@@ -794,6 +975,7 @@ class MCSRAnalyzer:
         self._save_segment_cache(segment_cache)
         save_rate_limit_state(self.rate_limiter, self.rate_limit_file)
         
+        self._on_matches_changed()
         return fetched_count
     
     def _fetch_incremental_data(self, max_matches: int = None) -> List[Match]:
@@ -921,11 +1103,23 @@ class MCSRAnalyzer:
         
         # Reset in-memory data
         self.matches = []
+        self._on_matches_changed()
+        self._invalidate_shared_cache()
         
         return len(files_to_remove)
     
     def basic_stats(self, include_private_rooms: bool = True) -> Dict[str, Any]:
-        """Get basic statistics summary"""
+        """Get basic statistics summary (memoised per arguments until matches change)"""
+        key = ('basic', include_private_rooms)
+        cached = self._breakdown_cache.get(key)
+        if cached is None:
+            cached = self._compute_basic_stats(include_private_rooms)
+            if 'error' not in cached:
+                self._breakdown_cache[key] = cached
+        return cached
+    
+    def _compute_basic_stats(self, include_private_rooms: bool) -> Dict[str, Any]:
+        """Build the basic statistics summary"""
         try:
             completed_matches = self.get_completed_matches(include_private_rooms=include_private_rooms)
             all_matches = self.get_all_matches_with_result(include_private_rooms=include_private_rooms)
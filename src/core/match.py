@@ -3,13 +3,26 @@ Match data class for MCSR Ranked speedrun matches.
 Handles match information, status determination, and time conversion.
 """
 
+import sys
 from datetime import datetime
 from typing import Dict, Optional, List
 
 
+def _intern(value):
+    """Share one str object per distinct value; non-strings pass through"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class Match:
     """Represents a single MCSR Ranked speedrun match"""
     
+    # Display strings memoised on first use; the fields they format never
+    # change after __init__. Class-level defaults keep them out of __dict__
+    # (and so out of the JSON match cache) until they are first filled.
+    _date_str = None
+    _time_str = None
+    _winner_time_str = None
+    
     def __init__(self, data: dict, analyzed_username: str = None):
         self.id = data['id']
         self.analyzed_username = analyzed_username
@@ -25,7 +38,9 @@ class Match:
         else:
             self.seed_id = data.get('seedID', 'unknown')
             
-        self.seed_type = data.get('seedType', 'unknown')
+        # Seed types and nicknames repeat across matches, so every match
+        # shares one string per value instead of the decoder's copies
+        self.seed_type = _intern(data.get('seedType', 'unknown'))
         self.season = data['season']
         
         # Match type and player info for filtering
@@ -42,7 +57,7 @@ class Match:
         
         for player in players_list:
             self.players.append({
-                'nickname': player.get('nickname', 'Unknown'),
+                'nickname': _intern(player.get('nickname', 'Unknown')),
                 'uuid': player.get('uuid'),
                 'elo_rate': player.get('eloRate'),
                 'elo_change': player.get('eloChange')
@@ -117,21 +132,28 @@ class Match:
         # Initialize ELO change data (will be populated from detailed match data)
         self.elo_changes = {}
         
-    def time_str(self) -> str:
+    @staticmethod
+    def _format_ms(time_ms: Optional[int]) -> str:
         """Convert milliseconds to MM:SS.mmm format"""
-        if self.match_time is None:
+        if time_ms is None:
             return "N/A"
-        seconds = self.match_time / 1000
+        seconds = time_ms / 1000
         minutes, sec_remainder = divmod(seconds, 60)
-        return f'{int(minutes)}:{int(sec_remainder):02d}.{int(self.match_time % 1000):03d}'
+        return f'{int(minutes)}:{int(sec_remainder):02d}.{int(time_ms % 1000):03d}'
+    
+    def time_str(self) -> str:
+        """Convert milliseconds to MM:SS.mmm format"""
+        text = self._time_str
+        if text is None:
+            text = self._time_str = self._format_ms(self.match_time)
+        return text
     
     def winner_time_str(self) -> str:
         """Convert winner's time to MM:SS.mmm format"""
-        if self.winner_time is None:
-            return "N/A"
-        seconds = self.winner_time / 1000
-        minutes, sec_remainder = divmod(seconds, 60)
-        return f'{int(minutes)}:{int(sec_remainder):02d}.{int(self.winner_time % 1000):03d}'
+        text = self._winner_time_str
+        if text is None:
+            text = self._winner_time_str = self._format_ms(self.winner_time)
+        return text
     
     def get_status(self) -> str:
         """Get the match status from the analyzed user's perspective"""
@@ -151,7 +173,10 @@ class Match:
     
     def date_str(self) -> str:
         """Format match date as YYYY-MM-DD HH:MM"""
-        return self.datetime_obj.strftime("%Y-%m-%d %H:%M")
+        text = self._date_str
+        if text is None:
+            text = self._date_str = self.datetime_obj.strftime("%Y-%m-%d %H:%M")
+        return text
     
     def get_user_elo_rate(self) -> Optional[int]:
         """Get the user's ELO rating after this match"""
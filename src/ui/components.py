@@ -5,9 +5,40 @@ Creates and configures all UI elements.
 
 import tkinter as tk
 from tkinter import ttk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
 from .widgets.rich_text_widget import RichTextWidget
+from .widgets.virtual_treeview import VirtualTreeview
+
+
+# Forecast Type dropdown entries and their percentiles, in dropdown order
+FORECAST_PERCENTILES = {
+    "25th (Optimistic)": 25.0,
+    "50th (Median)": 50.0,
+    "75th (Conservative)": 75.0,
+    "10th (Very Optimistic)": 10.0,
+    "90th (Very Conservative)": 90.0,
+}
+
+
+class QuickStatsLabels:
+    """Sidebar quick-stat value labels, one slot per stat"""
+    
+    __slots__ = ('total_matches', 'completed', 'best_time', 'average')
+    
+    # (display name, slot) pairs in sidebar order
+    STATS = (
+        ('Total Matches', 'total_matches'),
+        ('Completed', 'completed'),
+        ('Best Time', 'best_time'),
+        ('Average', 'average'),
+    )
+    
+    # Text shown while no stats are loaded
+    PLACEHOLDER = "-"
+    
+    def reset(self):
+        """Show the placeholder in every slot"""
+        for _, slot in self.STATS:
+            getattr(self, slot).config(text=self.PLACEHOLDER)
 
 
 class TopBar:
@@ -158,14 +189,14 @@ class Sidebar:
         self.ui.quick_stats_frame = ttk.LabelFrame(self.ui.sidebar, text="Quick Stats", padding=10)
         self.ui.quick_stats_frame.pack(fill=tk.X, pady=5)
         
-        self.ui.quick_stats_labels = {}
-        for stat in ['Total Matches', 'Completed', 'Best Time', 'Average']:
+        self.ui.quick_stats_labels = QuickStatsLabels()
+        for stat, slot in QuickStatsLabels.STATS:
             frame = ttk.Frame(self.ui.quick_stats_frame)
             frame.pack(fill=tk.X, pady=2)
             ttk.Label(frame, text=f"{stat}:", font=('Segoe UI', 9)).pack(side=tk.LEFT)
-            label = ttk.Label(frame, text="-", font=('Segoe UI', 9, 'bold'))
+            label = ttk.Label(frame, text=QuickStatsLabels.PLACEHOLDER, font=('Segoe UI', 9, 'bold'))
             label.pack(side=tk.RIGHT)
-            self.ui.quick_stats_labels[stat] = label
+            setattr(self.ui.quick_stats_labels, slot, label)
     
 
 
@@ -232,7 +263,7 @@ class MainContent:
     def _on_segment_mode_toggle(self):
         """Handle segment mode toggle between absolute and split times."""
         # Refresh segment analysis if currently viewing segments
-        if hasattr(self.ui, '_current_view') and self.ui._current_view == 'segments':
+        if self.ui._current_view == 'segments':
             if self.ui.segment_analyzer:
                 self.ui.segment_analyzer.show_segments_text()
         
@@ -347,11 +378,19 @@ class MainContent:
         )
         self.ui.log_scale_check.pack(side=tk.RIGHT, padx=5)
 
+        # The matplotlib figure itself is created on first use, see create_chart_canvas
+        self.ui.notebook.bind('<<NotebookTabChanged>>', self.ui._on_notebook_tab_changed)
+        
+    def create_chart_canvas(self):
+        """Create the matplotlib figure, canvas and toolbar in the chart tab"""
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from matplotlib.figure import Figure
+        
         # Create matplotlib figure
         self.ui.fig = Figure(figsize=(10, 6), dpi=100)
         self.ui.fig.patch.set_facecolor('#2d2d2d')
         self.ui.canvas = FigureCanvasTkAgg(self.ui.fig, master=self.ui.chart_frame)
-        self.ui.canvas.draw()
+        self.ui.canvas.draw_idle()
         
         # Toolbar
         toolbar_frame = ttk.Frame(self.ui.chart_frame)
@@ -376,7 +415,7 @@ class MainContent:
         
         # Create treeview for match data
         columns = ('Date', 'Time', 'Season', 'Seed Type', 'Type', 'Status', 'Winner')
-        self.ui.match_tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=15)
+        self.ui.match_tree = VirtualTreeview(tree_frame, columns=columns, show='headings', height=15)
         
         # Configure columns
         col_widths = {'Date': 140, 'Time': 100, 'Season': 60, 'Seed Type': 100, 'Type': 80, 'Status': 80, 'Winner': 120}
@@ -384,13 +423,13 @@ class MainContent:
             self.ui.match_tree.heading(col, text=col, command=lambda c=col: self.ui._sort_treeview(c))
             self.ui.match_tree.column(col, width=col_widths.get(col, 100))
         
-        tree_scroll = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.ui.match_tree.yview)
-        self.ui.match_tree.configure(yscrollcommand=tree_scroll.set)
+        tree_scroll = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
+        self.ui.match_tree.attach_scrollbar(tree_scroll)
         tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         self.ui.match_tree.pack(fill=tk.BOTH, expand=True)
         
         # Bind selection event
-        self.ui.match_tree.bind('<<TreeviewSelect>>', self.ui._on_match_selected)
+        self.ui.match_tree.on_select(self.ui._on_match_selected)
         
         # Bottom frame for match details
         self.ui.detail_frame = ttk.LabelFrame(self.ui.match_paned, text="Match Details", padding=10)
@@ -429,17 +468,10 @@ class MainContent:
         ttk.Label(forecast_controls_frame, text="Forecast Type:").pack(side=tk.LEFT, padx=(0, 5))
         
         self.ui.forecast_percentile_var = tk.StringVar(value="50th (Median)")
-        forecast_percentile_values = [
-            "25th (Optimistic)", 
-            "50th (Median)", 
-            "75th (Conservative)",
-            "10th (Very Optimistic)",
-            "90th (Very Conservative)"
-        ]
         self.ui.forecast_percentile_combo = ttk.Combobox(
             forecast_controls_frame,
             textvariable=self.ui.forecast_percentile_var,
-            values=forecast_percentile_values,
+            values=list(FORECAST_PERCENTILES),
             state="readonly",
             width=20
         )
@@ -455,7 +487,7 @@ class MainContent:
         
         # Create treeview for forecast results
         forecast_columns = ('Rank', 'Date', 'Forecasted Time', 'Status', 'Current Progress', 'Last Segment')
-        self.ui.forecast_tree = ttk.Treeview(forecast_tree_frame, columns=forecast_columns, show='headings', height=15)
+        self.ui.forecast_tree = VirtualTreeview(forecast_tree_frame, columns=forecast_columns, show='headings', height=15)
         
         # Configure column headings and widths
         headings = {
@@ -472,9 +504,10 @@ class MainContent:
             self.ui.forecast_tree.column(col, width=width, minwidth=50, anchor='w')
         
         # Add scrollbars
-        forecast_v_scroll = ttk.Scrollbar(forecast_tree_frame, orient=tk.VERTICAL, command=self.ui.forecast_tree.yview)
+        forecast_v_scroll = ttk.Scrollbar(forecast_tree_frame, orient=tk.VERTICAL)
         forecast_h_scroll = ttk.Scrollbar(forecast_tree_frame, orient=tk.HORIZONTAL, command=self.ui.forecast_tree.xview)
-        self.ui.forecast_tree.configure(yscrollcommand=forecast_v_scroll.set, xscrollcommand=forecast_h_scroll.set)
+        self.ui.forecast_tree.attach_scrollbar(forecast_v_scroll)
+        self.ui.forecast_tree.configure(xscrollcommand=forecast_h_scroll.set)
         
         # Pack treeview and scrollbars
         self.ui.forecast_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -495,7 +528,7 @@ class MainContent:
         self.ui.forecast_detail_text.finalize()
         
         # Bind treeview selection event
-        self.ui.forecast_tree.bind('<<TreeviewSelect>>', self.ui._on_forecast_select)
+        self.ui.forecast_tree.on_select(self.ui._on_forecast_select)
         
         # Store forecast references for detail lookup
         self.ui.forecast_lookup = {}
@@ -532,8 +565,13 @@ class StatusBar:
         self.ui.loading_text_var = tk.StringVar(value="")
         self.ui.loading_text_label = ttk.Label(self.ui.progress_frame, textvariable=self.ui.loading_text_var, 
                                                font=('Segoe UI', 9), foreground='blue')
-        # Initially not packed - will be shown during loading
         
         # Progress bar (hidden by default)
         self.ui.progress = ttk.Progressbar(self.ui.progress_frame, mode='indeterminate', length=200)
-        # Initially not packed - will be shown during loading
+        
+        # Grid both once and remove them; grid() during loading restores the
+        # remembered slots instead of re-running the packer
+        self.ui.loading_text_label.grid(row=0, column=0, padx=(0, 10))
+        self.ui.progress.grid(row=0, column=1, padx=(5, 0))
+        self.ui.loading_text_label.grid_remove()
+        self.ui.progress.grid_remove()
@@ -9,6 +9,46 @@ from datetime import datetime
 from typing import Optional, Callable, Dict, Any, List
 
 
+class _Modal:
+    """
+    Modal state for a reusable Toplevel.
+    
+    The window is made transient once; each open/close then only toggles the
+    grab and visibility, skipping calls when the state is already correct.
+    Can also be used as a context manager around a modal interaction.
+    """
+    
+    def __init__(self, window: tk.Toplevel, parent: tk.Tk):
+        self.window = window
+        self.window.transient(parent)
+        self._active = False
+    
+    def open(self):
+        """Show the window and grab input."""
+        if self._active:
+            return
+        self.window.deiconify()
+        self.window.lift()
+        self.window.grab_set()
+        self._active = True
+    
+    def close(self):
+        """Release the grab and hide the window."""
+        if not self._active:
+            return
+        self.window.grab_release()
+        self.window.withdraw()
+        self._active = False
+    
+    def __enter__(self):
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
 class FiltersDialog:
     """Advanced filters dialog for date and time range filtering."""
     
@@ -30,14 +70,16 @@ class FiltersDialog:
         self.size = size
         
         self._create_dialog()
+        self._repopulate(current_filters)
     
     def _create_dialog(self):
         """Create and display the dialog."""
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title("Advanced Filters")
         self.dialog.geometry(f"{self.size[0]}x{self.size[1]}")
-        self.dialog.transient(self.parent)
-        self.dialog.grab_set()
+        self._modal = _Modal(self.dialog, self.parent)
+        self._modal.open()
+        self.dialog.protocol("WM_DELETE_WINDOW", self.close)
         
         # Center the dialog
         self.dialog.update_idletasks()
@@ -53,15 +95,13 @@ class FiltersDialog:
             row=0, column=0, columnspan=4, sticky='w', pady=(0, 10))
         
         ttk.Label(main_frame, text="From:").grid(row=1, column=0, sticky='w', pady=5)
-        date_from = self.current_filters.get('date_from')
-        self.date_from_var = tk.StringVar(value=date_from.strftime('%Y-%m-%d') if date_from else "")
+        self.date_from_var = tk.StringVar()
         date_from_entry = ttk.Entry(main_frame, textvariable=self.date_from_var, width=12)
         date_from_entry.grid(row=1, column=1, sticky='w', pady=5, padx=5)
         ttk.Label(main_frame, text="(YYYY-MM-DD)", font=('Segoe UI', 8)).grid(row=1, column=2, sticky='w')
         
         ttk.Label(main_frame, text="To:").grid(row=2, column=0, sticky='w', pady=5)
-        date_to = self.current_filters.get('date_to')
-        self.date_to_var = tk.StringVar(value=date_to.strftime('%Y-%m-%d') if date_to else "")
+        self.date_to_var = tk.StringVar()
         date_to_entry = ttk.Entry(main_frame, textvariable=self.date_to_var, width=12)
         date_to_entry.grid(row=2, column=1, sticky='w', pady=5, padx=5)
         ttk.Label(main_frame, text="(YYYY-MM-DD)", font=('Segoe UI', 8)).grid(row=2, column=2, sticky='w')
@@ -75,13 +115,13 @@ class FiltersDialog:
             row=4, column=0, columnspan=4, sticky='w', pady=(0, 10))
         
         ttk.Label(main_frame, text="Min Time:").grid(row=5, column=0, sticky='w', pady=5)
-        self.time_min_var = tk.StringVar(value=self._ms_to_mmss(self.current_filters.get('time_min')))
+        self.time_min_var = tk.StringVar()
         time_min_entry = ttk.Entry(main_frame, textvariable=self.time_min_var, width=12)
         time_min_entry.grid(row=5, column=1, sticky='w', pady=5, padx=5)
         ttk.Label(main_frame, text="(MM:SS or minutes)", font=('Segoe UI', 8)).grid(row=5, column=2, sticky='w')
         
         ttk.Label(main_frame, text="Max Time:").grid(row=6, column=0, sticky='w', pady=5)
-        self.time_max_var = tk.StringVar(value=self._ms_to_mmss(self.current_filters.get('time_max')))
+        self.time_max_var = tk.StringVar()
         time_max_entry = ttk.Entry(main_frame, textvariable=self.time_max_var, width=12)
         time_max_entry.grid(row=6, column=1, sticky='w', pady=5, padx=5)
         ttk.Label(main_frame, text="(MM:SS or minutes)", font=('Segoe UI', 8)).grid(row=6, column=2, sticky='w')
@@ -97,16 +137,33 @@ class FiltersDialog:
         
         ttk.Button(button_frame, text="Apply", command=self._apply).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Clear All", command=self._clear_and_apply).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.close).pack(side=tk.LEFT, padx=5)
+    
+    def _repopulate(self, current_filters: Dict[str, Any]):
+        """Load filter values into the existing entry variables."""
+        self.current_filters = current_filters
+        date_from = current_filters.get('date_from')
+        date_to = current_filters.get('date_to')
+        self.date_from_var.set(date_from.strftime('%Y-%m-%d') if date_from else "")
+        self.date_to_var.set(date_to.strftime('%Y-%m-%d') if date_to else "")
+        self.time_min_var.set(self._ms_to_mmss(current_filters.get('time_min')))
+        self.time_max_var.set(self._ms_to_mmss(current_filters.get('time_max')))
+    
+    def show(self, current_filters: Dict[str, Any]):
+        """Reopen the hidden dialog with the given filter values."""
+        self._repopulate(current_filters)
+        self._modal.open()
+    
+    def close(self):
+        """Hide the dialog so it can be reopened without rebuilding its widgets."""
+        self._modal.close()
     
     @staticmethod
     def _ms_to_mmss(ms: Optional[int]) -> str:
         """Convert milliseconds to MM:SS format."""
         if ms is None:
             return ""
-        total_seconds = ms / 1000
-        minutes = int(total_seconds // 60)
-        seconds = int(total_seconds % 60)
+        minutes, seconds = divmod(int(ms) // 1000, 60)
         return f"{minutes}:{seconds:02d}"
     
     @staticmethod
@@ -116,10 +173,10 @@ class FiltersDialog:
         if not time_str:
             return None
         try:
-            if ':' in time_str:
-                parts = time_str.split(':')
-                minutes = int(parts[0])
-                seconds = int(parts[1]) if len(parts) > 1 else 0
+            colon = time_str.find(':')
+            if colon != -1:
+                minutes = int(time_str[:colon])
+                seconds = int(time_str[colon + 1:]) if colon + 1 < len(time_str) else 0
                 return (minutes * 60 + seconds) * 1000
             else:
                 # Treat as decimal minutes
@@ -171,7 +228,7 @@ class FiltersDialog:
             'time_max': time_max
         })
         
-        self.dialog.destroy()
+        self.close()
     
     def _clear_and_apply(self):
         """Clear all filters and apply."""
@@ -181,7 +238,7 @@ class FiltersDialog:
             'time_min': None,
             'time_max': None
         })
-        self.dialog.destroy()
+        self.close()
 
 
 class ChartOptionsDialog:
@@ -207,38 +264,40 @@ class ChartOptionsDialog:
         self.size = size
         
         self._create_dialog()
+        self._repopulate(chart_options)
     
     def _create_dialog(self):
         """Create and display the dialog."""
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title("Chart Options")
-        self.dialog.transient(self.parent)
-        self.dialog.grab_set()
+        self._modal = _Modal(self.dialog, self.parent)
+        self._modal.open()
+        self.dialog.protocol("WM_DELETE_WINDOW", self.close)
         
         main_frame = ttk.Frame(self.dialog, padding=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Rolling average window
         ttk.Label(main_frame, text="Rolling Average Window:").grid(row=0, column=0, sticky='w', pady=5)
-        self.rolling_var = tk.IntVar(value=self.chart_options['rolling_window'])
+        self.rolling_var = tk.IntVar()
         rolling_spin = ttk.Spinbox(main_frame, from_=3, to=50, textvariable=self.rolling_var, width=10)
         rolling_spin.grid(row=0, column=1, sticky='w', pady=5, padx=10)
         
         # Point size
         ttk.Label(main_frame, text="Point Size:").grid(row=1, column=0, sticky='w', pady=5)
-        self.point_var = tk.IntVar(value=self.chart_options['point_size'])
+        self.point_var = tk.IntVar()
         point_spin = ttk.Spinbox(main_frame, from_=10, to=100, textvariable=self.point_var, width=10)
         point_spin.grid(row=1, column=1, sticky='w', pady=5, padx=10)
         
         # Line width
         ttk.Label(main_frame, text="Line Width:").grid(row=2, column=0, sticky='w', pady=5)
-        self.line_var = tk.IntVar(value=self.chart_options['line_width'])
+        self.line_var = tk.IntVar()
         line_spin = ttk.Spinbox(main_frame, from_=1, to=5, textvariable=self.line_var, width=10)
         line_spin.grid(row=2, column=1, sticky='w', pady=5, padx=10)
         
         # Color palette
         ttk.Label(main_frame, text="Color Palette:").grid(row=3, column=0, sticky='w', pady=5)
-        self.palette_var = tk.StringVar(value=self.chart_options['color_palette'])
+        self.palette_var = tk.StringVar()
         palette_combo = ttk.Combobox(main_frame, textvariable=self.palette_var, width=15, state='readonly')
         palette_combo['values'] = self.palettes
         palette_combo.grid(row=3, column=1, sticky='w', pady=5, padx=10)
@@ -250,38 +309,43 @@ class ChartOptionsDialog:
         ttk.Label(main_frame, text="Display Options:", font=('Segoe UI', 10, 'bold')).grid(
             row=5, column=0, columnspan=2, sticky='w', pady=5)
         
-        self.show_rolling = tk.BooleanVar(value=self.chart_options['show_rolling_avg'])
+        self.show_rolling = tk.BooleanVar()
         ttk.Checkbutton(main_frame, text="Show Rolling Average", variable=self.show_rolling).grid(
             row=6, column=0, columnspan=2, sticky='w', pady=2)
         
-        self.show_rolling_median = tk.BooleanVar(value=self.chart_options['show_rolling_median'])
+        self.show_rolling_median = tk.BooleanVar()
         ttk.Checkbutton(main_frame, text="Show Rolling Median", variable=self.show_rolling_median).grid(
             row=7, column=0, columnspan=2, sticky='w', pady=2)
         
-        self.show_std = tk.BooleanVar(value=self.chart_options['show_rolling_std'])
+        self.show_std = tk.BooleanVar()
         ttk.Checkbutton(main_frame, text="Show Rolling Std Dev (±1σ bands)", variable=self.show_std).grid(
             row=8, column=0, columnspan=2, sticky='w', pady=2)
         
-        self.show_pb = tk.BooleanVar(value=self.chart_options['show_pb_line'])
+        self.show_pb = tk.BooleanVar()
         ttk.Checkbutton(main_frame, text="Show PB Progression Line", variable=self.show_pb).grid(
             row=9, column=0, columnspan=2, sticky='w', pady=2)
         
-        self.show_grid = tk.BooleanVar(value=self.chart_options['show_grid'])
+        self.show_grid = tk.BooleanVar()
         ttk.Checkbutton(main_frame, text="Show Grid", variable=self.show_grid).grid(
             row=10, column=0, columnspan=2, sticky='w', pady=2)
 
-        self.show_log_scale = tk.BooleanVar(value=self.chart_options.get('log_scale', False))
+        self.show_log_scale = tk.BooleanVar()
         ttk.Checkbutton(main_frame, text="Log Scale (Y-axis, progression chart only)",
                         variable=self.show_log_scale).grid(
             row=11, column=0, columnspan=2, sticky='w', pady=2)
 
+        self.show_stats = tk.BooleanVar()
+        ttk.Checkbutton(main_frame, text="Show Stats Box (expanded segment view)",
+                        variable=self.show_stats).grid(
+            row=12, column=0, columnspan=2, sticky='w', pady=2)
+
         # Buttons
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=12, column=0, columnspan=2, pady=20)
+        button_frame.grid(row=13, column=0, columnspan=2, pady=20)
         
         ttk.Button(button_frame, text="Apply", command=self._apply).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Reset Defaults", command=self._reset_defaults).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.close).pack(side=tk.LEFT, padx=5)
 
         # Center over parent after content is laid out
         self.dialog.update_idletasks()
@@ -289,6 +353,30 @@ class ChartOptionsDialog:
         y = (self.dialog.winfo_screenheight() - self.dialog.winfo_height()) // 2
         self.dialog.geometry(f"+{x}+{y}")
     
+    def _repopulate(self, chart_options: Dict[str, Any]):
+        """Load option values into the existing widget variables."""
+        self.chart_options = chart_options
+        self.rolling_var.set(chart_options['rolling_window'])
+        self.point_var.set(chart_options['point_size'])
+        self.line_var.set(chart_options['line_width'])
+        self.palette_var.set(chart_options['color_palette'])
+        self.show_rolling.set(chart_options['show_rolling_avg'])
+        self.show_rolling_median.set(chart_options['show_rolling_median'])
+        self.show_std.set(chart_options['show_rolling_std'])
+        self.show_pb.set(chart_options['show_pb_line'])
+        self.show_grid.set(chart_options['show_grid'])
+        self.show_log_scale.set(chart_options.get('log_scale', False))
+        self.show_stats.set(chart_options.get('show_stats', True))
+    
+    def show(self, chart_options: Dict[str, Any]):
+        """Reopen the hidden dialog with the given chart options."""
+        self._repopulate(chart_options)
+        self._modal.open()
+    
+    def close(self):
+        """Hide the dialog so it can be reopened without rebuilding its widgets."""
+        self._modal.close()
+    
     def _apply(self):
         """Apply the current options."""
         self.on_apply({
@@ -302,8 +390,9 @@ class ChartOptionsDialog:
             'show_pb_line': self.show_pb.get(),
             'show_grid': self.show_grid.get(),
             'log_scale': self.show_log_scale.get(),
+            'show_stats': self.show_stats.get(),
         })
-        self.dialog.destroy()
+        self.close()
     
     def _reset_defaults(self):
         """Reset all options to defaults."""
@@ -317,3 +406,4 @@ class ChartOptionsDialog:
         self.show_pb.set(True)
         self.show_grid.set(True)
         self.show_log_scale.set(False)
+        self.show_stats.set(True)
@@ -0,0 +1,76 @@
+"""
+Stats Kernels Module
+Numeric kernels for segment statistics, compiled with numba when it is available.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to NumPy reductions
+    njit = None
+
+
+def _partition_median(arr):
+    """Median via a single O(n) partition instead of a full sort"""
+    n = arr.size
+    k = n // 2
+    part = np.partition(arr, k)
+    if n % 2:
+        return part[k]
+    # Everything left of k is <= part[k]; its max is the lower middle value
+    return 0.5 * (part[:k].max() + part[k])
+
+
+def _segment_stats_kernel(arr):
+    """Welford's online algorithm plus min/max and median, written for numba"""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    lo = np.inf
+    hi = -np.inf
+    for x in arr:
+        n += 1
+        d = x - mean
+        mean += d / n
+        m2 += d * (x - mean)
+        if x < lo:
+            lo = x
+        if x > hi:
+            hi = x
+
+    if n == 0:
+        return 0, np.nan, np.nan, np.nan, np.nan, np.nan
+
+    std = (m2 / (n - 1)) ** 0.5 if n > 1 else 0.0
+    return n, mean, std, lo, hi, _partition_median(arr)
+
+
+def _segment_stats_numpy(arr):
+    """Same results as the kernel using NumPy's C reductions"""
+    n = arr.size
+    if n == 0:
+        return 0, np.nan, np.nan, np.nan, np.nan, np.nan
+
+    std = arr.std(ddof=1) if n > 1 else 0.0
+    return n, arr.mean(), std, arr.min(), arr.max(), _partition_median(arr)
+
+
+if njit is not None:
+    _partition_median = njit(cache=True)(_partition_median)
+    _segment_stats = njit(cache=True)(_segment_stats_kernel)
+else:
+    _segment_stats = _segment_stats_numpy
+
+
+def segment_stats(times):
+    """
+    Summary statistics for a list of segment times.
+
+    Args:
+        times: Sequence of times in minutes
+
+    Returns:
+        Tuple of (count, mean, sample std dev, min, max, median)
+    """
+    return _segment_stats(np.ascontiguousarray(times, dtype=np.float64))
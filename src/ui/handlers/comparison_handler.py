@@ -21,6 +21,10 @@ class ComparisonHandler(BaseThreadHandler):
         super().__init__(ui_context)
         self.analyzer = None  # MCSRAnalyzer for comparison player
         self.active = False   # Whether comparison is currently active
+        
+        # Filtered match lists for the last seen filter state
+        self._last_filters_key = None
+        self._filtered_cache = ([], [])  # (all filtered, completed filtered)
     
     def load_player(self, username: str):
         """
@@ -39,7 +43,7 @@ class ComparisonHandler(BaseThreadHandler):
             return
         
         def work_func(progress_callback=None):
-            comparison_analyzer = MCSRAnalyzer(username)
+            comparison_analyzer = MCSRAnalyzer(username, shared_cache=self.ui._analyzer_cache)
             comparison_analyzer.fetch_all_matches(use_cache=True)
             return (comparison_analyzer, username)
         
@@ -57,6 +61,10 @@ class ComparisonHandler(BaseThreadHandler):
         """Handle successful comparison player loading"""
         self.analyzer = analyzer
         self.active = True
+        self._last_filters_key = None
+        # Segment stats memoised against the previous comparison player are stale
+        if self.ui.segment_analyzer:
+            self.ui.segment_analyzer.invalidate_cache()
         # Note: Button state is handled by BaseThreadHandler
         self.ui.comparison_var.set(username)
         self.ui.status_var.set(f"Loaded comparison data for {username}")
@@ -73,19 +81,45 @@ class ComparisonHandler(BaseThreadHandler):
         """Clear comparison player data"""
         self.analyzer = None
         self.active = False
+        self._last_filters_key = None
+        self._filtered_cache = ([], [])
+        # Drop segment stats memoised with the cleared comparison player
+        if self.ui.segment_analyzer:
+            self.ui.segment_analyzer.invalidate_cache()
         self.ui.comparison_var.set("None")
         self.ui.status_var.set("Comparison cleared")
         
         # Refresh current view to remove comparison
         self.ui._refresh_current_view()
     
+    def _compute(self):
+        """
+        Filter comparison matches once per filter state and data version.
+        
+        The completed subset is derived from the full filtered list with the
+        same predicate filter_matches(completed_only=True) uses, so both views
+        come from a single pass over the analyzer's matches.
+        """
+        if not self.analyzer:
+            return [], []
+        
+        analyzer = self.analyzer
+        key = (analyzer.matches_version, len(analyzer.matches), self.ui.filter_manager.get_filter_key())
+        if key != self._last_filters_key:
+            all_filtered = self.ui.filter_manager.get_all_filtered_matches(analyzer)
+            completed = [m for m in all_filtered
+                         if m.user_completed and m.match_time is not None and not m.is_draw]
+            self._filtered_cache = (all_filtered, completed)
+            self._last_filters_key = key
+        return self._filtered_cache
+    
     def get_filtered_matches(self):
         """Get comparison player's completed matches with same filters as main player"""
-        return self.ui.filter_manager.get_filtered_matches(self.analyzer, completed_only=True)
+        return self._compute()[1]
     
     def get_all_filtered_matches(self):
         """Get all comparison player matches (wins/losses/draws) with same filters as main player"""
-        return self.ui.filter_manager.get_all_filtered_matches(self.analyzer)
+        return self._compute()[0]
     
     def is_active(self) -> bool:
         """Check if comparison is currently active"""
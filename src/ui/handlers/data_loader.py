@@ -19,6 +19,12 @@ class DataLoader(BaseThreadHandler):
             ui_context: Reference to main UI (MCSRStatsUI instance)
         """
         super().__init__(ui_context)
+        
+        # Last values pushed to the season/seed dropdowns (matches TopBar defaults)
+        self._season_values = ('All',)
+        self._seed_values = ('All',)
+        
+        self._load_generation = 0  # Bumped per match load so superseded results are dropped
     
     def load_from_cache(self):
         """Load data from cache"""
@@ -29,18 +35,8 @@ class DataLoader(BaseThreadHandler):
             
         self.ui._set_status(f"Loading data for {username}...")
         self.ui._show_loading_progress("Loading from cache...")
-        
-        def work_func(progress_callback):
-            self.ui.analyzer = MCSRAnalyzer(username)
-            self.ui.analyzer.fetch_all_matches(use_cache=True, progress_callback=progress_callback)
-            return True  # Success indicator
-        
-        self.execute_with_progress(
-            f"Loading data for {username}...",
-            work_func,
-            lambda result: self._on_data_loaded(),
-            self._on_load_error
-        )
+        self._load_matches(username, True, f"Loading data for {username}...",
+                           self.ui.load_btn, "Load")
         
     def refresh_from_api(self):
         """Fetch fresh data from API"""
@@ -51,17 +47,41 @@ class DataLoader(BaseThreadHandler):
             
         self.ui._set_status(f"Fetching data from API for {username}...")
         self.ui._show_loading_progress("Fetching from API...")
+        self._load_matches(username, False, f"Fetching data from API for {username}...",
+                           self.ui.refresh_btn, "Refresh")
+    
+    def _load_matches(self, username: str, use_cache: bool, operation_name: str, button, normal_text: str):
+        """
+        Fetch a player's matches into a new analyzer off the Tk thread.
+        
+        The analyzer only replaces ui.analyzer once it is fully loaded, on the
+        Tk thread, so views never see a half-fetched match list. A load started
+        later supersedes this one, whichever finishes first.
+        """
+        self._load_generation += 1
+        generation = self._load_generation
         
         def work_func(progress_callback):
-            self.ui.analyzer = MCSRAnalyzer(username)
-            self.ui.analyzer.fetch_all_matches(use_cache=False, progress_callback=progress_callback)
-            return True  # Success indicator
+            analyzer = MCSRAnalyzer(username, shared_cache=self.ui._analyzer_cache)
+            analyzer.fetch_all_matches(use_cache=use_cache, progress_callback=progress_callback)
+            return analyzer
+        
+        def on_loaded(analyzer):
+            if generation == self._load_generation:
+                self._on_data_loaded(analyzer)
+        
+        def on_error(error):
+            if generation == self._load_generation:
+                self._on_load_error(error)
         
         self.execute_with_progress(
-            f"Fetching data from API for {username}...",
+            operation_name,
             work_func,
-            lambda result: self._on_data_loaded(),
-            self._on_load_error
+            on_loaded,
+            on_error,
+            button=button,
+            loading_text="Loading...",
+            normal_text=normal_text
         )
         
     def fetch_segments(self):
@@ -73,8 +93,10 @@ class DataLoader(BaseThreadHandler):
         self.ui._set_status("Fetching segment data...")
         self.ui._show_loading_progress("Preparing segment fetch...")
         
+        analyzer = self.ui.analyzer  # A load finishing meanwhile must not redirect the fetch
+        
         def work_func(progress_callback):
-            fetched_count = self.ui.analyzer.fetch_segment_data(
+            fetched_count = analyzer.fetch_segment_data(
                 max_matches=100, force_refresh=False, progress_callback=progress_callback
             )
             return fetched_count
@@ -83,7 +105,10 @@ class DataLoader(BaseThreadHandler):
             "Fetching segment data...",
             work_func,
             lambda fetched_count: self._on_segments_loaded(fetched_count),
-            self._on_load_error
+            self._on_load_error,
+            button=self.ui.fetch_segments_btn,
+            loading_text="Fetching...",
+            normal_text="Fetch Segments"
         )
     
     def clear_basic_data(self):
@@ -108,8 +133,7 @@ class DataLoader(BaseThreadHandler):
                 files_removed = self.ui.analyzer.clear_user_data(clear_detailed=False)
                 # Reset UI state
                 self.ui.analyzer = None
-                self.ui.season_combo['values'] = ['All']
-                self.ui.seed_filter_combo['values'] = ['All']
+                self._set_filter_values(('All',), ('All',))
                 self.ui._clear_display()
                 self.ui._set_status(f"Cleared basic data for {username} ({files_removed} files removed)")
                 messagebox.showinfo("Success", f"Basic data cleared for {username}")
@@ -141,8 +165,7 @@ class DataLoader(BaseThreadHandler):
                 files_removed = self.ui.analyzer.clear_user_data(clear_detailed=True)
                 # Reset UI state  
                 self.ui.analyzer = None
-                self.ui.season_combo['values'] = ['All']
-                self.ui.seed_filter_combo['values'] = ['All']
+                self._set_filter_values(('All',), ('All',))
                 self.ui._clear_display()
                 self.ui._set_status(f"Cleared all data for {username} ({files_removed} files removed)")
                 messagebox.showinfo("Success", f"All data cleared for {username}")
@@ -151,17 +174,37 @@ class DataLoader(BaseThreadHandler):
                 self.ui._set_status(f"Error clearing data: {error_msg}")
                 messagebox.showerror("Error", f"Failed to clear data: {error_msg}")
         
-    def _on_data_loaded(self):
-        """Called when data is loaded"""
+    def _set_filter_values(self, season_values: tuple, seed_values: tuple):
+        """Update the filter dropdowns, skipping the Tk call when values are unchanged"""
+        if season_values != self._season_values:
+            self.ui.season_combo['values'] = season_values
+            self._season_values = season_values
+        if seed_values != self._seed_values:
+            self.ui.seed_filter_combo['values'] = seed_values
+            self._seed_values = seed_values
+        
+    def _on_data_loaded(self, analyzer):
+        """Called on the Tk thread with the freshly loaded analyzer"""
+        self.ui.analyzer = analyzer
         self.ui._hide_loading_progress()
         
-        # Update season filter
-        seasons = set(m.season for m in self.ui.analyzer.matches)
-        self.ui.season_combo['values'] = ['All'] + sorted(seasons)
+        matches = self.ui.analyzer.matches
+        
+        # Update season filter - matches are stored newest-first, so walking them
+        # in reverse yields seasons already in (near) ascending order and the
+        # sort below is a linear pass over a handful of keys
+        seasons = dict.fromkeys(m.season for m in reversed(matches))
         
         # Update seed type filter
-        seed_types = set(m.seed_type for m in self.ui.analyzer.matches if m.seed_type is not None)
-        self.ui.seed_filter_combo['values'] = ['All'] + sorted(seed_types)
+        seed_types = dict.fromkeys(m.seed_type for m in matches if m.seed_type is not None)
+        
+        self._set_filter_values(('All', *sorted(seasons)), ('All', *sorted(seed_types)))
+        
+        # Drop filter results, match rows and segment data memoised for the previous match list
+        self.ui._invalidate_filter_cache()
+        self.ui._invalidate_match_row_cache()
+        if self.ui.segment_analyzer:
+            self.ui.segment_analyzer.invalidate_cache()
         
         # Update quick stats
         self.ui._update_quick_stats()
@@ -178,7 +221,13 @@ class DataLoader(BaseThreadHandler):
         """Called when segment data is loaded"""
         self.ui._hide_loading_progress()
         
-        detailed_count = sum(1 for m in self.ui.analyzer.matches if m.has_detailed_data)
+        # Newly fetched segments change the progression data
+        self.ui._invalidate_filter_cache()
+        self.ui._invalidate_match_row_cache()
+        if self.ui.segment_analyzer:
+            self.ui.segment_analyzer.invalidate_cache()
+        
+        detailed_count = len(self.ui.analyzer.detailed_matches)
         if fetched_count > 0:
             self.ui._set_status(f"Fetched {fetched_count} new segments, {detailed_count} total with segment data")
             messagebox.showinfo("Success", f"Fetched detailed segment data for {fetched_count} new matches.\nTotal matches with segment data: {detailed_count}")
@@ -5,10 +5,93 @@ Handles all segment-related views and interactions for MCSR Ranked Stats Browser
 
 import tkinter as tk
 from tkinter import messagebox
-import statistics
-import matplotlib.pyplot as plt
+import threading
+from collections import OrderedDict
+import numpy as np
 from typing import Optional, Dict, List, Any
-from ...visualization.match_info_dialog import show_match_info_dialog
+from ._stats_kernels import segment_stats
+from ...utils.time_formatting import format_minutes_to_strings
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to NumPy masks
+    njit = None
+
+
+def _segment_keep_mask_kernel(has_seg, user_completed, draw_forfeit, last_seg_idx,
+                              use_splits, game_end_idx):
+    """Per-(segment, match) keep mask, written as plain loops for numba"""
+    n_segs, n = has_seg.shape
+    keep = np.zeros((n_segs, n), dtype=np.bool_)
+    for s in range(n_segs):
+        for i in range(n):
+            if not has_seg[s, i]:
+                continue
+            if s == game_end_idx and not user_completed[i]:
+                continue
+            if use_splits and draw_forfeit[i] and s == last_seg_idx[i]:
+                continue
+            keep[s, i] = True
+    return keep
+
+
+def _segment_keep_mask_numpy(has_seg, user_completed, draw_forfeit, last_seg_idx,
+                             use_splits, game_end_idx):
+    """Per-(segment, match) keep mask using broadcast NumPy boolean ops"""
+    seg_idx = np.arange(has_seg.shape[0])[:, None]
+
+    # For game_end, only include if user actually completed the run
+    exclude = (seg_idx == game_end_idx) & ~user_completed[None, :]
+
+    # For incomplete matches (draw/forfeit), skip the last segment for splits
+    if use_splits:
+        exclude |= draw_forfeit[None, :] & (seg_idx == last_seg_idx[None, :])
+
+    return has_seg & ~exclude
+
+
+def _absolute_keep_mask(has_seg, user_completed, game_end_idx):
+    """Keep mask for absolute times - only the game_end row needs filtering"""
+    keep = has_seg.copy()
+    keep[game_end_idx] &= user_completed
+    return keep
+
+
+if njit is not None:
+    _segment_keep_mask = njit(cache=True)(_segment_keep_mask_kernel)
+else:
+    _segment_keep_mask = _segment_keep_mask_numpy
+
+
+def _decimate_pb_series(x_data, times, max_points=2000):
+    """
+    Thin a series down to the points that shape its PB progression line.
+
+    Between new PBs the line is flat, so only the first point, each new PB,
+    the point just before it and the last point are needed. The line drawn
+    from the reduced series is identical to the full one.
+
+    Returns:
+        Tuple of (x_data, times), unchanged if there are at most max_points
+    """
+    if len(times) <= max_points:
+        return x_data, times
+
+    y = np.asarray(times, dtype=np.float64)
+    pb = np.minimum.accumulate(y)
+    new_pb = np.flatnonzero(pb[1:] < pb[:-1]) + 1
+    keep = np.unique(np.concatenate(([0], new_pb - 1, new_pb, [len(y) - 1]))).tolist()
+    return [x_data[i] for i in keep], [times[i] for i in keep]
+
+
+def _warm_segment_kernel():
+    """Trigger numba compilation ahead of the first segment view"""
+    try:
+        _segment_keep_mask(np.zeros((1, 1), dtype=np.bool_), np.zeros(1, dtype=np.bool_),
+                           np.zeros(1, dtype=np.bool_), np.zeros(1, dtype=np.int8), True, 0)
+        segment_stats([0.0, 1.0])
+    except Exception as e:
+        print(f"DEBUG: Segment kernel warm-up failed: {e}")
 
 
 class SegmentAnalyzer:
@@ -40,6 +123,10 @@ class SegmentAnalyzer:
         'game_end': 'End -> Finish'
     }
 
+    # Number of filter/mode combinations kept in the progression memo
+    SEGPROG_CACHE_SIZE = 4
+    STATS_TEXT_CACHE_SIZE = 32
+
     def __init__(self, ui_context):
         """
         Initialize segment analyzer
@@ -52,56 +139,153 @@ class SegmentAnalyzer:
         # Segment expansion state
         self._segment_expanded = False
         self._expanded_segment = None
-        self._segment_axes_map = {}  # Maps axes to segment names
         self._cached_segment_data = {}  # Cached data for expanded view
         self._segment_display = {}  # Display names for segments
         self._available_segments = []  # Segments with enough data
+        self._segprog_cache = OrderedDict()  # Memoised progression data keyed by filters/mode
+        self._segtext_cache = None  # (key, stats) for the segments text view
+        self._stats_text_cache = OrderedDict()  # Expanded view stats text keyed by data/segment
+        self._segment_artists = {}  # Maps grid axes to their artist handles for in-place updates
+        self._segment_grid_state = None  # Layout signature of the drawn grid
+        self._filter_suffix_cache = None  # Title suffix for the season/seed filters
+        self._expanded_plot_state = None  # Inputs behind the drawn expanded chart
+        self._expanded_stats_artist = None  # Stats box of the drawn expanded chart
+
+        # Rebuild the filter suffix only when one of its filters changes
+        for var in (self.ui.season_var, self.ui.seed_filter_var):
+            var.trace_add('write', self._on_title_filter_changed)
 
-    def _collect_segment_data(self, matches: List, segment: str, show_splits: bool) -> Dict[str, List]:
+        # Compile the numba kernel in the background so the first view isn't slow
+        if njit is not None:
+            threading.Thread(target=_warm_segment_kernel, daemon=True).start()
+
+    def _on_title_filter_changed(self, *args):
+        """Drop the cached filter suffix when the season or seed filter changes"""
+        self._filter_suffix_cache = None
+
+    def _get_filter_suffix(self) -> str:
+        """Get the ' [Season X, Seed]' title suffix for the active filters"""
+        if self._filter_suffix_cache is None:
+            _, season, seed_filter = self.ui.filter_manager.get_filter_values()
+            filters = []
+            if season != 'All':
+                filters.append(f"Season {season}")
+            if seed_filter != 'All':
+                filters.append(seed_filter)
+            self._filter_suffix_cache = f" [{', '.join(filters)}]" if filters else ''
+        return self._filter_suffix_cache
+
+    def _build_segment_soa(self, matches: List, segment_names: List[str]) -> Dict[str, np.ndarray]:
         """
-        Collect segment timing data from a list of matches.
+        Build a struct-of-arrays view of segment timings for a list of matches.
 
         Args:
             matches: List of Match objects with detailed data
-            segment: Segment name to collect data for
-            show_splits: Whether to use split times or absolute times
+            segment_names: Segment names defining the row order
 
         Returns:
-            Dict with 'times', 'dates', and 'matches' lists
+            Dict of arrays shaped (segments, matches) for 'split_min', 'abs_min'
+            and 'has_seg', plus per-match 'last_seg_idx', 'user_completed',
+            'draw_forfeit', 'dates', 'dates_num' and 'matches' arrays
         """
-        times = []
-        dates = []
-        match_objs = []
+        import matplotlib.dates as mdates
 
-        for match in matches:
-            if segment not in match.segments:
-                continue
+        n_segs = len(segment_names)
+        n = len(matches)
+        seg_index = {seg: i for i, seg in enumerate(segment_names)}
+        # One preallocated buffer holds both time matrices ([0] split, [1] absolute)
+        times_buf = np.full((2, n_segs, n), np.nan)
+        split_ms = times_buf[0]
+        abs_ms = times_buf[1]
+        has_seg = np.zeros((n_segs, n), dtype=bool)
+        # Index of the last segment present in each match (-1 if none)
+        last_seg_idx = np.full(n, -1, dtype=np.int8)
+        user_completed = np.zeros(n, dtype=bool)
+        draw_forfeit = np.zeros(n, dtype=bool)
+        dates = np.empty(n, dtype=object)
+        match_arr = np.empty(n, dtype=object)
 
-            # For game_end, only include if user actually completed the run
-            if segment == 'game_end' and not match.user_completed:
-                continue
+        # Single sweep over the matches, visiting only the segments each one has
+        for j, match in enumerate(matches):
+            match_arr[j] = match
+            dates[j] = match.datetime_obj
+            user_completed[j] = match.user_completed
+            draw_forfeit[j] = match.is_draw or match.forfeited
 
-            # For incomplete matches (draw/forfeit), skip the last segment for splits
-            if show_splits and (match.is_draw or match.forfeited):
-                last_segment = self._get_last_segment(match)
-                if segment == last_segment:
+            last = -1
+            for seg, entry in match.segments.items():
+                i = seg_index.get(seg)
+                if i is None:
                     continue
+                has_seg[i, j] = True
+                split_ms[i, j] = entry.get('split_time', np.nan)
+                abs_ms[i, j] = entry.get('absolute_time', np.nan)
+                if i > last:
+                    last = i
+            last_seg_idx[j] = last
 
-            time_key = 'split_time' if show_splits else 'absolute_time'
-            time_val = match.segments[segment][time_key] / 1000 / 60
-            times.append(time_val)
-            dates.append(match.datetime_obj)
-            match_objs.append(match)
+        # Convert to minutes in place, once for the whole buffer rather than per segment slice
+        np.divide(times_buf, 60000.0, out=times_buf)
 
-        return {'times': times, 'dates': dates, 'matches': match_objs}
+        return {
+            'split_min': split_ms,
+            'abs_min': abs_ms,
+            'has_seg': has_seg,
+            'last_seg_idx': last_seg_idx,
+            'user_completed': user_completed,
+            'draw_forfeit': draw_forfeit,
+            'dates': dates,
+            # Matplotlib date numbers, converted once so plotting skips date2num
+            'dates_num': mdates.date2num(dates) if n else np.empty(0),
+            'matches': match_arr,
+        }
+
+    def _select_soa_columns(self, soa: Dict[str, np.ndarray], columns: np.ndarray) -> Dict[str, np.ndarray]:
+        """Restrict a segment struct-of-arrays to a subset of its matches (last axis)"""
+        return {key: arr[..., columns] for key, arr in soa.items()}
+
+    def _extract_segment_series(self, soa: Dict[str, np.ndarray], show_splits: bool,
+                                min_count: int = 0) -> Dict[str, Dict[str, List]]:
+        """
+        Extract segment timing data for every segment of one dataset.
+
+        Args:
+            soa: Arrays built by _build_segment_soa
+            show_splits: Whether to use split times or absolute times
+            min_count: Segments with fewer matching entries are skipped
+
+        Returns:
+            Dict mapping segment name to a dict with 'times', 'dates', 'dates_num'
+            and 'matches' lists
+        """
+        source = soa['split_min'] if show_splits else soa['abs_min']
+        dates = soa['dates']
+        dates_num = soa['dates_num']
+        matches = soa['matches']
+        game_end_idx = self.SEGMENT_NAMES.index('game_end')
+        if show_splits:
+            keep = _segment_keep_mask(soa['has_seg'], soa['user_completed'], soa['draw_forfeit'],
+                                      soa['last_seg_idx'], True, game_end_idx)
+        else:
+            # Draw/forfeit matches never drop a segment in absolute mode
+            keep = _absolute_keep_mask(soa['has_seg'], soa['user_completed'], game_end_idx)
 
-    def _get_last_segment(self, match) -> Optional[str]:
-        """Get the last segment present in a match's segment data."""
-        last_segment = None
-        for seg in self.SEGMENT_NAMES:
-            if seg in match.segments:
-                last_segment = seg
-        return last_segment
+        series = {}
+        for seg_idx, seg in enumerate(self.SEGMENT_NAMES):
+            mask = keep[seg_idx]
+
+            # Only materialize lists for segments that will actually be plotted
+            if np.count_nonzero(mask) < min_count:
+                continue
+
+            series[seg] = {
+                'times': source[seg_idx, mask].tolist(),
+                'dates': dates[mask].tolist(),
+                'dates_num': dates_num[mask].tolist(),
+                'matches': matches[mask].tolist(),
+            }
+
+        return series
 
     def _get_segment_display_names(self, show_splits: bool) -> Dict[str, str]:
         """Get segment display names based on mode."""
@@ -121,13 +305,8 @@ class SegmentAnalyzer:
         if not self.ui.analyzer:
             return
         
-        # Get all filtered matches with segment data (including incomplete runs)
-        filtered_matches = self.ui._get_all_filtered_matches()
-        detailed_matches = [m for m in filtered_matches if m.has_detailed_data]
-        
         # Show filter info
-        season_filter = self.ui.season_var.get()
-        seed_filter = self.ui.seed_filter_var.get()
+        _, season_filter, seed_filter = self.ui.filter_manager.get_filter_values()
         filter_text = ""
         if season_filter != 'All' or seed_filter != 'All':
             filters = []
@@ -137,17 +316,19 @@ class SegmentAnalyzer:
                 filters.append(f"Seed: {seed_filter}")
             filter_text = f"  Filters: {', '.join(filters)}\n"
         
-        # Calculate segment stats for filtered matches using analyzer methods
-        segment_stats = self.ui.analyzer.get_segment_stats(detailed_matches)
-        split_stats = self.ui.analyzer.get_split_stats(detailed_matches)
+        # Stats only depend on match data and filters, so reuse them when the
+        # tab is re-selected without changes
+        cache_key = self._get_data_cache_key()
+        if self._segtext_cache is not None and self._segtext_cache[0] == cache_key:
+            stats = self._segtext_cache[1]
+        else:
+            stats = self._compute_segments_text_stats()
+            self._segtext_cache = (cache_key, stats)
+        (filtered_matches, detailed_count, segment_stats, split_stats,
+         comparison_matches, comparison_segment_stats, comparison_split_stats) = stats
         
         # Check for comparison data
         if self.ui.comparison_active:
-            comparison_matches = self.ui._get_all_filtered_comparison_matches()
-            comparison_detailed = [m for m in comparison_matches if m.has_detailed_data]
-            comparison_segment_stats = self.ui.comparison_analyzer.get_segment_stats(comparison_detailed)
-            comparison_split_stats = self.ui.comparison_analyzer.get_split_stats(comparison_detailed)
-            
             # Use structured segment comparison renderer
             show_split_times = self.ui.segment_text_mode_var.get() if hasattr(self.ui, 'segment_text_mode_var') else False
             self.ui.rich_text_presenter.render_segment_analysis_comparison(
@@ -163,24 +344,74 @@ class SegmentAnalyzer:
             show_split_times = self.ui.segment_text_mode_var.get() if hasattr(self.ui, 'segment_text_mode_var') else False
             self.ui.rich_text_presenter.render_segment_analysis(
                 self.ui.stats_text, self.ui.analyzer, segment_stats, split_stats, 
-                len(detailed_matches), filter_text, show_split_times=show_split_times
+                detailed_count, filter_text, show_split_times=show_split_times
             )
     
-    def show_segment_progression(self):
-        """Show segment progression over time with individual charts"""
-        self.ui._current_view = 'segment_progression'
-        self.ui.notebook.select(1)  # Charts tab
-        self.ui._set_chart_controls_visible(show_splits_toggle=True, show_match_numbers_toggle=True)
-        self.ui._current_chart_view = '_show_segment_progression'
+    def _compute_segments_text_stats(self) -> tuple:
+        """
+        Calculate the segment and split stats shown in the segments text view.
+
+        Returns:
+            Tuple of (filtered_matches, detailed_count, segment_stats, split_stats,
+            comparison_matches, comparison_segment_stats, comparison_split_stats);
+            the comparison entries are None when comparison is inactive
+        """
+        # Get all filtered matches with segment data (including incomplete runs)
+        filtered_matches = self.ui._get_all_filtered_matches()
+        detailed_matches = [m for m in filtered_matches if m.has_detailed_data]
         
-        # Reset expansion state when showing grid view
-        self._segment_expanded = False
-        self._expanded_segment = None
-        self._segment_axes_map = {}
+        # Calculate segment stats for filtered matches using analyzer methods
+        segment_stats = self.ui.analyzer.get_segment_stats(detailed_matches)
+        split_stats = self.ui.analyzer.get_split_stats(detailed_matches)
         
-        if not self.ui.analyzer:
-            return
+        comparison_matches = None
+        comparison_segment_stats = None
+        comparison_split_stats = None
+        if self.ui.comparison_active:
+            comparison_matches = self.ui._get_all_filtered_comparison_matches()
+            comparison_detailed = [m for m in comparison_matches if m.has_detailed_data]
+            comparison_segment_stats = self.ui.comparison_analyzer.get_segment_stats(comparison_detailed)
+            comparison_split_stats = self.ui.comparison_analyzer.get_split_stats(comparison_detailed)
         
+        return (filtered_matches, len(detailed_matches), segment_stats, split_stats,
+                comparison_matches, comparison_segment_stats, comparison_split_stats)
+    
+    def _get_data_cache_key(self) -> tuple:
+        """Build a memo key covering the loaded match data and current filters"""
+        analyzer = self.ui.analyzer
+        comparison_analyzer = self.ui.comparison_analyzer if self.ui.comparison_active else None
+        # The analyzers themselves, not their id()s, which a later analyzer could
+        # reuse; they compare by identity
+        return (
+            analyzer, analyzer.matches_version, len(analyzer.matches),
+            self.ui.filter_manager.get_filter_key(),
+            comparison_analyzer,
+            comparison_analyzer.matches_version if comparison_analyzer else 0,
+            len(comparison_analyzer.matches) if comparison_analyzer else 0,
+        )
+
+    def _get_segprog_cache_key(self, show_splits: bool) -> tuple:
+        """Build the memo key for segment progression data"""
+        return self._get_data_cache_key() + (show_splits,)
+
+    def invalidate_cache(self):
+        """Drop memoised segment data (call when match or segment data changes)"""
+        self._segprog_cache.clear()
+        self._segtext_cache = None
+        self._stats_text_cache.clear()
+
+    def _compute_segment_progression_data(self, show_splits: bool) -> Optional[tuple]:
+        """
+        Extract per-segment progression data for the current filters.
+
+        Args:
+            show_splits: Whether to use split times or absolute times
+
+        Returns:
+            Tuple of (segment_data, full_segment_data, comparison_data,
+            comparison_full_data, available_segments), or None if there is
+            not enough data to show
+        """
         # Get all filtered matches with segment data (including incomplete runs)
         filtered_matches = self.ui._get_all_filtered_matches()
         detailed_matches = [m for m in filtered_matches if m.has_detailed_data]
@@ -190,306 +421,431 @@ class SegmentAnalyzer:
         
         if len(detailed_matches) < 5:
             messagebox.showinfo("Info", "Need at least 5 matches with segment data for progression analysis.\n\nClick 'Fetch Segment Data' to download timeline data.")
-            return
+            return None
         
         # Sort by date
         detailed_matches.sort(key=lambda x: x.date)
 
-        # Check if we should show split times or absolute times
-        show_splits = self.ui.show_splits_var.get() if self.ui.show_splits_var else False
-
-        # Cache segment display names for expanded view
-        segment_display = self._get_segment_display_names(show_splits)
-        self._segment_display = segment_display
-
         # Find which segments have enough data and cache data for each
         available_segments = []
-        self._cached_segment_data = {}
-        self._cached_full_segment_data = {}  # Cache full dataset for rolling calculations
+        segment_data = {}
+        full_segment_data = {}  # Full dataset for rolling calculations
 
         # Prepare comparison data if active
         comparison_data = {}
         comparison_full_data = {}
-        comparison_detailed = []
-        all_comparison_matches = []
 
+        # Build the per-dataset segment arrays once and extract every segment in one pass
+        main_series = self._extract_segment_series(
+            self._build_segment_soa(detailed_matches, self.SEGMENT_NAMES), show_splits, min_count=5)
+        full_series = main_series if all_detailed_matches is detailed_matches else \
+            self._extract_segment_series(
+                self._build_segment_soa(all_detailed_matches, self.SEGMENT_NAMES), show_splits)
         if self.ui.comparison_active:
-            comparison_matches = self.ui._get_all_filtered_comparison_matches()
-            comparison_detailed = sorted(
-                [m for m in comparison_matches if m.has_detailed_data],
-                key=lambda x: x.date
-            )
             all_comparison_matches = sorted(
-                [m for m in self.ui.comparison_analyzer.matches if m.has_detailed_data],
+                self.ui.comparison_analyzer.detailed_matches,
                 key=lambda x: x.date
             )
+            comp_full_soa = self._build_segment_soa(all_comparison_matches, self.SEGMENT_NAMES)
+
+            # The filtered comparison matches are a subset of the full set in the
+            # same date order, so select their columns (dates included) instead
+            # of building a second set of arrays
+            filtered_ids = {id(m) for m in self.ui._get_all_filtered_comparison_matches()}
+            filtered_cols = np.fromiter((id(m) in filtered_ids for m in all_comparison_matches),
+                                        dtype=bool, count=len(all_comparison_matches))
+            comp_soa = self._select_soa_columns(comp_full_soa, filtered_cols)
 
-        for seg in self.SEGMENT_NAMES:
-            # Collect main player data using helper method
-            main_data = self._collect_segment_data(detailed_matches, seg, show_splits)
-            full_data = self._collect_segment_data(all_detailed_matches, seg, show_splits)
-
-            if len(main_data['times']) >= 5:
-                available_segments.append(seg)
-                self._cached_segment_data[seg] = main_data
-                self._cached_full_segment_data[seg] = {
-                    'times': full_data['times'],
-                    'dates': full_data['dates']
-                }
-
-                # Collect comparison data if active
-                if self.ui.comparison_active:
-                    comp_data = self._collect_segment_data(comparison_detailed, seg, show_splits)
-                    comp_full = self._collect_segment_data(all_comparison_matches, seg, show_splits)
-
-                    if len(comp_data['times']) >= 3:  # Lower threshold for comparison
-                        comparison_data[seg] = comp_data
-                    if len(comp_full['times']) >= 3:
-                        comparison_full_data[seg] = {
-                            'times': comp_full['times'],
-                            'dates': comp_full['dates']
-                        }
+            # Lower threshold for comparison
+            comp_series = self._extract_segment_series(comp_soa, show_splits, min_count=3)
+            comp_full_series = self._extract_segment_series(comp_full_soa, show_splits, min_count=3)
+
+        for seg, main_data in main_series.items():
+            full_data = full_series[seg]
+            available_segments.append(seg)
+            segment_data[seg] = main_data
+            full_segment_data[seg] = {
+                'times': full_data['times'],
+                'dates': full_data['dates'],
+                'dates_num': full_data['dates_num']
+            }
+
+            # Collect comparison data if active
+            if self.ui.comparison_active:
+                if seg in comp_series:
+                    comparison_data[seg] = comp_series[seg]
+                if seg in comp_full_series:
+                    comp_full = comp_full_series[seg]
+                    comparison_full_data[seg] = {
+                        'times': comp_full['times'],
+                        'dates': comp_full['dates'],
+                        'dates_num': comp_full['dates_num']
+                    }
         
         if not available_segments:
             messagebox.showinfo("Info", "Not enough segment data available")
+            return None
+
+        return segment_data, full_segment_data, comparison_data, comparison_full_data, available_segments
+
+    def show_segment_progression(self, in_place: bool = False):
+        """
+        Show segment progression over time with individual charts
+
+        Args:
+            in_place: Update the currently displayed grid's artists instead of
+                rebuilding the figure, when the grid layout is unchanged
+        """
+        self.ui._current_view = 'segment_progression'
+        self.ui.notebook.select(1)  # Charts tab
+        self.ui._set_chart_controls_visible(show_splits_toggle=True, show_match_numbers_toggle=True)
+        self.ui._current_chart_view = '_show_segment_progression'
+        
+        # Reset expansion state when showing grid view
+        self._segment_expanded = False
+        self._expanded_segment = None
+        
+        if not self.ui.analyzer:
             return
         
+        # Check if we should show split times or absolute times
+        show_splits = self.ui.show_splits_var.get() if self.ui.show_splits_var else False
+
+        # Cache segment display names for expanded view
+        segment_display = self._get_segment_display_names(show_splits)
+        self._segment_display = segment_display
+
+        # Reuse extracted data when filters and mode are unchanged
+        cache_key = self._get_segprog_cache_key(show_splits)
+        cached = self._segprog_cache.get(cache_key)
+        if cached is not None:
+            self._segprog_cache.move_to_end(cache_key)
+        else:
+            cached = self._compute_segment_progression_data(show_splits)
+            if cached is None:
+                return
+            self._segprog_cache[cache_key] = cached
+            if len(self._segprog_cache) > self.SEGPROG_CACHE_SIZE:
+                self._segprog_cache.popitem(last=False)
+
+        (self._cached_segment_data, self._cached_full_segment_data,
+         comparison_data, comparison_full_data, available_segments) = cached
+
         # Store available segments and comparison data for later use
         self._available_segments = available_segments
         self._cached_comparison_data = comparison_data
         self._cached_comparison_full_data = comparison_full_data
         
-        # Create grid of subplots based on available segments
-        n_segments = len(available_segments)
-        if n_segments <= 3:
-            rows, cols = 1, n_segments
-        elif n_segments <= 6:
-            rows, cols = 2, 3
-        else:
-            rows, cols = 3, 3
+        # Check if match numbers mode is enabled
+        use_match_numbers = self.ui.show_match_numbers_var.get()
         
-        # Use ChartBuilder
         cb = self.ui.chart_builder
-        cb.clear()
-        cb.set_palette(self.ui.chart_options['color_palette'])
+        grid_state = (tuple(available_segments), tuple(comparison_data), use_match_numbers)
         
-        for idx, segment in enumerate(available_segments):
-            ax = cb.get_subplot(rows, cols, idx + 1)
-            
-            # Map this axes to the segment for click handling
-            self._segment_axes_map[ax] = segment
-            
-            # Get cached data for this segment
-            times = self._cached_segment_data[segment]['times']
-            dates = self._cached_segment_data[segment]['dates']
-            matches = self._cached_segment_data[segment]['matches']
-            
-            # Check if match numbers mode is enabled
-            use_match_numbers = self.ui.show_match_numbers_var.get()
-            
-            if use_match_numbers:
-                x_data = list(range(1, len(times) + 1))  # Match numbers 1, 2, 3, ...
-                x_label = "Match Number"
+        # On a splits toggle only the y-values change, so update the existing
+        # artists instead of rebuilding the whole figure
+        in_place = (in_place and grid_state == self._segment_grid_state
+                    and list(cb.fig.axes) == list(self._segment_artists))
+        
+        if in_place:
+            for idx, (ax, artists) in enumerate(self._segment_artists.items()):
+                self._render_segment_cell(ax, idx, artists['segment'], show_splits,
+                                          use_match_numbers, artists)
+        else:
+            # Create grid of subplots based on available segments
+            n_segments = len(available_segments)
+            if n_segments <= 3:
+                rows, cols = 1, n_segments
+            elif n_segments <= 6:
+                rows, cols = 2, 3
             else:
-                x_data = dates  # Date/time
-                x_label = "Date"
+                rows, cols = 3, 3
             
-            # Get full data for rolling calculations
-            full_times = self._cached_full_segment_data[segment]['times']
-            full_dates = self._cached_full_segment_data[segment]['dates']
+            # Use ChartBuilder
+            cb.clear()
+            cb.set_palette(self.ui.chart_options['color_palette'])
             
-            if use_match_numbers:
-                full_x_data = list(range(1, len(full_times) + 1))
-            else:
-                full_x_data = full_dates
+            self._segment_artists = {}
+            for idx, segment in enumerate(available_segments):
+                ax = cb.get_subplot(rows, cols, idx + 1)
+                
+                # Tag this axes with its segment for click handling
+                ax._mcsr_segment = segment
+                self._segment_artists[ax] = self._render_segment_cell(
+                    ax, idx, segment, show_splits, use_match_numbers)
+            self._segment_grid_state = grid_state
+        
+        # Build title with filter info
+        mode_str = 'Split Times' if show_splits else 'Absolute Times'
+        title = f'{self.ui.analyzer.username} - Segment Progression ({mode_str})'
+        if self.ui.comparison_active:
+            title += f' vs {self.ui.comparison_analyzer.username}'
+        title += self._get_filter_suffix()
+        title += "\n(Click any chart to expand)"
+        
+        cb.set_title(title, fontsize=12)
+        
+        if in_place:
+            # Event handlers are still connected from the initial render
+            cb.canvas.draw_idle()
+            return
+        
+        # Enable click detection for match details
+        cb.enable_match_click_detection(self._on_match_click)
+        
+        # Enable hover tooltips for rolling averages
+        cb.enable_hover_tooltips(self.ui._minutes_to_str)
+        
+        cb.finalize()
+    
+    def _render_segment_cell(self, ax, idx: int, segment: str, show_splits: bool,
+                             use_match_numbers: bool, artists: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Draw one segment subplot of the progression grid, or update it in place.
+
+        Args:
+            ax: Axes for this segment
+            idx: Position of the segment in the grid (drives colors)
+            segment: Segment name
+            show_splits: Whether to use split times or absolute times
+            use_match_numbers: Whether the x-axis shows match numbers instead of dates
+            artists: Handles from a previous render of this axes; when given the
+                scatter points and text are updated instead of recreated
+
+        Returns:
+            Dict of artist handles for later in-place updates
+        """
+        import matplotlib.pyplot as plt
+
+        cb = self.ui.chart_builder
+        comparison_data = self._cached_comparison_data
+        comparison_full_data = self._cached_comparison_full_data
+        segment_display = self._segment_display
+        
+        # Hoist chart options out of the per-series code below
+        opts = self.ui.chart_options
+        show_std = opts['show_rolling_std']
+        show_avg = opts['show_rolling_avg']
+        show_median = opts['show_rolling_median']
+        show_pb = opts['show_pb_line']
+        show_grid = opts['show_grid']
+        window = opts['rolling_window']
+        point_size = opts['point_size']
+        palette_len = len(cb.palette)
+        
+        # Get cached data for this segment
+        times = self._cached_segment_data[segment]['times']
+        dates = self._cached_segment_data[segment]['dates']
+        matches = self._cached_segment_data[segment]['matches']
+        
+        if use_match_numbers:
+            x_data = list(range(1, len(times) + 1))  # Match numbers 1, 2, 3, ...
+            x_label = "Match Number"
+        else:
+            # Pre-converted date numbers; ticks are labelled explicitly below
+            x_data = self._cached_segment_data[segment]['dates_num']
+            x_label = "Date"
+        
+        # Get full data for rolling calculations
+        full_times = self._cached_full_segment_data[segment]['times']
+        
+        if use_match_numbers:
+            full_x_data = list(range(1, len(full_times) + 1))
+        else:
+            full_x_data = self._cached_full_segment_data[segment]['dates_num']
+        
+        # Use 4 distinct colors per chart: main scatter, main line, comp scatter, comp line
+        # Spread colors across palette to avoid similar adjacent colors
+        base_color_offset = (idx * 4) % palette_len
+        main_scatter_color_idx = base_color_offset
+        main_line_color_idx = (base_color_offset + 1) % palette_len
+        comp_scatter_color_idx = (base_color_offset + 2) % palette_len
+        comp_line_color_idx = (base_color_offset + 3) % palette_len
+        
+        updating = artists is not None
+        if updating:
+            # Drop derived lines/bands and point data; they are rebuilt below
+            for artist in artists['overlays']:
+                artist.remove()
+            cb.clear_axes_data(ax)
             
-            # Use 4 distinct colors per chart: main scatter, main line, comp scatter, comp line
-            # Spread colors across palette to avoid similar adjacent colors
-            base_color_offset = (idx * 4) % len(cb.palette)
-            main_scatter_color_idx = base_color_offset
-            main_line_color_idx = (base_color_offset + 1) % len(cb.palette)
-            comp_scatter_color_idx = (base_color_offset + 2) % len(cb.palette)
-            comp_line_color_idx = (base_color_offset + 3) % len(cb.palette)
+            # Main player scatter plot (circles)
+            cb.update_scatter(ax, artists['main_scatter'], x_data, times, match_data=matches)
+        else:
+            artists = {'segment': segment, 'comp_scatter': None}
             
             # Main player scatter plot (circles)
             cb.plot_scatter(ax, x_data, times, 
-                           size=self.ui.chart_options['point_size'] * 0.8,
+                           size=point_size * 0.8,
                            alpha=0.6, color_index=main_scatter_color_idx, marker='o',
                            match_data=matches)
+            artists['main_scatter'] = ax.collections[-1]
+        
+        # Add comparison data if available
+        if segment in comparison_data:
+            comp_times = comparison_data[segment]['times']
+            comp_matches = comparison_data[segment]['matches']
             
-            # Add comparison data if available
-            if segment in comparison_data:
-                comp_times = comparison_data[segment]['times']
-                comp_dates = comparison_data[segment]['dates']
-                comp_matches = comparison_data[segment]['matches']
-                
-                # Prepare comparison x-axis data
-                if use_match_numbers:
-                    comp_x_data = list(range(1, len(comp_times) + 1))
-                else:
-                    comp_x_data = comp_dates
+            # Prepare comparison x-axis data
+            if use_match_numbers:
+                comp_x_data = list(range(1, len(comp_times) + 1))
+            else:
+                comp_x_data = comparison_data[segment]['dates_num']
+            if artists['comp_scatter'] is not None:
+                cb.update_scatter(ax, artists['comp_scatter'], comp_x_data, comp_times,
+                                  match_data=comp_matches)
+            else:
                 # Plot comparison data with circles but different color and smaller size
                 cb.plot_scatter(ax, comp_x_data, comp_times,
-                               size=self.ui.chart_options['point_size'] * 0.6,
+                               size=point_size * 0.6,
                                alpha=0.5, color_index=comp_scatter_color_idx, marker='o',
                                match_data=comp_matches)
+                artists['comp_scatter'] = ax.collections[-1]
+        
+        # Everything added from here until the labels is rebuilt on in-place updates
+        existing = set(ax.lines) | set(ax.collections)
+        
+        # Rolling std dev bands (if enabled) - draw first so avg line is on top
+        if show_std and len(times) >= 1:
+            cb.add_rolling_std_dev(ax, x_data, times,
+                                   window=window, label=None, color_index=main_line_color_idx,
+                                   full_x_data=full_x_data, full_y_data=full_times)
+        
+        # Rolling average (if enabled)
+        if show_avg and len(times) >= 1:
+            cb.add_rolling_average(ax, x_data, times, 
+                                  window=window, label=None, color_index=main_line_color_idx,
+                                  full_x_data=full_x_data, full_y_data=full_times,
+                                  is_comparison=False)
+        
+        # Rolling median (if enabled)
+        if show_median and len(times) >= 1:
+            cb.add_rolling_median(ax, x_data, times, 
+                                 window=window, label=None, color_index=main_line_color_idx + 1,
+                                 full_x_data=full_x_data, full_y_data=full_times,
+                                 is_comparison=False)
+        
+        # PB line (if enabled)
+        if show_pb:
+            cb.add_pb_line(ax, x_data, times, label=None, color_index=main_line_color_idx)
+        
+        # Add comparison player statistics if available
+        if segment in comparison_data:
+            comp_times = comparison_data[segment]['times']
             
-            # Rolling std dev bands (if enabled) - draw first so avg line is on top
-            if self.ui.chart_options['show_rolling_std'] and len(times) >= 1:
-                window = self.ui.chart_options['rolling_window']
-                cb.add_rolling_std_dev(ax, x_data, times,
-                                       window=window, label=None, color_index=main_line_color_idx,
-                                       full_x_data=full_x_data, full_y_data=full_times)
-            
-            # Rolling average (if enabled)
-            if self.ui.chart_options['show_rolling_avg'] and len(times) >= 1:
-                window = self.ui.chart_options['rolling_window']
-                cb.add_rolling_average(ax, x_data, times, 
-                                      window=window, label=None, color_index=main_line_color_idx,
-                                      full_x_data=full_x_data, full_y_data=full_times,
-                                      is_comparison=False)
-            
-            # Rolling median (if enabled)
-            if self.ui.chart_options['show_rolling_median'] and len(times) >= 1:
-                window = self.ui.chart_options['rolling_window']
-                cb.add_rolling_median(ax, x_data, times, 
-                                     window=window, label=None, color_index=main_line_color_idx + 1,
-                                     full_x_data=full_x_data, full_y_data=full_times,
-                                     is_comparison=False)
-            
-            # PB line (if enabled)
-            if self.ui.chart_options['show_pb_line']:
-                cb.add_pb_line(ax, x_data, times, label=None, color_index=main_line_color_idx)
-            
-            # Add comparison player statistics if available
-            if segment in comparison_data:
-                comp_times = comparison_data[segment]['times']
-                comp_dates = comparison_data[segment]['dates']
-                
-                # Get full comparison data for rolling calculations
-                comp_full_times = comparison_full_data.get(segment, {}).get('times', [])
-                comp_full_dates = comparison_full_data.get(segment, {}).get('dates', [])
-                
-                # Prepare comparison full x-axis data
-                if use_match_numbers:
-                    comp_full_x_data = list(range(1, len(comp_full_times) + 1))
-                else:
-                    comp_full_x_data = comp_full_dates
-                
-                # Comparison rolling std dev (if enabled)
-                if self.ui.chart_options['show_rolling_std'] and len(comp_times) >= 1:
-                    comp_window = self.ui.chart_options['rolling_window']
-                    cb.add_rolling_std_dev(ax, comp_x_data, comp_times,
-                                           window=comp_window, label=None, alpha=0.2, 
-                                           color_index=comp_line_color_idx,
-                                           full_x_data=comp_full_x_data, full_y_data=comp_full_times)
-                
-                # Comparison rolling average (if enabled)
-                if self.ui.chart_options['show_rolling_avg'] and len(comp_times) >= 1:
-                    comp_window = self.ui.chart_options['rolling_window']
-                    cb.add_rolling_average(ax, comp_x_data, comp_times, 
-                                          window=comp_window, label=None, color_index=comp_line_color_idx,
-                                          full_x_data=comp_full_x_data, full_y_data=comp_full_times,
-                                          is_comparison=True)
-                
-                # Comparison rolling median (if enabled)
-                if self.ui.chart_options['show_rolling_median'] and len(comp_times) >= 1:
-                    comp_window = self.ui.chart_options['rolling_window']
-                    cb.add_rolling_median(ax, comp_x_data, comp_times, 
-                                         window=comp_window, label=None, color_index=comp_line_color_idx + 1,
-                                         full_x_data=comp_full_x_data, full_y_data=comp_full_times,
-                                         is_comparison=True)
-                
-                # Comparison PB line (if enabled)
-                if self.ui.chart_options['show_pb_line']:
-                    cb.add_pb_line(ax, comp_x_data, comp_times, label=None, color_index=comp_line_color_idx)
+            # Get full comparison data for rolling calculations
+            comp_full_times = comparison_full_data.get(segment, {}).get('times', [])
             
-            y_label = 'Split (min)' if show_splits else 'Time (min)'
-            cb.set_labels(ax, title=segment_display[segment], 
-                         xlabel=x_label, ylabel=y_label,
-                         title_fontsize=10, label_fontsize=8)
-            cb.set_grid(ax, self.ui.chart_options['show_grid'])
+            # Prepare comparison full x-axis data
+            if use_match_numbers:
+                comp_full_x_data = list(range(1, len(comp_full_times) + 1))
+            else:
+                comp_full_x_data = comparison_full_data.get(segment, {}).get('dates_num', [])
             
-            # Format x-axis for better readability in small charts
-            if not use_match_numbers and len(dates) > 0:
-                # Limit to max 4 ticks on small charts
-                max_ticks = 4
-                if len(dates) > max_ticks:
-                    # Select evenly spaced dates
-                    step = max(1, len(dates) // max_ticks)
-                    tick_indices = list(range(0, len(dates), step))
-                    if len(dates) - 1 not in tick_indices:
-                        tick_indices.append(len(dates) - 1)
-                    
-                    tick_dates = [dates[i] for i in tick_indices]
-                    tick_labels = [d.strftime('%m/%d') for d in tick_dates]
-                    cb.set_xticks(ax, tick_dates, tick_labels, rotation=45, ha='right')
-                else:
-                    # For few data points, use all dates
-                    tick_labels = [d.strftime('%m/%d') for d in dates]
-                    cb.set_xticks(ax, dates, tick_labels, rotation=45, ha='right')
-            elif use_match_numbers:
-                # For match numbers, let matplotlib handle the ticks automatically
-                # but make sure they're integers
-                ax.xaxis.set_major_locator(plt.MaxNLocator(integer=True))
+            # Comparison rolling std dev (if enabled)
+            if show_std and len(comp_times) >= 1:
+                cb.add_rolling_std_dev(ax, comp_x_data, comp_times,
+                                       window=window, label=None, alpha=0.2, 
+                                       color_index=comp_line_color_idx,
+                                       full_x_data=comp_full_x_data, full_y_data=comp_full_times)
             
-            # Add stats annotation
-            avg_time = statistics.mean(times)
-            best_time = min(times)
-            label = 'Best' if show_splits else 'PB'
-            stats_text = f'Avg: {self.ui._minutes_to_str(avg_time)}\n{label}: {self.ui._minutes_to_str(best_time)}'
+            # Comparison rolling average (if enabled)
+            if show_avg and len(comp_times) >= 1:
+                cb.add_rolling_average(ax, comp_x_data, comp_times, 
+                                      window=window, label=None, color_index=comp_line_color_idx,
+                                      full_x_data=comp_full_x_data, full_y_data=comp_full_times,
+                                      is_comparison=True)
             
-            # Add comparison stats if available
-            if segment in comparison_data:
-                comp_times = comparison_data[segment]['times']
-                comp_avg = statistics.mean(comp_times)
-                comp_best = min(comp_times)
-                stats_text += f'\n\nComp Avg: {self.ui._minutes_to_str(comp_avg)}\nComp {label}: {self.ui._minutes_to_str(comp_best)}'
+            # Comparison rolling median (if enabled)
+            if show_median and len(comp_times) >= 1:
+                cb.add_rolling_median(ax, comp_x_data, comp_times, 
+                                     window=window, label=None, color_index=comp_line_color_idx + 1,
+                                     full_x_data=comp_full_x_data, full_y_data=comp_full_times,
+                                     is_comparison=True)
             
+            # Comparison PB line (if enabled)
+            if show_pb:
+                cb.add_pb_line(ax, comp_x_data, comp_times, label=None, color_index=comp_line_color_idx)
+        
+        artists['overlays'] = [artist for artist in (*ax.lines, *ax.collections) if artist not in existing]
+        
+        if updating:
+            # relim() ignores collections, so add the scatter points explicitly
+            ax.relim()
+            for scatter in (artists['main_scatter'], artists['comp_scatter']):
+                if scatter is not None:
+                    ax.update_datalim(scatter.get_offsets())
+            ax.autoscale_view()
+        
+        y_label = 'Split (min)' if show_splits else 'Time (min)'
+        cb.set_labels(ax, title=segment_display[segment], 
+                     xlabel=x_label, ylabel=y_label,
+                     title_fontsize=10, label_fontsize=8)
+        cb.set_grid(ax, show_grid)
+        
+        # Format x-axis for better readability in small charts
+        if not use_match_numbers and len(dates) > 0:
+            # Limit to max 4 ticks on small charts
+            max_ticks = 4
+            if len(dates) > max_ticks:
+                # Select evenly spaced dates
+                step = max(1, len(dates) // max_ticks)
+                tick_indices = np.arange(0, len(dates), step)
+                if tick_indices[-1] != len(dates) - 1:
+                    tick_indices = np.append(tick_indices, len(dates) - 1)
+                
+                tick_labels = [dates[i].strftime('%m/%d') for i in tick_indices.tolist()]
+                cb.set_xticks(ax, np.asarray(x_data)[tick_indices], tick_labels, rotation=45, ha='right')
+            else:
+                # For few data points, use all dates
+                tick_labels = [d.strftime('%m/%d') for d in dates]
+                cb.set_xticks(ax, x_data, tick_labels, rotation=45, ha='right')
+        elif use_match_numbers:
+            # For match numbers, let matplotlib handle the ticks automatically
+            # but make sure they're integers
+            ax.xaxis.set_major_locator(plt.MaxNLocator(integer=True))
+        
+        # Add stats annotation
+        times_arr = np.asarray(times)
+        avg_time = float(times_arr.mean())
+        best_time = float(times_arr.min())
+        label = 'Best' if show_splits else 'PB'
+        stats_text = f'Avg: {self.ui._minutes_to_str(avg_time)}\n{label}: {self.ui._minutes_to_str(best_time)}'
+        
+        # Add comparison stats if available
+        if segment in comparison_data:
+            comp_times = comparison_data[segment]['times']
+            comp_arr = np.asarray(comp_times)
+            comp_avg = float(comp_arr.mean())
+            comp_best = float(comp_arr.min())
+            stats_text += f'\n\nComp Avg: {self.ui._minutes_to_str(comp_avg)}\nComp {label}: {self.ui._minutes_to_str(comp_best)}'
+        
+        if updating:
+            artists['stats'].set_text(stats_text)
+        else:
             cb.add_annotation(ax, stats_text, x=0.02, y=0.98, fontsize=6)
+            artists['stats'] = ax.texts[-1]
             
             # Add hint to click for expansion
             ax.text(0.98, 0.02, 'Click to expand', transform=ax.transAxes,
                    fontsize=7, color='gray', alpha=0.7, ha='right', va='bottom')
         
-        # Build title with filter info
-        mode_str = 'Split Times' if show_splits else 'Absolute Times'
-        title = f'{self.ui.analyzer.username} - Segment Progression ({mode_str})'
-        if self.ui.comparison_active:
-            title += f' vs {self.ui.comparison_analyzer.username}'
-        filters = []
-        if self.ui.season_var.get() != 'All':
-            filters.append(f"Season {self.ui.season_var.get()}")
-        if self.ui.seed_filter_var.get() != 'All':
-            filters.append(self.ui.seed_filter_var.get())
-        if filters:
-            title += f" [{', '.join(filters)}]"
-        title += "\n(Click any chart to expand)"
-        
-        cb.set_title(title, fontsize=12)
-        
-        # Enable click detection for match details
-        cb.enable_match_click_detection(self._on_match_click)
-        
-        # Enable hover tooltips for rolling averages
-        cb.enable_hover_tooltips(self.ui._minutes_to_str)
-        
-        cb.finalize()
+        return artists
     
     def on_splits_toggle(self):
         """Handle split times checkbox toggle - refresh segment trends if visible"""
         # Only refresh if we're currently viewing segment trends (Charts tab selected)
-        if self.ui.analyzer and self.ui.notebook.index(self.ui.notebook.select()) == 1:
+        if self.ui.analyzer and self.ui._current_tab == 1:
             # Check if we have segment data loaded
-            detailed_count = sum(1 for m in self.ui.analyzer.matches if m.has_detailed_data)
-            if detailed_count >= 5:
+            if len(self.ui.analyzer.detailed_matches) >= 5:
                 # Need to recalculate data since split/absolute changed
                 # First get the current expansion state
                 was_expanded = self._segment_expanded
                 expanded_segment = self._expanded_segment
                 
-                # Refresh grid view (this will recalculate cached data)
-                self.show_segment_progression()
+                # Refresh grid view (this will recalculate cached data); the grid
+                # can be updated in place unless the expanded view replaced it
+                self.show_segment_progression(in_place=not was_expanded)
                 
                 # If we were expanded, re-expand to the same segment
                 if was_expanded and expanded_segment and expanded_segment in self._cached_segment_data:
@@ -497,6 +853,8 @@ class SegmentAnalyzer:
     
     def _on_match_click(self, match):
         """Handle click on a match scatter point to show detailed info"""
+        from ...visualization.match_info_dialog import show_match_info_dialog
+
         # Get filtered matches for percentile calculations
         filtered_matches = self.ui._get_filtered_matches() if hasattr(self.ui, '_get_filtered_matches') else None
         show_match_info_dialog(self.ui.root, match, self.ui.rich_text_presenter, filtered_matches)
@@ -504,7 +862,7 @@ class SegmentAnalyzer:
     def on_chart_click(self, event):
         """Handle click events on the chart canvas"""
         # Only handle clicks when viewing segment progression grid
-        if not hasattr(self.ui, '_current_chart_view') or self.ui._current_chart_view != '_show_segment_progression':
+        if self.ui._current_chart_view != '_show_segment_progression':
             return
         
         # Don't handle clicks if already expanded
@@ -515,13 +873,15 @@ class SegmentAnalyzer:
         if event.inaxes is None:
             return
         
-        # Find which segment was clicked
-        clicked_segment = self._segment_axes_map.get(event.inaxes)
+        # Find which segment was clicked (grid axes are tagged when drawn)
+        clicked_segment = getattr(event.inaxes, '_mcsr_segment', None)
         if clicked_segment:
             self.show_expanded_segment(clicked_segment)
     
     def show_expanded_segment(self, segment: str):
         """Show a single segment expanded to full page"""
+        import matplotlib.pyplot as plt
+
         if segment not in self._cached_segment_data:
             return
         
@@ -529,7 +889,8 @@ class SegmentAnalyzer:
         self._expanded_segment = segment
         
         # Show back button
-        self.ui._set_chart_controls_visible(show_splits_toggle=True, show_back_button=True, show_match_numbers_toggle=True)
+        ui = self.ui
+        ui._set_chart_controls_visible(show_splits_toggle=True, show_back_button=True, show_match_numbers_toggle=True)
         
         # Get cached data
         times = self._cached_segment_data[segment]['times']
@@ -538,36 +899,56 @@ class SegmentAnalyzer:
         
         # Get full data for rolling calculations
         full_times = self._cached_full_segment_data[segment]['times']
-        full_dates = self._cached_full_segment_data[segment]['dates']
         
-        show_splits = self.ui.show_splits_var.get() if self.ui.show_splits_var else False
+        show_splits = ui.show_splits_var.get() if ui.show_splits_var else False
         segment_name = self._segment_display.get(segment, segment)
         
+        # Hoist repeated UI lookups out of the plotting code below
+        opts = ui.chart_options
+        window = opts['rolling_window']
+        point_size = opts['point_size']
+        username = ui.analyzer.username
+        comp_username = None
+        
         # Use ChartBuilder for full-page view
-        cb = self.ui.chart_builder
-        cb.clear()
-        cb.set_palette(self.ui.chart_options['color_palette'])
+        cb = ui.chart_builder
         
-        ax = cb.get_subplot(1, 1, 1)
+        # Check if match numbers mode is enabled
+        use_match_numbers = ui.show_match_numbers_var.get()
         
-        # Clear the axes map for expanded view (no clicking in expanded view)
-        self._segment_axes_map = {}
+        # If nothing but the stats box can differ from the drawn chart, repaint
+        # just that box over the cached background instead of rebuilding the plot
+        stats_key = self._get_segprog_cache_key(show_splits) + (segment,)
+        plot_state = (stats_key, use_match_numbers,
+                      tuple(sorted((k, v) for k, v in opts.items() if k != 'show_stats')))
+        stats_artist = self._expanded_stats_artist
+        if (plot_state == self._expanded_plot_state and stats_artist is not None
+                and stats_artist.axes in cb.fig.axes):
+            comp_data = self._cached_comparison_data.get(segment)
+            self._set_expanded_stats(stats_artist, opts.get('show_stats', True), stats_key,
+                                     times, comp_data['times'] if comp_data else None)
+            cb.blit_update()
+            return
         
-        # Check if match numbers mode is enabled
-        use_match_numbers = self.ui.show_match_numbers_var.get()
+        cb.clear()
+        cb.set_palette(opts['color_palette'])
+        
+        # Untagged axes, so clicks don't expand anything in expanded view
+        ax = cb.get_subplot(1, 1, 1)
         
         if use_match_numbers:
             x_data = list(range(1, len(times) + 1))  # Match numbers 1, 2, 3, ...
             x_label = "Match Number"
         else:
-            x_data = dates  # Date/time
+            # Pre-converted date numbers, so matplotlib skips per-point datetime conversion
+            x_data = self._cached_segment_data[segment]['dates_num']
             x_label = "Date"
         
         # Prepare full x-axis data for rolling calculations
         if use_match_numbers:
             full_x_data = list(range(1, len(full_times) + 1))
         else:
-            full_x_data = full_dates
+            full_x_data = self._cached_full_segment_data[segment]['dates_num']
         
         # Get color index from available segments and use 4-color scheme
         segment_idx = self._available_segments.index(segment) if segment in self._available_segments else 0
@@ -579,40 +960,40 @@ class SegmentAnalyzer:
         
         # Main player scatter plot with larger points (circles)
         cb.plot_scatter(ax, x_data, times, 
-                       size=self.ui.chart_options['point_size'],
+                       size=point_size,
                        alpha=0.6, color_index=main_scatter_color_idx, marker='o',
-                       label=self.ui.analyzer.username, match_data=matches)
+                       label=username, match_data=matches)
         
         # Add comparison data if available
         comp_times = None
         comp_dates = None
         comp_matches = None
         comp_full_times = None
-        comp_full_dates = None
+        comp_full_dates_num = None
         if hasattr(self, '_cached_comparison_data') and segment in self._cached_comparison_data:
             comp_times = self._cached_comparison_data[segment]['times']
             comp_dates = self._cached_comparison_data[segment]['dates']
             comp_matches = self._cached_comparison_data[segment]['matches']
+            comp_username = ui.comparison_analyzer.username
             
             # Get full comparison data for rolling calculations
             if hasattr(self, '_cached_comparison_full_data') and segment in self._cached_comparison_full_data:
                 comp_full_times = self._cached_comparison_full_data[segment]['times']
-                comp_full_dates = self._cached_comparison_full_data[segment]['dates']
+                comp_full_dates_num = self._cached_comparison_full_data[segment]['dates_num']
             
             # Prepare comparison x-axis data
             if use_match_numbers:
                 comp_x_data = list(range(1, len(comp_times) + 1))
             else:
-                comp_x_data = comp_dates
+                comp_x_data = self._cached_comparison_data[segment]['dates_num']
             
             cb.plot_scatter(ax, comp_x_data, comp_times,
-                           size=self.ui.chart_options['point_size'] * 0.8,
+                           size=point_size * 0.8,
                            alpha=0.5, color_index=comp_scatter_color_idx, marker='o',
-                           label=self.ui.comparison_analyzer.username, match_data=comp_matches)
+                           label=comp_username, match_data=comp_matches)
         
         # Rolling std dev bands (if enabled) - draw first so avg line is on top
-        if self.ui.chart_options['show_rolling_std'] and len(times) >= 1:
-            window = self.ui.chart_options['rolling_window']
+        if opts['show_rolling_std'] and len(times) >= 1:
             cb.add_rolling_std_dev(ax, x_data, times,
                                    window=window, label=f'±1σ ({window}-pt)', 
                                    color_index=main_line_color_idx,
@@ -620,21 +1001,19 @@ class SegmentAnalyzer:
             
             # Add comparison player rolling std dev if available
             if comp_times and comp_dates and len(comp_times) >= 1:
-                comp_window = self.ui.chart_options['rolling_window']
                 # Prepare comparison full x-axis data for rolling calculations
                 if use_match_numbers:
                     comp_full_x_data = list(range(1, len(comp_full_times) + 1))
                 else:
-                    comp_full_x_data = comp_full_dates
+                    comp_full_x_data = comp_full_dates_num
                     
                 cb.add_rolling_std_dev(ax, comp_x_data, comp_times,
-                                       window=comp_window, label=f'Comp ±1σ ({comp_window}-pt)',
+                                       window=window, label=f'Comp ±1σ ({window}-pt)',
                                        alpha=0.3, color_index=comp_line_color_idx,
                                        full_x_data=comp_full_x_data, full_y_data=comp_full_times)
         
         # Rolling average (if enabled)
-        if self.ui.chart_options['show_rolling_avg'] and len(times) >= 1:
-            window = self.ui.chart_options['rolling_window']
+        if opts['show_rolling_avg'] and len(times) >= 1:
             cb.add_rolling_average(ax, x_data, times, 
                                   window=window, color_index=main_line_color_idx,
                                   label=f'{window}-match average',
@@ -643,22 +1022,20 @@ class SegmentAnalyzer:
             
             # Add comparison player rolling average if available
             if comp_times and comp_dates and len(comp_times) >= 1:
-                comp_window = self.ui.chart_options['rolling_window']
                 # Prepare comparison full x-axis data for rolling calculations
                 if use_match_numbers:
                     comp_full_x_data = list(range(1, len(comp_full_times) + 1))
                 else:
-                    comp_full_x_data = comp_full_dates
+                    comp_full_x_data = comp_full_dates_num
                     
                 cb.add_rolling_average(ax, comp_x_data, comp_times, 
-                                      window=comp_window, color_index=comp_line_color_idx,
-                                      label=f'Comp {comp_window}-match avg',
+                                      window=window, color_index=comp_line_color_idx,
+                                      label=f'Comp {window}-match avg',
                                       full_x_data=comp_full_x_data, full_y_data=comp_full_times,
                                       is_comparison=True)
         
         # Rolling median (if enabled)
-        if self.ui.chart_options['show_rolling_median'] and len(times) >= 1:
-            window = self.ui.chart_options['rolling_window']
+        if opts['show_rolling_median'] and len(times) >= 1:
             cb.add_rolling_median(ax, x_data, times, 
                                  window=window, color_index=main_line_color_idx + 1,
                                  label=f'{window}-match median',
@@ -667,53 +1044,47 @@ class SegmentAnalyzer:
             
             # Add comparison player rolling median if available
             if comp_times and comp_dates and len(comp_times) >= 1:
-                comp_window = self.ui.chart_options['rolling_window']
                 # Prepare comparison full x-axis data for rolling calculations
                 if use_match_numbers:
                     comp_full_x_data = list(range(1, len(comp_full_times) + 1))
                 else:
-                    comp_full_x_data = comp_full_dates
+                    comp_full_x_data = comp_full_dates_num
                     
                 cb.add_rolling_median(ax, comp_x_data, comp_times, 
-                                     window=comp_window, color_index=comp_line_color_idx + 1,
-                                     label=f'Comp {comp_window}-match median',
+                                     window=window, color_index=comp_line_color_idx + 1,
+                                     label=f'Comp {window}-match median',
                                      full_x_data=comp_full_x_data, full_y_data=comp_full_times,
                                      is_comparison=True)
         
         # PB line (if enabled)
-        if self.ui.chart_options['show_pb_line']:
-            label = 'Best Split' if show_splits else 'PB'
-            cb.add_pb_line(ax, x_data, times, label=label, color_index=main_line_color_idx)
+        if opts['show_pb_line']:
+            pb_series = [(x_data, times, 'Best Split' if show_splits else 'PB', main_line_color_idx)]
             
             # Add comparison player PB line if available
             if comp_times and comp_dates:
                 comp_label = 'Comp Best Split' if show_splits else 'Comp PB'
-                cb.add_pb_line(ax, comp_x_data, comp_times, label=comp_label, color_index=comp_line_color_idx)
+                pb_series.append((comp_x_data, comp_times, comp_label, comp_line_color_idx))
+            
+            # Draw both lines in one collection
+            pb_xs, pb_ys, pb_labels, pb_colors = [], [], [], []
+            for series_x, series_times, label, color_idx in pb_series:
+                series_x, series_times = _decimate_pb_series(series_x, series_times)
+                pb_xs.append(series_x)
+                pb_ys.append(series_times)
+                pb_labels.append(label)
+                pb_colors.append(color_idx)
+            cb.add_pb_lines(ax, pb_xs, pb_ys, pb_labels, pb_colors)
         
         y_label = 'Split Time (minutes)' if show_splits else 'Time (minutes)'
         cb.set_labels(ax, title=segment_name, 
                      xlabel=x_label, ylabel=y_label,
                      title_fontsize=14, label_fontsize=10)
-        cb.set_grid(ax, self.ui.chart_options['show_grid'])
+        cb.set_grid(ax, opts['show_grid'])
         
         # Format x-axis for better readability in expanded view
         if not use_match_numbers and len(dates) > 0:
             # For expanded view with dates, allow more ticks (up to 8)
-            max_ticks = 8
-            if len(dates) > max_ticks:
-                # Select evenly spaced dates
-                step = max(1, len(dates) // max_ticks)
-                tick_indices = list(range(0, len(dates), step))
-                if len(dates) - 1 not in tick_indices:
-                    tick_indices.append(len(dates) - 1)
-                
-                tick_dates = [dates[i] for i in tick_indices]
-                tick_labels = [d.strftime('%m/%d/%y') for d in tick_dates]
-                cb.set_xticks(ax, tick_dates, tick_labels, rotation=30, ha='right')
-            else:
-                # For few data points, use all dates with full format
-                tick_labels = [d.strftime('%m/%d/%y') for d in dates]
-                cb.set_xticks(ax, dates, tick_labels, rotation=30, ha='right')
+            cb.set_date_ticks(ax, max_ticks=8, rotation=30, ha='right')
         elif use_match_numbers:
             # For match numbers, let matplotlib handle the ticks automatically
             # but make sure they're integers
@@ -723,54 +1094,17 @@ class SegmentAnalyzer:
         cb.set_legend(ax)
         
         # Add detailed stats annotation
-        avg_time = statistics.mean(times)
-        best_time = min(times)
-        worst_time = max(times)
-        median_time = statistics.median(times)
-        std_dev = statistics.stdev(times) if len(times) > 1 else 0
-        
-        stats_text = (
-            f'{self.ui.analyzer.username}:\n'
-            f'  Matches: {len(times)}\n'
-            f'  Best: {self.ui._minutes_to_str(best_time)}\n'
-            f'  Average: {self.ui._minutes_to_str(avg_time)}\n'
-            f'  Median: {self.ui._minutes_to_str(median_time)}\n'
-            f'  Worst: {self.ui._minutes_to_str(worst_time)}\n'
-            f'  Std Dev: {self.ui._minutes_to_str(std_dev)}'
-        )
-        
-        # Add comparison stats if available
-        if comp_times:
-            comp_avg = statistics.mean(comp_times)
-            comp_best = min(comp_times)
-            comp_worst = max(comp_times)
-            comp_median = statistics.median(comp_times)
-            comp_std = statistics.stdev(comp_times) if len(comp_times) > 1 else 0
-            
-            stats_text += (
-                f'\n\n{self.ui.comparison_analyzer.username}:\n'
-                f'  Matches: {len(comp_times)}\n'
-                f'  Best: {self.ui._minutes_to_str(comp_best)}\n'
-                f'  Average: {self.ui._minutes_to_str(comp_avg)}\n'
-                f'  Median: {self.ui._minutes_to_str(comp_median)}\n'
-                f'  Worst: {self.ui._minutes_to_str(comp_worst)}\n'
-                f'  Std Dev: {self.ui._minutes_to_str(comp_std)}'
-            )
-        
-        cb.add_annotation(ax, stats_text, x=0.02, y=0.98, fontsize=8)
+        cb.add_annotation(ax, '', x=0.02, y=0.98, fontsize=8)
+        stats_artist = ax.texts[-1]
+        self._set_expanded_stats(stats_artist, opts.get('show_stats', True), stats_key,
+                                 times, comp_times)
         
         # Build title
         mode_str = 'Split Times' if show_splits else 'Absolute Times'
-        title = f'{self.ui.analyzer.username} - {segment_name} ({mode_str})'
+        title = f'{username} - {segment_name} ({mode_str})'
         if comp_times:
-            title += f' vs {self.ui.comparison_analyzer.username}'
-        filters = []
-        if self.ui.season_var.get() != 'All':
-            filters.append(f"Season {self.ui.season_var.get()}")
-        if self.ui.seed_filter_var.get() != 'All':
-            filters.append(self.ui.seed_filter_var.get())
-        if filters:
-            title += f" [{', '.join(filters)}]"
+            title += f' vs {comp_username}'
+        title += self._get_filter_suffix()
         
         cb.set_title(title, fontsize=14)
         
@@ -778,10 +1112,59 @@ class SegmentAnalyzer:
         cb.enable_match_click_detection(self._on_match_click)
         
         # Enable hover tooltips for rolling averages
-        cb.enable_hover_tooltips(self.ui._minutes_to_str)
+        cb.enable_hover_tooltips(ui._minutes_to_str)
+        
+        # Keep the stats box out of the cached background so it can be blitted
+        cb.set_blit_artists(stats_artist)
+        self._expanded_plot_state = plot_state
+        self._expanded_stats_artist = stats_artist
         
         cb.finalize()
     
+    def _set_expanded_stats(self, stats_artist, show_stats: bool, stats_key: tuple,
+                            times: List[float], comp_times: Optional[List[float]]):
+        """Fill in or hide the expanded view stats box, computing stats only when shown"""
+        stats_artist.set_visible(show_stats)
+        if not show_stats:
+            return
+        
+        # Stats text is memoised per segment, data and filters
+        stats_text = self._stats_text_cache.get(stats_key)
+        if stats_text is not None:
+            self._stats_text_cache.move_to_end(stats_key)
+        else:
+            stats_text = self._build_expanded_stats_text(times, comp_times)
+            self._stats_text_cache[stats_key] = stats_text
+            if len(self._stats_text_cache) > self.STATS_TEXT_CACHE_SIZE:
+                self._stats_text_cache.popitem(last=False)
+        stats_artist.set_text(stats_text)
+    
+    def _build_expanded_stats_text(self, times: List[float], comp_times: Optional[List[float]]) -> str:
+        """Build the stats annotation text for the expanded segment view"""
+        parts = []
+        players = [(self.ui.analyzer.username, times)]
+        
+        # Add comparison stats if available
+        if comp_times:
+            players.append((self.ui.comparison_analyzer.username, comp_times))
+        
+        for username, player_times in players:
+            n, avg_time, std_dev, best_time, worst_time, median_time = segment_stats(player_times)
+            best_str, avg_str, median_str, worst_str, std_str = format_minutes_to_strings(
+                (best_time, avg_time, median_time, worst_time, std_dev))
+            
+            if parts:
+                parts.append('')
+            parts.append(f'{username}:')
+            parts.append(f'  Matches: {n}')
+            parts.append(f'  Best: {best_str}')
+            parts.append(f'  Average: {avg_str}')
+            parts.append(f'  Median: {median_str}')
+            parts.append(f'  Worst: {worst_str}')
+            parts.append(f'  Std Dev: {std_str}')
+        
+        return '\n'.join(parts)
+    
     def on_segment_back(self):
         """Handle back button click - return to segment grid view"""
         self._segment_expanded = False
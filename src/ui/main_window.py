@@ -5,13 +5,13 @@ A graphical interface for browsing MCSR Ranked speedrun statistics.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
 from ..core.analyzer import MCSRAnalyzer
-from ..visualization.chart_builder import ChartBuilder
+from ..core.segment_constants import get_segment_display_name
 from ..visualization.text_presenter import TextPresenter
 from ..visualization.rich_text_presenter import RichTextPresenter
 from .dialogs import FiltersDialog, ChartOptionsDialog
@@ -19,9 +19,52 @@ from .handlers.segment_analysis import SegmentAnalyzer
 from ..visualization.chart_views import ChartViewManager
 from .handlers.comparison_handler import ComparisonHandler
 from .handlers.data_loader import DataLoader
-from .components import TopBar, Sidebar, MainContent, StatusBar
+from .components import TopBar, Sidebar, MainContent, StatusBar, FORECAST_PERCENTILES
 from ..utils.filter_manager import FilterManager
-from ..utils.speedrun_forecast import create_forecast_results
+from ..utils.time_formatting import format_times_ms_to_strings
+
+
+# Minimum seconds between the forced redraws status and loading text updates trigger
+STATUS_FLUSH_INTERVAL = 1 / 30
+
+# Milliseconds a chart rebuild waits so a burst of option toggles draws once
+CHART_REFRESH_DELAY_MS = 50
+
+
+# Readable names for match types shown in the match browser
+MATCH_TYPE_NAMES = {1: 'Ranked', 2: 'Casual(?)', 3: 'Private(?)'}
+
+
+def _match_time_display(match) -> str:
+    """Time column text for the match browser"""
+    # Show user's time if they completed, otherwise show time with indicator (parentheses)
+    if match.user_completed and match.match_time:
+        # Actual completion - show time normally
+        return match.time_str()
+    elif not match.user_completed and match.match_time:
+        # Not completed but has a time (forfeit win, solo forfeit, draw, etc.)
+        return f"({match.time_str()})"
+    elif match.is_user_win is False and match.winner_time:
+        # User lost - show winner's time with indicator
+        return f"({match.winner_time_str()})"
+    return "-"
+
+
+def _match_time_sort_key(match) -> int:
+    """Milliseconds behind the time column, -1 when it shows '-'"""
+    if match.match_time:
+        return match.match_time
+    if match.is_user_win is False and match.winner_time:
+        return match.winner_time
+    return -1
+
+
+# Match browser columns sorted by a typed value rather than their display text
+MATCH_SORT_KEYS = {
+    'Date': lambda m: m.date,
+    'Time': _match_time_sort_key,
+    'Season': lambda m: m.season,
+}
 
 
 class MCSRStatsUI:
@@ -30,11 +73,14 @@ class MCSRStatsUI:
         self.root.title("MCSR Ranked Stats Browser")
         self.root.geometry("1400x900")
         self.root.minsize(1200, 700)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
         self.analyzer = None
+        self._analyzer_cache = {}  # Parsed match cache JSON shared by all analyzers, keyed by username
         self.current_plot = None
         self.match_lookup = {}  # Store match references for detail view
-        self.chart_builder = None  # Initialized after figure is created
+        self._match_row_values = {}  # Display values per match tree item id, for text sorts
+        self._chart_builder = None  # Created with the figure on first chart use, see chart_builder
         self.text_presenter = TextPresenter()  # Legacy text formatting and generation
         self.rich_text_presenter = RichTextPresenter()  # Modern text formatting and generation
         self.filter_manager = None  # Initialized after UI setup to avoid circular dependencies
@@ -55,6 +101,7 @@ class MCSRStatsUI:
             'show_rolling_std': False,
             'show_pb_line': True,
             'show_grid': True,
+            'show_stats': True,
             'log_scale': False,
             'color_palette': 'default',
             'point_size': 30,
@@ -67,12 +114,44 @@ class MCSRStatsUI:
         self._filter_time_min = None   # milliseconds or None
         self._filter_time_max = None   # milliseconds or None
         
+        # Filtered match memo, shared by every view rendered for one filter state
+        self._filter_cache_key = None        # (filter key, analyzer id, matches version, match count)
+        self._filter_cache_all = None        # All filtered matches for that key
+        self._filter_cache_completed = None  # Completed-only filtered matches for that key
+        
+        # Status bar redraws forced by _set_status, throttled to STATUS_FLUSH_INTERVAL
+        self._last_status_flush = 0.0  # time.monotonic() of the last update_idletasks
+        
+        self._quick_stats_dirty = False  # Quick stat labels hold values _clear_display must reset
+        self._chart_refresh_after = None  # after() id of the pending debounced chart rebuild
+        self._display_update_pending = False  # An _update_display refresh is queued for idle
+        
+        # Match browser row tuples by id(match), valid for one analyzer data version
+        self._match_row_cache_key = None  # (analyzer, matches version, match count)
+        self._match_row_cache = {}
+        
         # Current view tracking
         self._current_view = 'summary'  # Track current view to preserve on filter changes
+        self._current_tab = 0  # Selected notebook tab index, kept current by <<NotebookTabChanged>>
+        self._current_chart_view = None  # _chart_view_dispatch key of the chart last shown
+        
+        # Dialogs are built once and hidden on close, then reused on reopen
+        self._filters_dialog = None
+        self._chart_options_dialog = None
         
         # Forecast settings
         self.forecast_rolling_window = 20  # Default rolling window size for forecasts
         self.forecast_percentile = 50.0   # Default percentile for forecasts (median)
+        self._forecast_executor = ThreadPoolExecutor(max_workers=1)  # Runs forecast computation off the Tk thread
+        self._forecast_future = None   # Most recently submitted forecast computation
+        self._forecast_generation = 0  # Bumped per request so stale results are dropped
+        self._closing = False  # Set once the window is closing; forecast callbacks must not touch root
+        self._forecast_blurb = (None, '')  # ((window used, percentile name), explanation text) last shown
+        
+        # Forecast tab widgets, created by MainContent during UI setup
+        self.forecast_percentile_var = None
+        self.forecast_tree = None
+        self.forecast_detail_text = None
         
         # Initialize handlers early (before UI setup so buttons can reference them)
         self.comparison_handler = None  # Will be initialized after UI setup
@@ -82,8 +161,15 @@ class MCSRStatsUI:
         self.style = ttk.Style()
         self.style.theme_use('clam')
         
+        self._filter_state = None  # (include_private, season, seed type), kept current by var traces
+        
         self._setup_ui()
         
+    def _on_filter_var_change(self, *args):
+        """Refresh the cached sidebar filter values after one of their variables is written"""
+        self._filter_state = (self.include_private_var.get(), self.season_var.get(),
+                              self.seed_filter_var.get())
+        
     def _setup_ui(self):
         """Set up the main UI layout"""
         # Main container
@@ -94,6 +180,11 @@ class MCSRStatsUI:
         top_bar = TopBar(self.main_container, self)
         top_bar.create()
         
+        # Mirror the sidebar filter variables so hot paths skip the Tcl reads
+        for var in (self.include_private_var, self.season_var, self.seed_filter_var):
+            var.trace_add('write', self._on_filter_var_change)
+        self._on_filter_var_change()
+        
         # Content area
         self.content_frame = ttk.Frame(self.main_container)
         self.content_frame.pack(fill=tk.BOTH, expand=True, pady=10)
@@ -102,24 +193,53 @@ class MCSRStatsUI:
         sidebar = Sidebar(self.content_frame, self)
         sidebar.create()
         
-        main_content = MainContent(self.content_frame, self)
-        main_content.create()
+        self._main_content = MainContent(self.content_frame, self)
+        self._main_content.create()
         
         # Initialize handlers after UI components are created
-        self.chart_builder = ChartBuilder(self.fig, self.canvas)
         self.filter_manager = FilterManager(self)
         self.segment_analyzer = SegmentAnalyzer(self)
         self.chart_views = ChartViewManager(self)
         self.comparison_handler = ComparisonHandler(self)
         self.data_loader = DataLoader(self)
-        
-        # Bind click events for segment expansion
-        self.canvas.mpl_connect('button_press_event', lambda e: self.segment_analyzer.on_chart_click(e))
+        self._build_view_dispatch()
         
         # Status bar
         status_bar = StatusBar(self.main_container, self)
         status_bar.create()
         
+    @property
+    def chart_builder(self):
+        """Chart builder for the Charts tab, creating the matplotlib figure on first access"""
+        if self._chart_builder is None:
+            # matplotlib is imported here rather than at startup, so sessions that
+            # never open a chart don't pay for it
+            from ..visualization.chart_builder import ChartBuilder
+            self._main_content.create_chart_canvas()
+            self._chart_builder = ChartBuilder(self.fig, self.canvas)
+            
+            # Bind click events for segment expansion
+            self.canvas.mpl_connect('button_press_event', lambda e: self.segment_analyzer.on_chart_click(e))
+        return self._chart_builder
+    
+    @chart_builder.setter
+    def chart_builder(self, value):
+        self._chart_builder = value
+    
+    def _on_notebook_tab_changed(self, event=None):
+        """Track the selected tab and create the chart canvas when the Charts tab is opened directly"""
+        self._current_tab = self.notebook.index(self.notebook.select())
+        if self._current_tab == 1:
+            _ = self.chart_builder  # Accessing the property creates the figure and canvas
+    
+    def _on_close(self):
+        """Cancel queued forecast work without blocking the Tk thread, then close the window"""
+        self._closing = True
+        if self._forecast_future is not None:
+            self._forecast_future.cancel()
+        self._forecast_executor.shutdown(wait=False)
+        self.root.destroy()
+    
     def _show_welcome(self):
         """Show welcome message"""
         self.rich_text_presenter.render_welcome(self.stats_text)
@@ -127,7 +247,16 @@ class MCSRStatsUI:
     def _set_status(self, message):
         """Update status bar"""
         self.status_var.set(message)
-        self.root.update_idletasks()
+        self._flush_idletasks()
+    
+    def _flush_idletasks(self):
+        """Force a redraw for status/loading text, throttled to STATUS_FLUSH_INTERVAL"""
+        # Bursts of writes during loads only force a redraw ~30 times a second;
+        # anything skipped is drawn at the next idle like any other change
+        now = time.monotonic()
+        if now - self._last_status_flush >= STATUS_FLUSH_INTERVAL:
+            self._last_status_flush = now
+            self.root.update_idletasks()
         
     def _time_str(self, milliseconds):
         """Convert milliseconds to MM:SS.mmm format"""
@@ -156,27 +285,78 @@ class MCSRStatsUI:
             return
         
         # Get filter settings
-        include_private = self.include_private_var.get()
+        include_private = self.filter_manager.get_filter_values()[0]
             
         stats = self.analyzer.basic_stats(include_private_rooms=include_private)
         if 'error' in stats:
             return
             
-        self.quick_stats_labels['Total Matches'].config(text=str(stats['total_matches']))
-        self.quick_stats_labels['Completed'].config(text=str(stats['completed']))
-        self.quick_stats_labels['Best Time'].config(text=self._time_str(stats['best_time']))
-        self.quick_stats_labels['Average'].config(text=self._time_str(int(stats['average_time']) if stats['average_time'] is not None else None))
+        labels = self.quick_stats_labels
+        labels.total_matches.config(text=str(stats['total_matches']))
+        labels.completed.config(text=str(stats['completed']))
+        labels.best_time.config(text=self._time_str(stats['best_time']))
+        labels.average.config(text=self._time_str(int(stats['average_time']) if stats['average_time'] is not None else None))
+        self._quick_stats_dirty = True
         
     def _get_filtered_matches(self):
         """Get completed matches (user's wins) filtered by current UI filters"""
-        return self.filter_manager.get_filtered_matches(self.analyzer, completed_only=True)
+        return self._get_cached_filtered_matches(completed_only=True)
     
     def _get_all_filtered_matches(self):
         """Get all matches (wins/losses/draws) filtered by current UI filters"""
-        return self.filter_manager.get_all_filtered_matches(self.analyzer)
+        return self._get_cached_filtered_matches(completed_only=False)
+    
+    def _get_cached_filtered_matches(self, completed_only: bool):
+        """
+        Filter the main player's matches once per filter state and data version.
+        
+        Args:
+            completed_only: Whether to include only completed matches
+            
+        Returns:
+            A fresh list, so callers may sort or mutate it freely
+        """
+        analyzer = self.analyzer
+        if not analyzer:
+            return []
+        
+        key = (self.filter_manager.get_filter_key(),
+               id(analyzer), analyzer.matches_version, len(analyzer.matches))
+        if key != self._filter_cache_key:
+            self._filter_cache_key = key
+            self._filter_cache_all = None
+            self._filter_cache_completed = None
+        
+        if completed_only:
+            if self._filter_cache_completed is None:
+                self._filter_cache_completed = self.filter_manager.get_filtered_matches(analyzer, completed_only=True)
+            return list(self._filter_cache_completed)
+        
+        if self._filter_cache_all is None:
+            self._filter_cache_all = self.filter_manager.get_all_filtered_matches(analyzer)
+        return list(self._filter_cache_all)
+    
+    def _invalidate_filter_cache(self):
+        """Drop memoised filter results (call when match data is reloaded)"""
+        self._filter_cache_key = None
+        self._filter_cache_all = None
+        self._filter_cache_completed = None
+    
+    def _invalidate_match_row_cache(self):
+        """Drop the match browser rows formatted for the previous match data"""
+        self._match_row_cache_key = None
+        self._match_row_cache = {}
         
     def _update_display(self):
-        """Update display when filter changes"""
+        """Update display when filter changes; repeated calls before Tk goes idle update once"""
+        self._invalidate_filter_cache()
+        if not self._display_update_pending:
+            self._display_update_pending = True
+            self.root.after_idle(self._run_display_update)
+    
+    def _run_display_update(self):
+        """after_idle callback for _update_display"""
+        self._display_update_pending = False
         self._update_quick_stats()
         self._update_filter_indicator()
         self._refresh_current_view()
@@ -213,33 +393,35 @@ class MCSRStatsUI:
 
         return self.text_presenter.generate_summary_text(analyzer, all_matches)
     
+    def _build_view_dispatch(self):
+        """Bind view and chart refresh methods once, after the handlers exist"""
+        chart_views = self.chart_views
+        self._view_dispatch = {
+            'summary': self._show_summary,
+            'progression': chart_views.progression.show,
+            # 'elo_progression': chart_views.elo.show,  # Commented out - ELO feature not working
+            'best_times': self._show_best_times,
+            'season_stats': chart_views.season_stats.show,
+            'seed_types': chart_views.seed_types.show,
+            'segments': self.segment_analyzer.show_segments_text,
+            'segment_progression': self.segment_analyzer.show_segment_progression,
+            'distribution': chart_views.distribution.show,
+            'match_browser': self._show_match_browser,
+            'forecast': self._show_forecast,
+        }
+        # Map chart view names to their corresponding methods
+        self._chart_view_dispatch = {
+            '_show_progression': chart_views.progression.show,
+            '_show_season_stats': chart_views.season_stats.show,
+            '_show_seed_types': chart_views.seed_types.show,
+            '_show_distribution': chart_views.distribution.show,
+            '_show_segment_progression': self.segment_analyzer.show_segment_progression,
+        }
+    
     def _refresh_current_view(self):
         """Refresh the currently active view after filter changes"""
-        if self._current_view == 'summary':
-            self._show_summary()
-        elif self._current_view == 'progression':
-            self.chart_views.progression.show()
-        # elif self._current_view == 'elo_progression':  # Commented out - ELO feature not working
-        #     self.chart_views.elo.show()
-        elif self._current_view == 'best_times':
-            self._show_best_times()
-        elif self._current_view == 'season_stats':
-            self.chart_views.season_stats.show()
-        elif self._current_view == 'seed_types':
-            self.chart_views.seed_types.show()
-        elif self._current_view == 'segments':
-            self.segment_analyzer.show_segments_text()
-        elif self._current_view == 'segment_progression':
-            self.segment_analyzer.show_segment_progression()
-        elif self._current_view == 'distribution':
-            self.chart_views.distribution.show()
-        elif self._current_view == 'match_browser':
-            self._show_match_browser()
-        elif self._current_view == 'forecast':
-            self._show_forecast()
-        else:
-            # Fallback to summary if no valid view is tracked
-            self._show_summary()
+        # Fallback to summary if no valid view is tracked
+        (self._view_dispatch.get(self._current_view) or self._show_summary)()
     
     def _update_filter_indicator(self):
         """Update the filter indicator label to show active filters"""
@@ -265,9 +447,9 @@ class MCSRStatsUI:
             self._update_display()
             self._populate_match_tree()
             
-            # Refresh current chart if on charts tab
-            if hasattr(self, '_current_chart_view') and self.notebook.index(self.notebook.select()) == 1:
-                self._refresh_current_chart()
+            # Refresh current chart if on charts tab, queued behind the view refresh
+            if self._current_chart_view is not None and self._current_tab == 1:
+                self.root.after_idle(self._refresh_current_chart)
         
         current_filters = {
             'date_from': self._filter_date_from,
@@ -276,62 +458,59 @@ class MCSRStatsUI:
             'time_max': self._filter_time_max
         }
         
-        FiltersDialog(self.root, current_filters, on_apply)
+        if self._filters_dialog is None or not self._filters_dialog.dialog.winfo_exists():
+            self._filters_dialog = FiltersDialog(self.root, current_filters, on_apply)
+        else:
+            self._filters_dialog.show(current_filters)
         
     def _populate_match_tree(self):
         """Populate match tree with data"""
-        # Clear existing
-        for item in self.match_tree.get_children():
-            self.match_tree.delete(item)
-        
         # Clear match lookup
         self.match_lookup = {}
+        self._match_row_values = {}
             
         if not self.analyzer:
+            self.match_tree.set_rows(())
             return
             
+        # filter_matches already returns newest first, walking the date order
+        # the analyzer caches per data load, so no sort is needed here
         matches = self._get_all_filtered_matches()
-        for match in sorted(matches, key=lambda x: x.date, reverse=True):
-            # Use the proper status from user's perspective
-            status = match.get_status()
-            
-            # Map match type to readable name
-            type_names = {1: 'Ranked', 2: 'Casual(?)', 3: 'Private(?)'}
-            match_type_name = type_names.get(match.match_type, f'Type{match.match_type}')
-            
-            # Get winner info
-            if match.is_draw:
-                winner = "(Draw)"
-            elif match.winner:
-                winner = match.winner
-            else:
-                winner = "-"
-            
-            # Show user's time if they completed, otherwise show time with indicator (parentheses)
-            if match.user_completed and match.match_time:
-                # Actual completion - show time normally
-                time_display = match.time_str()
-            elif not match.user_completed and match.match_time:
-                # Not completed but has a time (forfeit win, solo forfeit, draw, etc.)
-                time_display = f"({match.time_str()})"
-            elif match.is_user_win is False and match.winner_time:
-                # User lost - show winner's time with indicator
-                time_display = f"({match.winner_time_str()})"
-            else:
-                time_display = "-"
-            
-            item_id = self.match_tree.insert('', tk.END, values=(
-                match.date_str(),
-                time_display,
-                match.season,
-                match.seed_type,
-                match_type_name,
-                status,
-                winner
-            ))
-            
-            # Store reference to match object
-            self.match_lookup[item_id] = match
+        
+        # Row tuples are kept across filter changes while the match data is
+        # unchanged, so only matches not formatted before are built here
+        analyzer = self.analyzer
+        # The analyzer itself is held and compared by identity: its id() could be
+        # reused by a new analyzer once the old one is freed
+        key = self._match_row_cache_key
+        if (key is None or key[0] is not analyzer
+                or key[1:] != (analyzer.matches_version, len(analyzer.matches))):
+            self._match_row_cache_key = (analyzer, analyzer.matches_version, len(analyzer.matches))
+            self._match_row_cache = {}
+        cache = self._match_row_cache
+        new = [m for m in matches if id(m) not in cache]
+        
+        # Build each display column in one pass
+        type_names = MATCH_TYPE_NAMES
+        cache.update(zip(map(id, new), zip(
+            [m.date_str() for m in new],
+            [_match_time_display(m) for m in new],
+            [m.season for m in new],
+            [m.seed_type for m in new],
+            # The fallback name is only formatted for unknown types
+            [type_names[m.match_type] if m.match_type in type_names else f'Type{m.match_type}' for m in new],
+            [m.get_status() for m in new],  # Status from user's perspective
+            ["(Draw)" if m.is_draw else (m.winner or "-") for m in new],
+        )))
+        rows = [cache[id(m)] for m in matches]
+        
+        # Item ids record population order, which breaks ties when sorting
+        iids = [str(n) for n in range(len(rows))]
+        self.match_lookup = dict(zip(iids, matches))
+        self._match_row_values = dict(zip(iids, rows))
+        
+        # The virtual tree only creates Tk items for the visible window
+        self.match_tree.set_rows(rows, iids)
     
     def _on_match_selected(self, event):
         """Handle match selection to show details"""
@@ -350,10 +529,24 @@ class MCSRStatsUI:
             
     def _sort_treeview(self, col):
         """Sort treeview by column"""
-        items = [(self.match_tree.set(k, col), k) for k in self.match_tree.get_children('')]
+        tree = self.match_tree
+        kids = tree.row_ids()
+        
+        # Typed keys straight from the Match objects where possible, otherwise
+        # the display text; population order breaks ties
+        key_fn = MATCH_SORT_KEYS.get(col)
+        if key_fn is not None:
+            lookup = self.match_lookup
+            items = [(key_fn(lookup[k]), int(k), k) for k in kids]
+        else:
+            values = self._match_row_values
+            col_index = tree['columns'].index(col)
+            items = [(str(values[k][col_index]).lower(), int(k), k) for k in kids]
+        
         items.sort(reverse=True)
-        for index, (val, k) in enumerate(items):
-            self.match_tree.move(k, '', index)
+        sorted_ids = [k for _, _, k in items]
+        values = self._match_row_values
+        tree.set_rows([values[k] for k in sorted_ids], sorted_ids, keep_selection=True)
             
     def _show_summary(self):
         """Show summary stats"""
@@ -421,10 +614,7 @@ class MCSRStatsUI:
             return
         
         # Get filter settings
-        include_private = self.include_private_var.get()
-        season_filter = self.season_var.get()
-        seed_filter = self.seed_filter_var.get()
-        season_val = int(season_filter) if season_filter != 'All' else None
+        include_private, _, seed_filter = self.filter_manager.get_filter_values()
         seed_val = seed_filter if seed_filter != 'All' else None
         
         # Get season breakdowns for both players
@@ -457,10 +647,7 @@ class MCSRStatsUI:
             return
         
         # Get season breakdown for text generation
-        include_private = self.include_private_var.get()
-        season_filter = self.season_var.get()
-        seed_filter = self.seed_filter_var.get()
-        season_val = int(season_filter) if season_filter != 'All' else None
+        include_private, _, seed_filter = self.filter_manager.get_filter_values()
         seed_val = seed_filter if seed_filter != 'All' else None
         
         seasons = self.analyzer.season_breakdown(include_private_rooms=include_private, 
@@ -471,48 +658,62 @@ class MCSRStatsUI:
     
     def _on_chart_option_change(self):
         """Handle chart option checkbox changes - refresh current chart"""
-        # Update chart_options from UI
-        self.chart_options['show_rolling_avg'] = self.show_rolling_var.get()
-        self.chart_options['show_rolling_median'] = self.show_rolling_median_var.get()
-        self.chart_options['show_rolling_std'] = self.show_std_var.get()
-        self.chart_options['show_pb_line'] = self.show_pb_var.get()
-        self.chart_options['show_grid'] = self.show_grid_var.get()
-        self.chart_options['log_scale'] = self.show_log_scale_var.get()
+        # Update chart_options from UI in a single update call
+        opts = self.chart_options
+        previous = dict(opts)
+        opts.update(
+            show_rolling_avg=self.show_rolling_var.get(),
+            show_rolling_median=self.show_rolling_median_var.get(),
+            show_rolling_std=self.show_std_var.get(),
+            show_pb_line=self.show_pb_var.get(),
+            show_grid=self.show_grid_var.get(),
+            log_scale=self.show_log_scale_var.get(),
+        )
 
         # Refresh the current chart if applicable
-        if self.analyzer and self.notebook.index(self.notebook.select()) == 1:
+        if self.analyzer and self._current_tab == 1:
+            # Overlays already drawn on the current chart are toggled with a blit;
+            # anything else (grid, log scale, overlays never drawn) needs a rebuild
+            changed = {key: value for key, value in opts.items() if previous.get(key) != value}
+            if self.chart_builder.toggle_overlays(changed):
+                return
             # Determine which chart is currently displayed and refresh it
-            self._refresh_current_chart()
+            self._schedule_chart_refresh()
     
     def _on_match_numbers_toggle(self):
         """Handle match numbers x-axis toggle - refresh current chart"""
         # Refresh the current chart if applicable
-        if self.analyzer and self.notebook.index(self.notebook.select()) == 1:
-            self._refresh_current_chart()
+        if self.analyzer and self._current_tab == 1:
+            self._schedule_chart_refresh()
+    
+    def _schedule_chart_refresh(self):
+        """Refresh the current chart once a burst of option changes settles"""
+        if self._chart_refresh_after is not None:
+            self.root.after_cancel(self._chart_refresh_after)
+        self._chart_refresh_after = self.root.after(CHART_REFRESH_DELAY_MS, self._run_scheduled_chart_refresh)
+    
+    def _run_scheduled_chart_refresh(self):
+        """after() callback for _schedule_chart_refresh"""
+        self._chart_refresh_after = None
+        self._refresh_current_chart()
     
     def _refresh_current_chart(self):
         """Refresh the currently displayed chart"""
         # This will be set by each chart method
-        if hasattr(self, '_current_chart_view'):
-            # Special handling for segment progression - preserve expanded state
-            if self._current_chart_view == '_show_segment_progression' and self.segment_analyzer.is_expanded():
-                expanded_seg = self.segment_analyzer.get_expanded_segment()
-                if expanded_seg:
-                    self.segment_analyzer.show_expanded_segment(expanded_seg)
-                return
-            
-            # Map chart view names to their corresponding methods
-            chart_view_map = {
-                '_show_progression': lambda: self.chart_views.progression.show(),
-                '_show_season_stats': lambda: self.chart_views.season_stats.show(),
-                '_show_seed_types': lambda: self.chart_views.seed_types.show(),
-                '_show_distribution': lambda: self.chart_views.distribution.show(),
-                '_show_segment_progression': lambda: self.segment_analyzer.show_segment_progression(),
-            }
-            
-            view_method = chart_view_map.get(self._current_chart_view)
-            if view_method:
-                view_method()
+        chart_view = self._current_chart_view
+        if chart_view is None:
+            return
+        
+        # Special handling for segment progression - preserve expanded state
+        if chart_view == '_show_segment_progression' and self.segment_analyzer.is_expanded():
+            expanded_seg = self.segment_analyzer.get_expanded_segment()
+            if expanded_seg:
+                self.segment_analyzer.show_expanded_segment(expanded_seg)
+            return
+        
+        view_method = self._chart_view_dispatch.get(chart_view)
+        if view_method:
+            view_method()
     
     def _show_chart_options_dialog(self):
         """Show dialog for advanced chart options"""
@@ -532,12 +733,16 @@ class MCSRStatsUI:
             
             self._refresh_current_chart()
         
-        ChartOptionsDialog(
-            self.root, 
-            self.chart_options, 
-            list(ChartBuilder.PALETTES.keys()),
-            on_apply
-        )
+        if self._chart_options_dialog is None or not self._chart_options_dialog.dialog.winfo_exists():
+            from ..visualization.chart_builder import ChartBuilder
+            self._chart_options_dialog = ChartOptionsDialog(
+                self.root, 
+                self.chart_options, 
+                list(ChartBuilder.PALETTES.keys()),
+                on_apply
+            )
+        else:
+            self._chart_options_dialog.show(self.chart_options)
     
     def _set_chart_controls_visible(self, show_splits_toggle: bool, show_back_button: bool = False, 
                                    show_match_numbers_toggle: bool = False):
@@ -580,16 +785,20 @@ class MCSRStatsUI:
         self._populate_forecast_tree()
     
     def _populate_forecast_tree(self):
-        """Populate the forecast treeview with data"""
+        """Populate the forecast treeview, computing forecasts off the Tk thread"""
         if not self.analyzer or not self.analyzer.matches:
             return
         
         # Clear existing items
-        for item in self.forecast_tree.get_children():
-            self.forecast_tree.delete(item)
-        
+        self.forecast_tree.set_rows(())
         self.forecast_lookup.clear()
         
+        # A newer request supersedes anything still queued or running
+        self._forecast_generation += 1
+        if self._forecast_future is not None:
+            self._forecast_future.cancel()
+            self._forecast_future = None
+        
         # Get filtered matches with segment data
         filter_kwargs = self.filter_manager.build_filter_kwargs()
         filtered_matches = self.analyzer.filter_matches(**filter_kwargs)
@@ -599,62 +808,90 @@ class MCSRStatsUI:
         
         if not matches_with_segments:
             # Insert message row
-            self.forecast_tree.insert('', 'end', values=('—', '—', 'No matches with segment data', '—', '—', '—'))
+            self.forecast_tree.set_rows([('—', '—', 'No matches with segment data', '—', '—', '—')])
+            return
+        
+        self._compute_forecast_async(matches_with_segments)
+    
+    def _compute_forecast_async(self, matches_with_segments):
+        """Submit the forecast computation and hand its results back to the Tk thread"""
+        from ..utils.speedrun_forecast import create_forecast_results
+        
+        generation = self._forecast_generation
+        future = self._forecast_executor.submit(create_forecast_results, matches_with_segments,
+                                                rolling_window=self.forecast_rolling_window,
+                                                percentile=self.forecast_percentile)
+        self._forecast_future = future
+        
+        def on_done(f):
+            if f.cancelled() or self._closing:
+                return
+            # Tk is not thread-safe; only schedule work from here
+            self.root.after(0, self._apply_forecast_rows, f, generation)
+        
+        future.add_done_callback(on_done)
+    
+    def _apply_forecast_rows(self, future, generation):
+        """Show finished forecast results, dropping them if a newer request was made"""
+        if generation != self._forecast_generation:
             return
+        self._forecast_future = None
         
-        # Generate forecast results
+        tree = self.forecast_tree
+        rows = []
         try:
-            forecast_results = create_forecast_results(matches_with_segments, 
-                                                      rolling_window=self.forecast_rolling_window,
-                                                      percentile=self.forecast_percentile)
+            forecast_results = future.result()
             
             if not forecast_results:
-                self.forecast_tree.insert('', 'end', values=('—', '—', 'No forecastable data', '—', '—', '—'))
+                tree.set_rows([('—', '—', 'No forecastable data', '—', '—', '—')])
                 return
             
-            # Populate tree with forecast data
-            for i, result in enumerate(forecast_results, 1):
+            from ..core.segment_constants import get_segment_display_name
+            lookup = self.forecast_lookup
+            append = rows.append
+            
+            # Format both time columns in one batch each rather than per row
+            forecast_time_strs = format_times_ms_to_strings([r['forecast_time'] for r in forecast_results])
+            current_time_strs = format_times_ms_to_strings([
+                r['breakdown'].get('current_time') if r['breakdown'] else None
+                for r in forecast_results
+            ])
+            
+            # Build rows for forecast data; the rank doubles as the item id
+            for i, (result, forecast_time_str, current_time_str) in enumerate(
+                    zip(forecast_results, forecast_time_strs, current_time_strs), 1):
                 match = result['match']
-                forecast_time = result['forecast_time']
                 breakdown = result['breakdown']
-                is_completed = result['is_completed']
-                
-                # Format values
-                rank = str(i)
-                date = match.date_str()
-                
-                # Format forecasted time
-                forecast_time_str = self._format_time(forecast_time)
                 
                 # Status
-                if is_completed:
+                if result['is_completed']:
                     status = "Completed"
                     current_progress = forecast_time_str
                     last_segment = "Run Complete"
                 else:
                     status = "Forecasted"
                     if breakdown and 'current_time' in breakdown:
-                        current_progress = self._format_time(breakdown['current_time'])
+                        current_progress = current_time_str
                     else:
                         current_progress = "—"
                     
                     if breakdown and 'last_completed_segment' in breakdown:
-                        from ..core.segment_constants import get_segment_display_name
                         last_segment = get_segment_display_name(breakdown['last_completed_segment'])
                     else:
                         last_segment = "—"
                 
-                # Insert into tree
-                item_id = self.forecast_tree.insert('', 'end', values=(
-                    rank, date, forecast_time_str, status, current_progress, last_segment
-                ))
+                rank = str(i)
+                append((rank, match.date_str(), forecast_time_str, status, current_progress, last_segment))
                 
                 # Store reference for details
-                self.forecast_lookup[item_id] = result
+                lookup[rank] = result
+            
+            tree.set_rows(rows, [row[0] for row in rows])
                 
         except Exception as e:
-            # Handle errors gracefully
-            self.forecast_tree.insert('', 'end', values=('Error', '—', str(e), '—', '—', '—'))
+            # Handle errors gracefully, keeping any rows built before the failure
+            rows.append(('Error', '—', str(e), '—', '—', '—'))
+            tree.set_rows(rows, [row[0] for row in rows])
             print(f"Forecast error: {e}")  # For debugging
     
     def _on_forecast_select(self, event):
@@ -702,16 +939,15 @@ class MCSRStatsUI:
                 self.forecast_detail_text.add_line()
                 
                 # Show completed and forecasted segments
+                segment_name = self._get_segment_display_name
                 if breakdown['segments_completed']:
                     self.forecast_detail_text.add_text("Completed segments: ", [])
-                    completed_names = [self._get_segment_display_name(seg) for seg in breakdown['segments_completed']]
-                    self.forecast_detail_text.add_text(", ".join(completed_names), ['muted'])
+                    self.forecast_detail_text.add_text(", ".join(map(segment_name, breakdown['segments_completed'])), ['muted'])
                     self.forecast_detail_text.add_line()
                 
                 if breakdown['segments_forecasted']:
                     self.forecast_detail_text.add_text("Forecasted segments: ", [])
-                    forecasted_names = [self._get_segment_display_name(seg) for seg in breakdown['segments_forecasted']]
-                    self.forecast_detail_text.add_text(", ".join(forecasted_names), ['muted'])
+                    self.forecast_detail_text.add_text(", ".join(map(segment_name, breakdown['segments_forecasted'])), ['muted'])
                     self.forecast_detail_text.add_line()
                 
                 self.forecast_detail_text.add_line()
@@ -719,8 +955,12 @@ class MCSRStatsUI:
                 # Show rolling window and percentile information
                 if 'rolling_window_used' in breakdown:
                     window_used = breakdown['rolling_window_used']
-                    percentile_name = self.forecast_percentile_var.get() if hasattr(self, 'forecast_percentile_var') else f"{self.forecast_percentile}th percentile"
-                    self.forecast_detail_text.add_text(f"Forecast based on {percentile_name.lower()} of your {window_used} most recent completed runs before this match.", ['muted', 'italic'])
+                    percentile_name = self.forecast_percentile_var.get() if self.forecast_percentile_var is not None else f"{self.forecast_percentile}th percentile"
+                    # Consecutive selections usually share the window and percentile
+                    key = (window_used, percentile_name)
+                    if self._forecast_blurb[0] != key:
+                        self._forecast_blurb = (key, f"Forecast based on {percentile_name.lower()} of your {window_used} most recent completed runs before this match.")
+                    self.forecast_detail_text.add_text(self._forecast_blurb[1], ['muted', 'italic'])
                 else:
                     self.forecast_detail_text.add_text("Forecast based on your historical segment performance.", ['muted', 'italic'])
         else:
@@ -732,31 +972,22 @@ class MCSRStatsUI:
         """Format time in milliseconds to MM:SS.mmm"""
         if time_ms is None:
             return "N/A"
-        seconds = time_ms / 1000
-        minutes, sec_remainder = divmod(seconds, 60)
-        return f'{int(minutes)}:{int(sec_remainder):02d}.{int(time_ms % 1000):03d}'
+        seconds, millis = divmod(int(time_ms), 1000)
+        minutes, seconds = divmod(seconds, 60)
+        return '%d:%02d.%03d' % (minutes, seconds, millis)
     
     def _get_segment_display_name(self, segment_key):
         """Get display name for a segment"""
-        from ..core.segment_constants import get_segment_display_name
         return get_segment_display_name(segment_key)
     
     def _on_forecast_percentile_change(self, event=None):
         """Handle forecast percentile dropdown change"""
         # Parse percentile from selection
         selection = self.forecast_percentile_var.get()
-        percentile_map = {
-            "10th (Very Optimistic)": 10.0,
-            "25th (Optimistic)": 25.0,
-            "50th (Median)": 50.0,
-            "75th (Conservative)": 75.0,
-            "90th (Very Conservative)": 90.0
-        }
-        
-        self.forecast_percentile = percentile_map.get(selection, 50.0)
+        self.forecast_percentile = FORECAST_PERCENTILES.get(selection, 50.0)
         
         # Refresh forecast view if currently active
-        if hasattr(self, '_current_view') and self._current_view == 'forecast':
+        if self._current_view == 'forecast':
             self._populate_forecast_tree()
     
     def _clear_display(self):
@@ -764,48 +995,46 @@ class MCSRStatsUI:
         # Clear text areas
         self.stats_text.clear()
         
-        # Clear chart
-        self.chart_builder.clear()
-        self.chart_builder.finalize()
+        # Clear chart (nothing to clear if no chart was ever shown)
+        if self._chart_builder is not None:
+            self._chart_builder.clear()
+            self._chart_builder.finalize()
         
         # Clear match browser
-        for item in self.match_tree.get_children():
-            self.match_tree.delete(item)
+        self.match_tree.set_rows(())
         
         # Clear forecast browser
-        if hasattr(self, 'forecast_tree'):
-            for item in self.forecast_tree.get_children():
-                self.forecast_tree.delete(item)
-            if hasattr(self, 'forecast_detail_text'):
+        if self.forecast_tree is not None:
+            self.forecast_tree.set_rows(())
+            if self.forecast_detail_text is not None:
                 self.forecast_detail_text.clear()
                 self.forecast_detail_text.add_text("No data loaded", ['muted', 'center'])
                 self.forecast_detail_text.finalize()
         
-        # Clear quick stats
-        self.quick_stats_text.config(state='normal')
-        self.quick_stats_text.delete(1.0, tk.END)
-        self.quick_stats_text.insert('1.0', "No data loaded")
-        self.quick_stats_text.config(state='disabled')
+        # Clear quick stats, unless they already show placeholders
+        if self._quick_stats_dirty:
+            self.quick_stats_labels.reset()
+            self._quick_stats_dirty = False
 
     def _show_loading_progress(self, loading_text: str = ""):
         """Show progress bar and loading text"""
-        self.progress.pack(side=tk.RIGHT, padx=(5, 0))
+        self.progress.grid()
         self.progress.start()
         
         if loading_text:
             self.loading_text_var.set(loading_text)
-            self.loading_text_label.pack(side=tk.RIGHT, padx=(0, 10))
+            self.loading_text_label.grid()
     
     def _update_loading_progress(self, loading_text: str):
         """Update loading progress text"""
         self.loading_text_var.set(loading_text)
-        self.root.update_idletasks()
+        self._flush_idletasks()
     
     def _hide_loading_progress(self):
         """Hide progress bar and loading text"""
         self.progress.stop()
-        self.progress.pack_forget()
-        self.loading_text_label.pack_forget()
+        self.progress.grid_remove()
+        self.loading_text_label.grid_remove()
         self.loading_text_var.set("")
 
 
@@ -47,6 +47,11 @@ class RichTextWidget(tk.Text):
         # Track content for responsive adjustments
         self._last_width = 0
         
+        # Inserts buffered between clear() and finalize(), sent to Tk in one call
+        self._pending: Optional[List] = None  # Flat (text, tags, text, tags, ...) insert arguments
+        self._flush_after_id = None           # after_idle id of the safety flush
+        self._replace_all = False             # Set by clear(): the next flush replaces all content
+        
     def _setup_fonts(self):
         """Setup font families and sizes for different text elements."""
         try:
@@ -174,9 +179,61 @@ class RichTextWidget(tk.Text):
                 # Could trigger responsive table recalculation here if needed
     
     def clear(self):
-        """Clear all text content."""
+        """Clear all text content and start buffering new content until finalize()."""
+        self._pending = None  # Anything still buffered is being cleared anyway
+        self.end_batch()
         self.config(state=tk.NORMAL)
-        self.delete('1.0', tk.END)
+        # The deletion goes out with the new content as a single replace
+        self._replace_all = True
+        self.begin_batch()
+    
+    def begin_batch(self):
+        """Buffer added text so it reaches Tk as a single insert."""
+        if self._pending is None:
+            self._pending = []
+            # Content added without a finalize() still shows up at the next idle
+            self._flush_after_id = self.after_idle(self.end_batch)
+    
+    def end_batch(self):
+        """Insert all buffered text and stop buffering."""
+        self._flush()
+        self._pending = None
+        if self._flush_after_id is not None:
+            self.after_cancel(self._flush_after_id)
+            self._flush_after_id = None
+    
+    def _flush(self):
+        """Send buffered text to Tk in one insert (or replace after clear()), with each chunk keeping its tags"""
+        pending = self._pending
+        replace_all = self._replace_all
+        if not pending and not replace_all:
+            return
+        if pending:
+            self._pending = []
+        self._replace_all = False
+        disabled = str(self.cget('state')) == tk.DISABLED
+        if disabled:
+            self.config(state=tk.NORMAL)
+        if not replace_all:
+            self.insert(tk.END, *pending)
+        elif pending:
+            self.replace('1.0', tk.END, *pending)
+        else:
+            self.delete('1.0', tk.END)
+        if disabled:
+            self.config(state=tk.DISABLED)
+    
+    def _insert(self, text: str, tags):
+        """Insert at the end, or buffer while a batch is open"""
+        pending = self._pending
+        if pending is not None:
+            # Consecutive runs with the same tags share one chunk, and so one tag range
+            if pending and pending[-1] == tags:
+                pending[-2] += text
+            else:
+                pending.extend((text, tags))
+        else:
+            self.insert(tk.END, text, tags)
     
     def add_heading(self, text: str, level: int = 1):
         """Add a styled heading."""
@@ -187,13 +244,13 @@ class RichTextWidget(tk.Text):
         else:
             tag = 'h3'
         
-        self.insert(tk.END, text + '\n', tag)
+        self._insert(text + '\n', tag)
     
     def add_text(self, text: str, tags: Optional[List[str]] = None):
         """Add text with optional styling tags."""
         if tags is None:
             tags = []
-        self.insert(tk.END, text, tags)
+        self._insert(text, tags)
     
     def add_line(self, text: str = "", tags: Optional[List[str]] = None):
         """Add a line of text with newline."""
@@ -254,7 +311,8 @@ class RichTextWidget(tk.Text):
 
         table_widget.pack(fill=tk.BOTH, expand=True)
 
-        # Insert the table frame into the text widget
+        # Insert the table frame into the text widget, after any buffered text
+        self._flush()
         self.window_create(tk.END, window=table_frame)
         self.add_line()  # Add spacing after table
     
@@ -277,4 +335,5 @@ class RichTextWidget(tk.Text):
     
     def finalize(self):
         """Finalize the text widget (disable editing)."""
+        self.end_batch()
         self.config(state=tk.DISABLED)
\ No newline at end of file
@@ -0,0 +1,213 @@
+"""
+Virtual Treeview widget for MCSR Stats Browser.
+Keeps every row in Python and only materialises the visible window as Tk items,
+so large match lists open and scroll in time proportional to the window height.
+"""
+
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+from typing import Callable, List, Optional, Sequence
+
+
+class VirtualTreeview(ttk.Treeview):
+    """Treeview that renders only the rows currently scrolled into view."""
+
+    def __init__(self, parent, **kwargs):
+        """
+        Initialize VirtualTreeview.
+
+        Args:
+            parent: Parent tkinter widget
+            **kwargs: Additional arguments passed to ttk.Treeview
+        """
+        super().__init__(parent, **kwargs)
+
+        self._rows: List[Sequence] = []     # Row values in display order
+        self._iids: List[str] = []          # Stable item id for each row
+        self._positions = {}                # iid -> index into _rows
+        self._first = 0                     # Index of the top visible row
+        self._selected: Optional[str] = None  # iid of the selected row, kept while scrolled away
+        self._rendered = {}                 # iid -> values of the Tk items currently shown
+        self._scrollbar = None
+        self._select_callback: Optional[Callable] = None
+
+        self.bind('<Configure>', lambda e: self._render())
+        self.bind('<Map>', lambda e: self._render())  # e.g. rows set while its tab was hidden
+        self.bind('<MouseWheel>', self._on_mousewheel)
+        self.bind('<Button-4>', lambda e: self._scroll_by(-3))
+        self.bind('<Button-5>', lambda e: self._scroll_by(3))
+        self.bind('<Up>', lambda e: self._move_selection(-1))
+        self.bind('<Down>', lambda e: self._move_selection(1))
+        self.bind('<Prior>', lambda e: self._move_selection(-self._visible_count()))
+        self.bind('<Next>', lambda e: self._move_selection(self._visible_count()))
+        self.bind('<<TreeviewSelect>>', self._on_select)
+
+    def attach_scrollbar(self, scrollbar: ttk.Scrollbar):
+        """Drive a vertical scrollbar from the virtual row window."""
+        self._scrollbar = scrollbar
+        scrollbar.configure(command=self.yview_rows)
+
+    def on_select(self, callback: Callable):
+        """Register a <<TreeviewSelect>> handler, called only when the selected row changes."""
+        self._select_callback = callback
+
+    def set_rows(self, rows: Sequence[Sequence], iids: Optional[Sequence[str]] = None,
+                 keep_selection: bool = False):
+        """
+        Replace the table contents.
+
+        Args:
+            rows: Row value tuples in display order
+            iids: Item ids for the rows, defaults to their string indices
+            keep_selection: Keep the selected iid and scroll position, e.g. when
+                the same rows are only being reordered
+        """
+        rows = list(rows)
+        if not rows and not self._rows:
+            return  # Clearing an empty table, e.g. back-to-back _clear_display calls
+        self._rows = rows
+        self._iids = list(iids) if iids is not None else [str(i) for i in range(len(self._rows))]
+        self._positions = {iid: i for i, iid in enumerate(self._iids)}
+        if not keep_selection or self._selected not in self._positions:
+            self._selected = None
+            self._first = 0
+        self._render()
+
+    def row_ids(self) -> List[str]:
+        """Item ids of all rows in display order, rendered or not."""
+        return list(self._iids)
+
+    def yview_rows(self, *args):
+        """Scrollbar command: handle 'moveto' and 'scroll' against the full row list."""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self._first = int(float(args[1]) * len(self._rows))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self._visible_count()
+            self._first += step
+        self._render()
+
+    def _visible_count(self) -> int:
+        """Number of rows that fit in the widget, plus one partially shown row"""
+        if self.winfo_ismapped():
+            height = self.winfo_height()
+            children = self.get_children()
+            bbox = self.bbox(children[0]) if children else None
+            if bbox:
+                _, top, _, row_height = bbox
+                if row_height > 0:
+                    return max(1, (height - top) // row_height + 1)
+            # No item to measure yet: estimate from the style's row height, which
+            # slightly overcounts since the heading is not subtracted
+            row_height = self._style_row_height()
+            if height > 1 and row_height > 0:
+                return max(1, height // row_height + 1)
+        return int(self.cget('height'))
+
+    def _style_row_height(self) -> int:
+        """Row height from the ttk style, or the default font's line height if it sets none"""
+        style = ttk.Style(self)
+        name = self.cget('style') or 'Treeview'
+        try:
+            return int(style.lookup(name, 'rowheight'))
+        except (TypeError, ValueError, tk.TclError):
+            font = style.lookup(name, 'font') or 'TkDefaultFont'
+            return tkfont.Font(self, font=font).metrics('linespace')
+
+    def _render(self, remeasure: bool = True):
+        """Swap the Tk items for the rows in the current window"""
+        count = self._visible_count()
+        total = len(self._rows)
+        self._first = max(0, min(self._first, total - count))
+        first = self._first
+        last = min(total, first + count)
+
+        # Only touch the items that changed: scrolling a few rows deletes and
+        # inserts just those rows, and a re-sort moves items instead of recreating them
+        rows = self._rows
+        wanted = self._iids[first:last]
+        window = {iid: rows[i] for i, iid in enumerate(wanted, first)}
+        rendered = self._rendered
+        stale = [iid for iid, values in rendered.items() if window.get(iid) is not values]
+        if stale:
+            self.delete(*stale)
+            for iid in stale:
+                del rendered[iid]
+
+        kept = [iid for iid in wanted if iid in rendered]
+        if list(self.get_children()) != kept:
+            move = self.move
+            for index, iid in enumerate(kept):
+                move(iid, '', index)
+
+        # Inserting in window order with explicit iids puts each new row at its final index
+        insert = self.insert
+        inserted = False
+        for index, iid in enumerate(wanted):
+            if iid not in rendered:
+                values = window[iid]
+                insert('', index, iid=iid, values=values)
+                rendered[iid] = values
+                inserted = True
+
+        # The count may have been estimated without an item to measure; once
+        # there is one, render again if the real window size differs
+        if remeasure and inserted and self._visible_count() != count:
+            self._render(remeasure=False)
+            return
+
+        selected = self._selected
+        if selected is not None and first <= self._positions[selected] < last:
+            self.selection_set(selected)
+
+        if self._scrollbar is not None:
+            if total:
+                self._scrollbar.set(first / total, last / total)
+            else:
+                self._scrollbar.set(0.0, 1.0)
+
+    def _scroll_by(self, rows: int):
+        """Scroll the window by a number of rows"""
+        self._first += rows
+        self._render()
+        return 'break'
+
+    def _on_mousewheel(self, event):
+        """Scroll three rows per wheel notch"""
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _move_selection(self, step: int):
+        """Keyboard navigation across the full row list, scrolling as needed"""
+        if not self._rows:
+            return 'break'
+        # Tk's selection is updated synchronously, unlike _selected which waits
+        # for <<TreeviewSelect>>, so it stays correct under key repeat
+        selection = self.selection()
+        current = selection[0] if selection else self._selected
+        if current not in self._positions:
+            index = self._first
+        else:
+            index = max(0, min(len(self._rows) - 1, self._positions[current] + step))
+
+        count = self._visible_count() - 1  # Keep the target off the partial row
+        if index < self._first:
+            self._first = index
+        elif index >= self._first + count:
+            self._first = index - count + 1
+
+        self._render()
+        self.selection_set(self._iids[index])
+        return 'break'
+
+    def _on_select(self, event):
+        """Track the selection and forward genuine changes to the registered handler"""
+        selection = self.selection()
+        if not selection or selection[0] == self._selected:
+            return
+        self._selected = selection[0]
+        if self._select_callback is not None:
+            self._select_callback(event)
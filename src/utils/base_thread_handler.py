@@ -29,7 +29,7 @@ class BaseThreadHandler:
                             work_func: Callable,
                             success_callback: Callable[[Any], None],
                             error_callback: Callable[[str], None],
-                            progress_callback: Optional[Callable[[str], None]] = None):
+                            progress_callback: Optional[Callable[..., None]] = None):
         """
         Execute a function in a background thread with proper error handling
         and thread-safe UI updates.
@@ -61,21 +61,38 @@ class BaseThreadHandler:
         thread.start()
     
     def create_progress_callback(self, 
-                               progress_method: Optional[Callable[[str], None]] = None) -> Callable[[str], None]:
+                               progress_method: Optional[Callable[[str], None]] = None) -> Callable[..., None]:
         """
         Create a thread-safe progress callback function.
         
+        The callback takes a %-style template plus its arguments. Updates are
+        coalesced: only the most recent one is formatted and shown when the
+        main thread gets to it, so intermediate messages are never built.
+        
         Args:
             progress_method: Custom progress method, defaults to UI._update_loading_progress
             
         Returns:
-            Thread-safe progress callback function
+            Thread-safe progress callback function taking (template, *args)
         """
         if progress_method is None:
             progress_method = getattr(self.ui, '_update_loading_progress', lambda msg: None)
         
-        def progress_update(message: str):
-            self.ui.root.after(0, lambda msg=message: progress_method(msg))
+        lock = threading.Lock()
+        pending = {'latest': None}  # Most recent (template, args) not yet shown
+        
+        def pump():
+            with lock:
+                template, args = pending['latest']
+                pending['latest'] = None
+            progress_method(template % args if args else template)
+        
+        def progress_update(template: str, *args):
+            with lock:
+                needs_schedule = pending['latest'] is None
+                pending['latest'] = (template, args)
+            if needs_schedule:
+                self.ui.root.after(0, pump)
         
         return progress_update
     
@@ -25,6 +25,20 @@ class FilterManager:
         """
         self.ui = ui_context
     
+    def get_filter_values(self) -> tuple:
+        """
+        Get the sidebar filter values without a Tcl round-trip per variable.
+        
+        Returns:
+            Tuple of (include_private, season, seed type); include_private is
+            None when the UI has no private-rooms toggle
+        """
+        state = getattr(self.ui, '_filter_state', None)
+        if state is not None:
+            return state
+        include_private = self.ui.include_private_var.get() if hasattr(self.ui, 'include_private_var') else None
+        return include_private, self.ui.season_var.get(), self.ui.seed_filter_var.get()
+    
     def build_filter_kwargs(self, completed_only: bool = False) -> Dict[str, Any]:
         """
         Build filter parameters from current UI state.
@@ -36,9 +50,9 @@ class FilterManager:
             Dictionary of filter parameters for analyzer.filter_matches()
         """
         filter_kwargs = {}
+        include_private, season_filter, seed_filter = self.get_filter_values()
         
         # Season filter
-        season_filter = self.ui.season_var.get()
         if season_filter != 'All':
             try:
                 filter_kwargs['seasons'] = [int(season_filter)]
@@ -46,13 +60,12 @@ class FilterManager:
                 pass
         
         # Seed type filter  
-        seed_filter = self.ui.seed_filter_var.get()
         if seed_filter != 'All':
             filter_kwargs['seed_types'] = [seed_filter]
         
         # Private rooms filter
-        if hasattr(self.ui, 'include_private_var'):
-            filter_kwargs['include_private_rooms'] = self.ui.include_private_var.get()
+        if include_private is not None:
+            filter_kwargs['include_private_rooms'] = include_private
         
         # Completion filter
         if completed_only:
@@ -82,6 +95,22 @@ class FilterManager:
         
         return filter_kwargs
     
+    def get_filter_key(self, completed_only: bool = False) -> tuple:
+        """
+        Build a hashable signature of the current filter state.
+        
+        Args:
+            completed_only: Whether to include only completed matches
+            
+        Returns:
+            Tuple of sorted (name, value) filter pairs, suitable as a cache key
+        """
+        filter_kwargs = self.build_filter_kwargs(completed_only=completed_only)
+        return tuple(sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in filter_kwargs.items()
+        ))
+    
     def get_filtered_matches(self, analyzer, completed_only: bool = True):
         """
         Get filtered matches from analyzer using current filter state.
@@ -135,12 +164,11 @@ class FilterManager:
             String describing current active filters, or empty string if none
         """
         filters = []
+        _, season_filter, seed_filter = self.get_filter_values()
         
-        season_filter = self.ui.season_var.get()
         if season_filter != 'All':
             filters.append(f"Season {season_filter}")
             
-        seed_filter = self.ui.seed_filter_var.get()
         if seed_filter != 'All':
             filters.append(f"Seed: {seed_filter}")
         
@@ -6,10 +6,111 @@ based on the player's historical segment averages.
 """
 
 from typing import List, Dict, Optional, Tuple
+import bisect
 import statistics
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from ..core.match import Match
 from ..core.segment_constants import SEGMENT_ORDER
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to a vectorised NumPy window
+    njit = None
+
+
+def _percentile_of_sorted(sorted_data, percentile):
+    """Linear-interpolation percentile of an already sorted array, written for numba"""
+    n = sorted_data.shape[0]
+    if percentile <= 0:
+        return sorted_data[0]
+    if percentile >= 100:
+        return sorted_data[n - 1]
+
+    index = (percentile / 100.0) * (n - 1)
+    lower_index = int(index)
+    upper_index = min(lower_index + 1, n - 1)
+    if lower_index == upper_index:
+        return sorted_data[lower_index]
+
+    weight = index - lower_index
+    return sorted_data[lower_index] * (1 - weight) + sorted_data[upper_index] * weight
+
+
+def _rolling_percentile_kernel(segment_times, window, percentile, min_count):
+    """Percentile of the non-NaN values in each trailing window, written for numba"""
+    n = segment_times.shape[0]
+    out = np.full(n + 1, np.nan)
+    buf = np.empty(window)
+    for end in range(n + 1):
+        count = 0
+        for i in range(max(0, end - window), end):
+            x = segment_times[i]
+            if not np.isnan(x):
+                buf[count] = x
+                count += 1
+        if count > 0 and count >= min_count:
+            out[end] = _percentile_of_sorted(np.sort(buf[:count]), percentile)
+    return out
+
+
+def _rolling_percentile_numpy(segment_times, window, percentile, min_count):
+    """Same results as the kernel, sorting every window in one NumPy call"""
+    n = segment_times.shape[0]
+    out = np.full(n + 1, np.nan)
+    # Window `end` covers segment_times[end - window:end]; front padding keeps
+    # the short leading windows the same shape, and NaNs sort to the back
+    padded = np.concatenate((np.full(window, np.nan), segment_times))
+    windows = np.sort(sliding_window_view(padded, window), axis=1)
+    counts = window - np.isnan(windows).sum(axis=1)
+
+    rows = np.flatnonzero(counts >= max(min_count, 1))
+    if rows.size == 0:
+        return out
+    counts = counts[rows]
+    windows = windows[rows]
+    ar = np.arange(rows.size)
+
+    if percentile <= 0:
+        out[rows] = windows[:, 0]
+    elif percentile >= 100:
+        out[rows] = windows[ar, counts - 1]
+    else:
+        index = (percentile / 100.0) * (counts - 1)
+        lower = index.astype(np.intp)
+        upper = np.minimum(lower + 1, counts - 1)
+        weight = index - lower
+        lo = windows[ar, lower]
+        hi = windows[ar, upper]
+        out[rows] = np.where(lower == upper, lo, lo * (1 - weight) + hi * weight)
+    return out
+
+
+if njit is not None:
+    _percentile_of_sorted = njit(cache=True)(_percentile_of_sorted)
+    _rolling_percentile_impl = njit(cache=True)(_rolling_percentile_kernel)
+else:
+    _rolling_percentile_impl = _rolling_percentile_numpy
+
+
+def _rolling_percentile(segment_times: np.ndarray, window: int, percentile: float,
+                        min_count: int = 1) -> np.ndarray:
+    """
+    Rolling percentile over the trailing window of a series of segment times.
+
+    Args:
+        segment_times: Times in chronological order, NaN where a row has no time
+        window: Number of trailing rows in each window
+        percentile: Percentile to calculate (0-100)
+        min_count: Minimum number of non-NaN times a window needs
+
+    Returns:
+        Array of length len(segment_times) + 1 where entry i is the percentile of
+        the window ending before row i, or NaN if it has too few times
+    """
+    return _rolling_percentile_impl(np.ascontiguousarray(segment_times, dtype=np.float64),
+                                    window, float(percentile), min_count)
+
 
 class SpeedrunForecaster:
     """
@@ -33,6 +134,56 @@ class SpeedrunForecaster:
         self.matches = sorted(matches, key=lambda m: m.date)
         self.rolling_window = rolling_window
         self.percentile = percentile
+        self._build_history()
+
+    def _build_history(self):
+        """Precompute per-match lookups and the rolling percentile tables in one pass"""
+        self._index_by_id = {}  # Match id -> first index in self.matches
+        for i, m in enumerate(self.matches):
+            self._index_by_id.setdefault(m.id, i)
+        self._dates = [m.date for m in self.matches]
+
+        # Completed matches with segment data are the only history forecasts draw on
+        history = [m for m in self.matches if m.user_completed and m.has_detailed_data]
+        self._history_ends = np.cumsum([0] + [m.user_completed and m.has_detailed_data
+                                              for m in self.matches])
+
+        n_segments = len(SEGMENT_ORDER)
+        absolute_times = np.full((len(history), n_segments), np.nan)
+        split_times = np.full((len(history), n_segments), np.nan)
+        for row, m in enumerate(history):
+            segments = m.segments
+            for col, segment in enumerate(SEGMENT_ORDER):
+                data = segments.get(segment) if segments else None
+                if data is None:
+                    continue
+                if 'absolute_time' in data:
+                    absolute_times[row, col] = data['absolute_time']
+                if 'split_time' in data and data['split_time'] > 0:
+                    split_times[row, col] = data['split_time']
+
+        # Row h holds the percentiles over the last rolling_window history matches before h
+        window = max(self.rolling_window, 1)
+        self._rolling_table = np.column_stack([
+            _rolling_percentile(absolute_times[:, col], window, self.percentile, min_count=3)
+            for col in range(n_segments)
+        ]) if n_segments else np.empty((len(history) + 1, 0))
+
+        # Split fallbacks window over the valid splits only, so compact each column first
+        self._split_tables = []
+        for col in range(n_segments):
+            column = split_times[:, col]
+            valid = ~np.isnan(column)
+            ends = np.concatenate(([0], np.cumsum(valid)))
+            values = column[valid]
+            self._split_tables.append((ends, values, _rolling_percentile(values, window, self.percentile)))
+
+        self._percentile_cache = {}  # History count -> rolling percentiles dict
+
+    def _history_count(self, match: Match, up_to_index: int) -> int:
+        """Number of completed detailed matches before both up_to_index and the match date"""
+        end = min(up_to_index, bisect.bisect_left(self._dates, match.date))
+        return int(self._history_ends[max(end, 0)])
     
     def _calculate_rolling_percentiles(self, match: Match, up_to_index: int) -> Dict[str, float]:
         """
@@ -45,68 +196,18 @@ class SpeedrunForecaster:
         Returns:
             Dict mapping segment names to rolling percentile absolute times in milliseconds
         """
-        # Get completed matches before this match's date
-        historical_matches = []
-        for i in range(up_to_index):
-            historical_match = self.matches[i]
-            if (historical_match.user_completed and 
-                historical_match.has_detailed_data and 
-                historical_match.date < match.date):
-                historical_matches.append(historical_match)
-        
-        # Use only the most recent matches within the rolling window
-        if len(historical_matches) > self.rolling_window:
-            historical_matches = historical_matches[-self.rolling_window:]
-        
-        # Calculate rolling percentiles for each segment
-        rolling_percentiles = {}
-        for segment in SEGMENT_ORDER:
-            segment_times = []
-            for hist_match in historical_matches:
-                if segment in hist_match.segments and 'absolute_time' in hist_match.segments[segment]:
-                    segment_times.append(hist_match.segments[segment]['absolute_time'])
-            
-            # Need at least 3 data points for reliable percentile calculation
-            if len(segment_times) >= 3:
-                rolling_percentiles[segment] = self._calculate_percentile(segment_times, self.percentile)
+        count = self._history_count(match, up_to_index)
+        rolling_percentiles = self._percentile_cache.get(count)
+        if rolling_percentiles is None:
+            # Segments with fewer than 3 data points in the window are NaN in the table
+            row = self._rolling_table[count]
+            rolling_percentiles = {segment: float(row[col])
+                                   for col, segment in enumerate(SEGMENT_ORDER)
+                                   if not np.isnan(row[col])}
+            self._percentile_cache[count] = rolling_percentiles
         
         return rolling_percentiles
     
-    def _calculate_percentile(self, data: List[float], percentile: float) -> float:
-        """
-        Calculate percentile from a list of values.
-        
-        Args:
-            data: List of numeric values
-            percentile: Percentile to calculate (0-100)
-            
-        Returns:
-            Percentile value
-        """
-        if not data:
-            return 0.0
-        
-        sorted_data = sorted(data)
-        n = len(sorted_data)
-        
-        # Handle edge cases
-        if percentile <= 0:
-            return sorted_data[0]
-        if percentile >= 100:
-            return sorted_data[-1]
-        
-        # Calculate percentile using linear interpolation
-        index = (percentile / 100.0) * (n - 1)
-        lower_index = int(index)
-        upper_index = min(lower_index + 1, n - 1)
-        
-        if lower_index == upper_index:
-            return sorted_data[lower_index]
-        
-        # Linear interpolation between the two closest values
-        weight = index - lower_index
-        return sorted_data[lower_index] * (1 - weight) + sorted_data[upper_index] * weight
-    
     def _get_last_completed_segment(self, match: Match) -> Tuple[Optional[str], Optional[int]]:
         """
         Find the last completed segment and its absolute time for an incomplete match.
@@ -154,11 +255,7 @@ class SpeedrunForecaster:
             return None
         
         # Find the match index in our sorted list
-        match_index = None
-        for i, m in enumerate(self.matches):
-            if m.id == match.id:
-                match_index = i
-                break
+        match_index = self._index_by_id.get(match.id)
         
         if match_index is None:
             return None
@@ -205,9 +302,9 @@ class SpeedrunForecaster:
                                 forecast += split_time
                         else:
                             # Fallback: use historical split times with percentile if available
-                            split_times = self._get_historical_split_times(match, match_index, segment)
-                            if split_times:
-                                forecast += self._calculate_percentile(split_times, self.percentile)
+                            split_percentile = self._split_percentile(match, match_index, segment)
+                            if split_percentile is not None:
+                                forecast += split_percentile
                             else:
                                 return None  # Can't forecast without data
                     else:
@@ -218,36 +315,12 @@ class SpeedrunForecaster:
         
         return int(forecast)
     
-    def _get_historical_split_times(self, current_match: Match, up_to_index: int, segment: str) -> List[float]:
-        """
-        Get historical split times for a specific segment up to a certain date.
-        
-        Args:
-            current_match: The match for which we're calculating forecast
-            up_to_index: Index of the current match in the sorted matches list
-            segment: Segment name
-            
-        Returns:
-            List of split times in milliseconds from matches before current_match
-        """
-        split_times = []
-        
-        # Get completed matches before this match's date
-        for i in range(up_to_index):
-            match = self.matches[i]
-            if (match.user_completed and 
-                match.has_detailed_data and 
-                match.date < current_match.date):
-                if segment in match.segments and 'split_time' in match.segments[segment]:
-                    split_time = match.segments[segment]['split_time']
-                    if split_time > 0:  # Valid split time
-                        split_times.append(split_time)
-        
-        # Use only the most recent split times within the rolling window
-        if len(split_times) > self.rolling_window:
-            split_times = split_times[-self.rolling_window:]
-        
-        return split_times
+    def _split_percentile(self, current_match: Match, up_to_index: int, segment: str) -> Optional[float]:
+        """Percentile of the last rolling_window split times before the match, or None if there are none"""
+        count = self._history_count(current_match, up_to_index)
+        ends, _, table = self._split_tables[SEGMENT_ORDER.index(segment)]
+        value = table[ends[count]]
+        return None if np.isnan(value) else float(value)
     
     def get_forecast_breakdown(self, match: Match) -> Optional[Dict]:
         """
@@ -270,11 +343,7 @@ class SpeedrunForecaster:
             }
         
         # Find the match index in our sorted list
-        match_index = None
-        for i, m in enumerate(self.matches):
-            if m.id == match.id:
-                match_index = i
-                break
+        match_index = self._index_by_id.get(match.id)
         
         if match_index is None:
             return None
@@ -295,13 +364,7 @@ class SpeedrunForecaster:
         remaining_segments = SEGMENT_ORDER[last_segment_index + 1:]
         
         # Count how many historical matches were used for rolling averages
-        historical_count = 0
-        for i in range(match_index):
-            hist_match = self.matches[i]
-            if (hist_match.user_completed and 
-                hist_match.has_detailed_data and 
-                hist_match.date < match.date):
-                historical_count += 1
+        historical_count = self._history_count(match, match_index)
         
         rolling_window_used = min(historical_count, self.rolling_window)
         
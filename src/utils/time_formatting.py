@@ -6,7 +6,9 @@ duplicated across multiple files (text_presenter.py, rich_text_presenter.py,
 segment_analysis.py, match_info_dialog.py).
 """
 
-from typing import Optional
+from typing import List, Optional, Sequence
+
+import numpy as np
 
 
 def format_time_ms_to_string(milliseconds: Optional[int]) -> str:
@@ -27,6 +29,29 @@ def format_time_ms_to_string(milliseconds: Optional[int]) -> str:
     return f'{int(minutes)}:{int(sec_remainder):02d}.{int(milliseconds % 1000):03d}'
 
 
+def format_times_ms_to_strings(milliseconds: Sequence[Optional[float]]) -> List[str]:
+    """
+    Convert several millisecond values to MM:SS.mmm format in one batch.
+    
+    Args:
+        milliseconds: Times in milliseconds, None for missing values
+        
+    Returns:
+        Formatted time strings, matching format_time_ms_to_string
+    """
+    values = np.array(milliseconds, dtype=np.float64).reshape(-1)  # None becomes NaN
+    missing = np.isnan(values)
+    values[missing] = 0.0
+    minutes, sec_remainder = np.divmod(values / 1000, 60)
+    millis = np.mod(values, 1000)
+    texts = [f'{m}:{s:02d}.{ms:03d}' for m, s, ms in zip(minutes.astype(np.int64).tolist(),
+                                                         sec_remainder.astype(np.int64).tolist(),
+                                                         millis.astype(np.int64).tolist())]
+    for i in np.flatnonzero(missing).tolist():
+        texts[i] = "N/A"
+    return texts
+
+
 def format_minutes_to_string(minutes: Optional[float]) -> str:
     """
     Convert decimal minutes to 'Xm Ys' format.
@@ -42,4 +67,20 @@ def format_minutes_to_string(minutes: Optional[float]) -> str:
     
     m = int(minutes)
     s = int((minutes - m) * 60)
-    return f'{m}m {s}s'
\ No newline at end of file
+    return f'{m}m {s}s'
+
+
+def format_minutes_to_strings(minutes: Sequence[float]) -> List[str]:
+    """
+    Convert several decimal minute values to 'Xm Ys' format in one batch.
+    
+    Args:
+        minutes: Times in decimal minutes
+        
+    Returns:
+        Formatted duration strings, matching format_minutes_to_string
+    """
+    values = np.asarray(minutes, dtype=np.float64)
+    whole = np.trunc(values)
+    secs = ((values - whole) * 60).astype(np.int64)
+    return [f'{m}m {s}s' for m, s in zip(whole.astype(np.int64).tolist(), secs.tolist())]
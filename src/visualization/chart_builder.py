@@ -5,10 +5,13 @@ Provides centralized chart creation with consistent styling and user customizati
 
 import matplotlib.pyplot as plt
 import matplotlib.ticker
+import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection, PathCollection
 import math
+import statistics
+import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
-import statistics
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
@@ -136,6 +139,20 @@ class ChartBuilder:
         self.hover_line = None  # Current hover line indicator
         self.time_formatter = None  # Function to format time values for display
         
+        # For blitting overlay text (e.g. a stats box) over a cached background
+        self.blit_artists = []  # Animated artists redrawn on top of the background
+        self.blit_background = None  # Figure pixels without the blit artists
+        self._draw_cid = None  # draw_event connection that refreshes the background
+        
+        # Optional overlays (rolling lines, PB line, ...) that can be toggled by blitting
+        self.overlays = {}  # Maps chart option key to the artists drawn for it
+        self._hidden_hover_data = {}  # Hover data stashed while its overlay is hidden
+        self.grid_axes = []  # Axes styled by set_grid, so show_grid can toggle without a rebuild
+        self.legend_locs = {}  # Maps axes to the loc set_legend placed their legend at
+        
+        # Identifies the chart currently drawn, so a view can refresh its artists in place
+        self.view_key = None  # Set by the view after drawing; cleared with the figure
+        
     def set_theme(self, **kwargs):
         """Update theme colors"""
         self.theme.update(kwargs)
@@ -165,6 +182,13 @@ class ChartBuilder:
         self.comparison_rolling_median_data = {}
         self.hover_tooltip = None
         self.hover_line = None
+        self.blit_artists = []
+        self.blit_background = None
+        self.overlays = {}
+        self._hidden_hover_data = {}
+        self.grid_axes = []
+        self.legend_locs = {}
+        self.view_key = None
         return self
         
     def create_subplots(self, rows: int = 1, cols: int = 1) -> List[plt.Axes]:
@@ -234,6 +258,110 @@ class ChartBuilder:
                 self.scatter_data[ax].append((x, y, match))
         
         return self
+    
+    def update_scatter(self, ax: plt.Axes, collection, x_data, y_data,
+                       match_data: List = None):
+        """Replace the points of an existing scatter plot in place
+        
+        Args:
+            ax: Matplotlib axes the scatter belongs to
+            collection: PathCollection returned by a previous scatter call
+            x_data: New X coordinates
+            y_data: New Y coordinates
+            match_data: Optional list of Match objects corresponding to each point
+        """
+        x_values = np.asarray(ax.convert_xunits(x_data), dtype=float)
+        collection.set_offsets(np.column_stack([x_values, np.asarray(y_data, dtype=float)]))
+        
+        if match_data is not None:
+            self.scatter_data.setdefault(ax, []).extend(zip(x_data, y_data, match_data))
+        
+        return self
+    
+    def update_rolling_average(self, ax: plt.Axes, line, x_data, y_data,
+                               window: int = 10, is_comparison=False) -> bool:
+        """Recompute a rolling average into the line add_rolling_average drew.
+
+        Returns:
+            False if add_rolling_average would not draw a line for this data
+        """
+        return self._update_rolling_stats(ax, line, x_data, y_data, window, statistics.mean,
+                                          is_comparison, 'rolling_avg_data')
+    
+    def update_rolling_median(self, ax: plt.Axes, line, x_data, y_data,
+                              window: int = 10, is_comparison=False) -> bool:
+        """Recompute a rolling median into the line add_rolling_median drew.
+
+        Returns:
+            False if add_rolling_median would not draw a line for this data
+        """
+        return self._update_rolling_stats(ax, line, x_data, y_data, window, statistics.median,
+                                          is_comparison, 'rolling_median_data')
+    
+    def _update_rolling_stats(self, ax: plt.Axes, line, x_data, y_data, window: int,
+                              stat_func, is_comparison: bool, data_storage_key: str) -> bool:
+        """Shared in-place update for the rolling statistic lines"""
+        series = self._rolling_series(x_data, y_data, window, stat_func)
+        if not series or not series[0]:
+            return False
+        rolling_x, rolling_values = series
+        line.set_data(rolling_x, rolling_values)
+        self._store_rolling_data(ax, rolling_x, rolling_values, is_comparison, data_storage_key)
+        return True
+    
+    def update_rolling_std_dev(self, ax: plt.Axes, artists: List, x_data, y_data,
+                               window: int = 10) -> bool:
+        """Recompute rolling std dev bands into the artists add_rolling_std_dev drew.
+
+        Args:
+            ax: Matplotlib axes the bands belong to
+            artists: The upper line, lower line and (optional) fill, in drawing order
+            x_data: New X coordinates
+            y_data: New Y coordinates
+            window: Rolling window size
+
+        Returns:
+            False if add_rolling_std_dev would not draw bands for this data
+        """
+        series = self._rolling_std_series(x_data, y_data, window)
+        if not series or not series[0]:
+            return False
+        rolling_x, rolling_upper, rolling_lower = series
+        upper_line, lower_line, *fill = artists
+        upper_line.set_data(rolling_x, rolling_upper)
+        lower_line.set_data(rolling_x, rolling_lower)
+        if fill and hasattr(fill[0], 'set_data'):
+            # matplotlib >= 3.10 fills keep their own data limits, updated by set_data
+            fill[0].set_data(rolling_x, rolling_lower, rolling_upper)
+        elif fill:
+            # One polygon along the lower bound and back along the upper one
+            x_values = np.asarray(ax.convert_xunits(list(rolling_x)), dtype=float)
+            lower = np.column_stack([x_values, rolling_lower])
+            upper = np.column_stack([x_values, rolling_upper])
+            fill[0].set_verts([np.concatenate([lower, upper[::-1]])])
+        return True
+    
+    def update_pb_line(self, line, x_data, y_data):
+        """Recompute a PB progression into the line add_pb_line drew"""
+        line.set_data(x_data, self._pb_progression(y_data))
+        return self
+    
+    def rescale(self, ax: plt.Axes):
+        """Fit the axis limits to the artists' current data after in-place updates"""
+        ax.relim()
+        # Older matplotlib versions leave collections (scatter points) out of relim
+        for collection in ax.collections:
+            if isinstance(collection, PathCollection) and len(collection.get_offsets()):
+                ax.update_datalim(collection.get_offsets())
+        ax.autoscale_view()
+        return self
+    
+    def clear_axes_data(self, ax: plt.Axes):
+        """Forget click and hover data stored for a single axes"""
+        for store in (self.scatter_data, self.rolling_avg_data, self.rolling_median_data,
+                      self.comparison_rolling_avg_data, self.comparison_rolling_median_data):
+            store.pop(ax, None)
+        return self
         
     def plot_bar(self, ax: plt.Axes, x_data, y_data,
                  color: str = None, label: str = None,
@@ -312,17 +440,41 @@ class ChartBuilder:
             is_comparison: Whether this is comparison player data
             data_storage_key: Key for storing data (e.g., 'rolling_avg_data', 'rolling_median_data')
         """
-        if len(y_data) < 1:
+        series = self._rolling_series(x_data, y_data, window, stat_func, full_x_data, full_y_data)
+        if series is None:
             return self
-        
-        color = color or self.get_color(color_index)
+        rolling_x, rolling_values = series
+
+        if rolling_values and rolling_x:
+            color = color or self.get_color(color_index)
+
+            # Plot the rolling statistics line
+            ax.plot(rolling_x, rolling_values, color=color, linewidth=linewidth,
+                   alpha=alpha, label=label)
+
+            # Store rolling data for hover tooltips if data_storage_key provided
+            if data_storage_key:
+                self._store_rolling_data(ax, rolling_x, rolling_values, is_comparison, data_storage_key)
+
+        return self
+
+    def _rolling_series(self, x_data, y_data, window: int, stat_func,
+                        full_x_data=None, full_y_data=None):
+        """
+        Rolling statistic points for _calculate_rolling_stats, sorted by x.
+
+        Returns:
+            Tuple of (rolling_x, rolling_values), or None if there is too little data
+        """
+        if len(y_data) < 1:
+            return None
         
         # Use full dataset for calculation if provided, otherwise use visible data
         calc_x = full_x_data if full_x_data is not None else x_data
         calc_y = full_y_data if full_y_data is not None else y_data
         
         if len(calc_y) < window and full_y_data is None:
-            return self
+            return None
             
         rolling_values = []
         rolling_x = []
@@ -352,8 +504,9 @@ class ChartBuilder:
                         filtered_values.append(rolling_values[i])
             else:
                 # Numeric filtering for numeric x_data
+                visible_x = set(x_data)
                 for i, x_val in enumerate(rolling_x):
-                    if x_val in x_data:  # Only show points that are in visible data
+                    if x_val in visible_x:  # Only show points that are in visible data
                         filtered_x.append(x_val)
                         filtered_values.append(rolling_values[i])
             
@@ -362,23 +515,19 @@ class ChartBuilder:
 
         if rolling_values and rolling_x:
             rolling_x, rolling_values = self._sort_rolling_data(rolling_x, rolling_values)
+        return rolling_x, rolling_values
 
-            # Plot the rolling statistics line
-            ax.plot(rolling_x, rolling_values, color=color, linewidth=linewidth,
-                   alpha=alpha, label=label)
-
-            # Store rolling data for hover tooltips if data_storage_key provided
-            if data_storage_key:
-                rolling_data = list(zip(rolling_x, rolling_values))
-
-                if is_comparison:
-                    comparison_dict = getattr(self, f"comparison_{data_storage_key}")
-                    comparison_dict[ax] = rolling_data
-                else:
-                    storage_dict = getattr(self, data_storage_key)
-                    storage_dict[ax] = rolling_data
+    def _store_rolling_data(self, ax: plt.Axes, rolling_x, rolling_values,
+                            is_comparison: bool, data_storage_key: str):
+        """Keep a rolling line's points for hover tooltips"""
+        rolling_data = list(zip(rolling_x, rolling_values))
 
-        return self
+        if is_comparison:
+            comparison_dict = getattr(self, f"comparison_{data_storage_key}")
+            comparison_dict[ax] = rolling_data
+        else:
+            storage_dict = getattr(self, data_storage_key)
+            storage_dict[ax] = rolling_data
 
     def _sort_rolling_data(self, x_data, *y_data_lists):
         """
@@ -449,7 +598,6 @@ class ChartBuilder:
                             full_x_data=None, full_y_data=None,
                             is_comparison=False):
         """Add a rolling average line to the chart using shared calculation logic."""
-        import statistics
         label = label or f'{window}-point average'
         return self._calculate_rolling_stats(
             ax, x_data, y_data, window, statistics.mean, color,
@@ -464,7 +612,6 @@ class ChartBuilder:
                           full_x_data=None, full_y_data=None,
                           is_comparison=False):
         """Add a rolling median line to the chart using shared calculation logic."""
-        import statistics
         label = label or f'{window}-point median'
         return self._calculate_rolling_stats(
             ax, x_data, y_data, window, statistics.median, color,
@@ -479,17 +626,45 @@ class ChartBuilder:
                            show_fill: bool = True, color_index: int = 2,
                            full_x_data=None, full_y_data=None):
         """Add rolling standard deviation bands (mean +/- std dev) to the chart"""
-        if len(y_data) < 1:
+        series = self._rolling_std_series(x_data, y_data, window, full_x_data, full_y_data)
+        if series is None:
             return self
+        rolling_x, rolling_upper, rolling_lower = series
 
-        color = color or self.get_color(color_index)
+        if rolling_x and rolling_upper and rolling_lower:
+            color = color or self.get_color(color_index)
+            label = label or f'+/-1 Std Dev ({window}-pt)'
+
+            # Plot upper and lower bounds
+            ax.plot(rolling_x, rolling_upper, color=color, linewidth=linewidth,
+                   alpha=alpha, linestyle='--', label=label)
+            ax.plot(rolling_x, rolling_lower, color=color, linewidth=linewidth,
+                   alpha=alpha, linestyle='--')
+
+            # Optionally fill between the bounds
+            if show_fill:
+                ax.fill_between(rolling_x, rolling_lower, rolling_upper,
+                               color=color, alpha=fill_alpha)
+
+        return self
+
+    def _rolling_std_series(self, x_data, y_data, window: int,
+                            full_x_data=None, full_y_data=None):
+        """
+        Rolling mean +/- std dev band points for add_rolling_std_dev, sorted by x.
+
+        Returns:
+            Tuple of (rolling_x, rolling_upper, rolling_lower), or None if there is too little data
+        """
+        if len(y_data) < 1:
+            return None
 
         # Use full dataset for calculation if provided, otherwise use visible data
         calc_x = full_x_data if full_x_data is not None else x_data
         calc_y = full_y_data if full_y_data is not None else y_data
 
         if len(calc_y) < window and full_y_data is None:
-            return self
+            return None
 
         # Calculate rolling std dev bands
         rolling_upper = []
@@ -500,9 +675,11 @@ class ChartBuilder:
             start_idx = max(0, i - window + 1)
             window_data = calc_y[start_idx:i+1]
 
-            if len(window_data) >= 1:
-                mean = statistics.mean(window_data)
-                std = statistics.stdev(window_data) if len(window_data) > 1 else 0
+            n = len(window_data)
+            if n >= 1:
+                # Plain float formula - statistics.stdev uses exact Fraction arithmetic
+                mean = sum(window_data) / n
+                std = math.sqrt(sum((x - mean) ** 2 for x in window_data) / (n - 1)) if n > 1 else 0
                 rolling_upper.append(mean + std)
                 rolling_lower.append(mean - std)
                 rolling_x.append(calc_x[i])
@@ -517,21 +694,7 @@ class ChartBuilder:
             rolling_x, rolling_upper, rolling_lower = self._sort_rolling_data(
                 rolling_x, rolling_upper, rolling_lower
             )
-
-            label = label or f'+/-1 Std Dev ({window}-pt)'
-
-            # Plot upper and lower bounds
-            ax.plot(rolling_x, rolling_upper, color=color, linewidth=linewidth,
-                   alpha=alpha, linestyle='--', label=label)
-            ax.plot(rolling_x, rolling_lower, color=color, linewidth=linewidth,
-                   alpha=alpha, linestyle='--')
-
-            # Optionally fill between the bounds
-            if show_fill:
-                ax.fill_between(rolling_x, rolling_lower, rolling_upper,
-                               color=color, alpha=fill_alpha)
-
-        return self
+        return rolling_x, rolling_upper, rolling_lower
         
     def add_pb_line(self, ax: plt.Axes, x_data, y_data,
                     color: str = None, linestyle: str = '--',
@@ -539,16 +702,56 @@ class ChartBuilder:
                     label: str = 'PB', color_index: int = 3):
         """Add a personal best progression line"""
         color = color or self.get_color(color_index)
-        
+        ax.plot(x_data, self._pb_progression(y_data), color=color, linestyle=linestyle,
+               linewidth=linewidth, alpha=alpha, label=label)
+        return self
+    
+    @staticmethod
+    def _pb_progression(y_data) -> List[float]:
+        """Running minimum of y_data, i.e. the PB after each point"""
         pb_progression = []
         current_pb = float('inf')
         for val in y_data:
             if val < current_pb:
                 current_pb = val
             pb_progression.append(current_pb)
+        return pb_progression
+        
+    def add_pb_lines(self, ax: plt.Axes, x_series, y_series, labels: List[str],
+                     color_indices: List[int], linestyle: str = '--',
+                     linewidth: float = 1.5, alpha: float = 0.7):
+        """
+        Add several personal best progression lines as a single LineCollection.
+        
+        Args:
+            ax: The matplotlib axes to plot on
+            x_series: One sequence of x values per line
+            y_series: One sequence of y values per line
+            labels: Legend label per line
+            color_indices: Color palette index per line
+        """
+        segments = []
+        colors = []
+        for x_data, y_data, label, color_index in zip(x_series, y_series, labels, color_indices):
+            if len(y_data) == 0:
+                continue
+            color = self.get_color(color_index)
             
-        ax.plot(x_data, pb_progression, color=color, linestyle=linestyle,
-               linewidth=linewidth, alpha=alpha, label=label)
+            # Convert dates etc. the same way ax.plot would
+            ax.xaxis.update_units(x_data)
+            x_values = np.asarray(ax.convert_xunits(x_data), dtype=float)
+            pb_progression = np.minimum.accumulate(np.asarray(y_data, dtype=float))
+            segments.append(np.column_stack((x_values, pb_progression)))
+            colors.append(color)
+            
+            # Empty proxy line so the legend keeps one entry per series
+            ax.plot([], [], color=color, linestyle=linestyle,
+                   linewidth=linewidth, alpha=alpha, label=label)
+        
+        if segments:
+            ax.add_collection(LineCollection(segments, colors=colors, linestyles=linestyle,
+                                             linewidths=linewidth, alpha=alpha))
+            ax.autoscale_view()
         return self
         
     def add_vertical_line(self, ax: plt.Axes, x, color: str = 'red',
@@ -593,6 +796,8 @@ class ChartBuilder:
         
     def set_grid(self, ax: plt.Axes, visible: bool = True, alpha: float = 0.3):
         """Configure grid visibility"""
+        if ax not in self.grid_axes:
+            self.grid_axes.append(ax)
         if visible:
             ax.grid(True, alpha=alpha)
         else:
@@ -634,6 +839,7 @@ class ChartBuilder:
         """Add legend to the axis"""
         ax.legend(facecolor=self.theme['legend_bg'], 
                  labelcolor=self.theme['legend_text'], loc=loc)
+        self.legend_locs[ax] = loc
         return self
         
     def set_xticks(self, ax: plt.Axes, ticks, labels: List[str] = None,
@@ -644,11 +850,157 @@ class ChartBuilder:
             ax.set_xticklabels(labels, rotation=rotation, ha=ha)
         return self
         
+    def set_date_ticks(self, ax: plt.Axes, max_ticks: int = 8,
+                       rotation: float = 0, ha: str = 'center'):
+        """Let matplotlib place and concisely format date ticks on the x-axis"""
+        locator = mdates.AutoDateLocator(maxticks=max_ticks)
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        ax.tick_params(axis='x', labelrotation=rotation)
+        for label in ax.get_xticklabels():
+            label.set_ha(ha)
+        return self
+        
     def set_title(self, title: str, fontsize: int = 14):
         """Set the figure title"""
         self.fig.suptitle(title, color=self.theme['text_color'], fontsize=fontsize)
         return self
     
+    def set_blit_artists(self, *artists):
+        """
+        Draw the given artists as blit overlays so they can change without a full redraw.
+        
+        Every full draw caches the figure background without them and then paints
+        them on top; blit_update() repaints only these artists afterwards.
+        """
+        self.blit_artists = [artist for artist in artists if artist is not None]
+        for artist in self.blit_artists:
+            artist.set_animated(True)
+        if self._draw_cid is None:
+            self._draw_cid = self.canvas.mpl_connect('draw_event', self._on_draw)
+        return self
+    
+    def _on_draw(self, event):
+        """Cache the background and paint the blit overlays after a full draw"""
+        if not self.blit_artists:
+            return
+        # Saving to a file draws through another canvas/renderer (e.g. PDF or SVG),
+        # which has no pixels to cache but still needs the overlays painted
+        if event.canvas is self.canvas and not self.canvas.is_saving():
+            self.blit_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self.blit_artists:
+            artist.draw(event.renderer)
+    
+    def blit_update(self):
+        """Repaint only the blit overlays over the cached background"""
+        if self.blit_background is None:
+            self.canvas.draw_idle()
+            return self
+        self.canvas.restore_region(self.blit_background)
+        for artist in self.blit_artists:
+            self.fig.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
+        return self
+    
+    # Hover data stores that belong to each toggleable overlay
+    OVERLAY_HOVER_STORAGE = {
+        'show_rolling_avg': ('rolling_avg_data', 'comparison_rolling_avg_data'),
+        'show_rolling_median': ('rolling_median_data', 'comparison_rolling_median_data'),
+    }
+    
+    def overlay_mark(self, ax: plt.Axes) -> tuple:
+        """Remember how many lines/collections ax has, to pass to register_overlay"""
+        return len(ax.lines), len(ax.collections)
+    
+    def register_overlay(self, key: str, ax: plt.Axes, mark: tuple):
+        """
+        Record the artists added to ax since overlay_mark() as the overlay for a chart option.
+        
+        Args:
+            key: chart_options key that shows/hides the overlay (e.g. 'show_pb_line')
+            ax: Axes the overlay was drawn on
+            mark: Value returned by overlay_mark() before drawing it
+        """
+        lines, collections = mark
+        artists = list(ax.lines[lines:]) + list(ax.collections[collections:])
+        if artists:
+            self.overlays.setdefault(key, []).extend(artists)
+        return self
+    
+    def enable_overlay_blitting(self, ax: plt.Axes):
+        """Draw the registered overlays and the legend of ax as blit artists"""
+        overlay_artists = [a for artists in self.overlays.values() for a in artists]
+        if overlay_artists:
+            self.set_blit_artists(*overlay_artists, ax.get_legend())
+        return self
+    
+    def toggle_overlays(self, states: Dict[str, bool]) -> bool:
+        """
+        Show or hide registered overlays and repaint them with a blit.
+        
+        A show_grid change is applied to the axes set_grid styled and redrawn
+        without rebuilding the chart.
+        
+        Args:
+            states: Maps chart option keys to their new on/off state
+            
+        Returns:
+            False if an overlay to show was never drawn (the caller must rebuild
+            the chart), True if the toggle was handled here
+        """
+        states = dict(states)
+        show_grid = states.pop('show_grid', None)
+        if show_grid is not None:
+            # Log scale keeps its tick grid on, so only a rebuild applies it there
+            if not self.grid_axes or any(ax.get_yscale() == 'log' for ax in self.grid_axes):
+                return False
+        if (not states and show_grid is None) or any(key not in self.overlays for key in states):
+            return False
+        
+        axes = set()
+        for key, visible in states.items():
+            for artist in self.overlays[key]:
+                artist.set_visible(visible)
+                axes.add(artist.axes)
+            
+            # Hide rolling data from the hover tooltip along with its line
+            for storage_name in self.OVERLAY_HOVER_STORAGE.get(key, ()):
+                storage = getattr(self, storage_name)
+                for ax in axes:
+                    stash_key = (storage_name, ax)
+                    if visible and stash_key in self._hidden_hover_data:
+                        storage[ax] = self._hidden_hover_data.pop(stash_key)
+                    elif not visible and ax in storage:
+                        self._hidden_hover_data[stash_key] = storage.pop(ax)
+        
+        # Rebuild each legend from the artists that are still visible
+        for ax in axes:
+            old_legend = ax.get_legend()
+            if old_legend is None:
+                continue
+            handles, labels = ax.get_legend_handles_labels()
+            visible = [(h, l) for h, l in zip(handles, labels) if h.get_visible()]
+            loc = self.legend_locs.get(ax, 'best')
+            if visible:
+                new_legend = ax.legend(*zip(*visible), facecolor=self.theme['legend_bg'],
+                                       labelcolor=self.theme['legend_text'], loc=loc)
+            else:
+                # Keep an (empty, hidden) legend so it can come back on the next toggle
+                new_legend = ax.legend([], [], loc=loc)
+                new_legend.set_visible(False)
+            new_legend.set_animated(True)
+            self.blit_artists = [new_legend if a is old_legend else a for a in self.blit_artists]
+        
+        if show_grid is not None:
+            # The grid is part of the cached background, so it needs a full draw;
+            # the data artists are reused as they are
+            for ax in self.grid_axes:
+                self.set_grid(ax, show_grid)
+            self.canvas.draw_idle()
+        else:
+            self.blit_update()
+        return True
+    
     def enable_match_click_detection(self, callback_func):
         """
         Enable click detection on scatter points for match info
@@ -904,7 +1256,7 @@ class ChartBuilder:
         # Redraw canvas
         self.canvas.draw_idle()
     
-    def _clear_hover_elements(self):
+    def _clear_hover_elements(self, redraw: bool = True):
         """Clear hover tooltip and line"""
         try:
             if self.hover_tooltip:
@@ -921,15 +1273,18 @@ class ChartBuilder:
             self.hover_line = None
         
         # Redraw canvas
+        if not redraw:
+            return
         try:
             self.canvas.draw_idle()
         except Exception:
             pass
         
     def finalize(self):
-        """Apply tight layout and draw the canvas"""
+        """Apply tight layout and schedule a canvas redraw"""
         self.fig.tight_layout()
-        self.canvas.draw()
+        # draw_idle coalesces with any other redraw requested before Tk goes idle
+        self.canvas.draw_idle()
         return self
         
     def build_from_config(self, config: FigureConfig):
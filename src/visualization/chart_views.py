@@ -5,7 +5,6 @@ Handles all chart rendering views for MCSR Ranked Stats Browser.
 
 import tkinter as tk
 from tkinter import messagebox
-import matplotlib.pyplot as plt
 import statistics
 from typing import Optional, List, Dict, Any
 from .match_info_dialog import show_match_info_dialog
@@ -112,9 +111,7 @@ class ChartViewBase:
     
     def _get_filter_settings(self) -> Dict[str, Any]:
         """Get current filter settings for consistent data filtering across chart types"""
-        include_private = self.ui.include_private_var.get()
-        season_filter = self.ui.season_var.get()
-        seed_filter = self.ui.seed_filter_var.get()
+        include_private, season_filter, seed_filter = self.ui.filter_manager.get_filter_values()
         
         return {
             'include_private': include_private,
@@ -247,21 +244,69 @@ class ProgressionChart(ChartViewBase):
         
         # Use ChartBuilder
         cb = self.ui.chart_builder
+        comparison = self.ui.comparison_active and self.ui.comparison_analyzer
+        
+        # The single player chart is refreshed in place when only its data changed
+        window = self.ui.chart_options['rolling_window']
+        view_key = ('progression', self.ui.analyzer.username, use_match_numbers,
+                    tuple(sorted(self.ui.chart_options.items())), len(times) >= window)
+        if not comparison and cb.view_key == view_key:
+            if self._update_single_chart(cb, x_data, times, completed):
+                return
+        
         cb.clear()
         cb.set_palette(self.ui.chart_options['color_palette'])
         
         ax = cb.get_subplot(1, 1, 1)
         
         # Check if comparison is active
-        if self.ui.comparison_active and self.ui.comparison_analyzer:
+        if comparison:
             self._show_comparison_chart(cb, ax, x_data, times, completed, x_label, use_match_numbers)
             return
         
         # Single player view
         self._show_single_chart(cb, ax, x_data, times, completed, x_label, use_match_numbers)
+        cb.view_key = view_key
+    
+    def _update_single_chart(self, cb, x_data, times, matches) -> bool:
+        """
+        Swap new data into the single player chart already on screen.
+        
+        Keeps the axes, labels, legend and event hookups and only updates the
+        scatter points and overlay lines, instead of rebuilding the figure.
+        
+        Returns:
+            False if the chart has to be rebuilt instead
+        """
+        ax = cb.fig.axes[0]
+        overlays = cb.overlays
+        window = self.ui.chart_options['rolling_window']
+        
+        cb._clear_hover_elements(redraw=False)  # finalize() below redraws
+        cb.clear_axes_data(ax)
+        cb.update_scatter(ax, ax.collections[0], x_data, times, match_data=matches)
+        
+        if 'show_rolling_std' in overlays:
+            if not cb.update_rolling_std_dev(ax, overlays['show_rolling_std'], x_data, times, window=window):
+                return False
+        if 'show_rolling_avg' in overlays:
+            if not cb.update_rolling_average(ax, overlays['show_rolling_avg'][0], x_data, times, window=window):
+                return False
+        if 'show_rolling_median' in overlays:
+            if not cb.update_rolling_median(ax, overlays['show_rolling_median'][0], x_data, times, window=window):
+                return False
+        if 'show_pb_line' in overlays:
+            cb.update_pb_line(overlays['show_pb_line'][0], x_data, times)
+        
+        cb.rescale(ax)
+        cb.set_log_scale(ax, self.ui.chart_options['log_scale'], self.ui._minutes_to_str)
+        cb.finalize()
+        return True
     
     def _show_comparison_chart(self, cb, ax, x_data, times, completed, x_label, use_match_numbers):
         """Show progression chart with comparison player"""
+        import matplotlib.pyplot as plt
+
         # Get comparison data with same filtering as main player
         comp_completed = sorted([m for m in self.ui._get_filtered_comparison_matches() 
                                 if not m.forfeited and m.match_time is not None], 
@@ -302,13 +347,16 @@ class ProgressionChart(ChartViewBase):
         
         # Rolling standard deviation bands (if enabled) - draw first so avg line is on top
         if self.ui.chart_options['show_rolling_std']:
+            mark = cb.overlay_mark(ax)
             cb.add_rolling_std_dev(ax, x_data, times, window=window,
                                    color=main_color, fill_alpha=0.15)
             cb.add_rolling_std_dev(ax, comp_x_data, comp_times, window=window,
                                    color=comp_color, fill_alpha=0.15)
+            cb.register_overlay('show_rolling_std', ax, mark)
         
         # Rolling average (if enabled)
         if self.ui.chart_options['show_rolling_avg']:
+            mark = cb.overlay_mark(ax)
             cb.add_rolling_average(ax, x_data, times, window=window, 
                                   color=main_color,
                                   label=f'{self.ui.analyzer.username} avg',
@@ -317,9 +365,11 @@ class ProgressionChart(ChartViewBase):
                                   color=comp_color,
                                   label=f'{self.ui.comparison_analyzer.username} avg',
                                   is_comparison=True)
+            cb.register_overlay('show_rolling_avg', ax, mark)
         
         # Rolling median (if enabled)
         if self.ui.chart_options['show_rolling_median']:
+            mark = cb.overlay_mark(ax)
             cb.add_rolling_median(ax, x_data, times, window=window, 
                                  color=main_color,
                                  label=f'{self.ui.analyzer.username} median',
@@ -328,19 +378,23 @@ class ProgressionChart(ChartViewBase):
                                  color=comp_color,
                                  label=f'{self.ui.comparison_analyzer.username} median',
                                  is_comparison=True)
+            cb.register_overlay('show_rolling_median', ax, mark)
         
         # PB lines (if enabled)
         if self.ui.chart_options['show_pb_line']:
+            mark = cb.overlay_mark(ax)
             cb.add_pb_line(ax, x_data, times, color=main_color, 
                           label=f'{self.ui.analyzer.username} PB')
             cb.add_pb_line(ax, comp_x_data, comp_times, color=comp_color,
                           label=f'{self.ui.comparison_analyzer.username} PB')
+            cb.register_overlay('show_pb_line', ax, mark)
         
         cb.set_labels(ax, title=f'Progression Comparison: {self.ui.analyzer.username} vs {self.ui.comparison_analyzer.username}',
                     xlabel=x_label, ylabel='Time (minutes)')
         cb.set_grid(ax, self.ui.chart_options['show_grid'])
         cb.set_log_scale(ax, self.ui.chart_options['log_scale'], self.ui._minutes_to_str)
         cb.set_legend(ax)
+        cb.enable_overlay_blitting(ax)
 
         # Only rotate labels for date mode
         if not use_match_numbers:
@@ -356,6 +410,8 @@ class ProgressionChart(ChartViewBase):
 
     def _show_single_chart(self, cb, ax, x_data, times, matches, x_label, use_match_numbers):
         """Show progression chart for single player"""
+        import matplotlib.pyplot as plt
+
         # Scatter plot
         cb.plot_scatter(ax, x_data, times, 
                        label='Individual matches',
@@ -364,27 +420,35 @@ class ProgressionChart(ChartViewBase):
         
         # Rolling standard deviation bands (if enabled) - draw first so avg line is on top
         if self.ui.chart_options['show_rolling_std']:
+            mark = cb.overlay_mark(ax)
             window = self.ui.chart_options['rolling_window']
             cb.add_rolling_std_dev(ax, x_data, times, window=window,
                                    label=f'±1σ ({window}-pt)')
+            cb.register_overlay('show_rolling_std', ax, mark)
         
         # Rolling average (if enabled)
         if self.ui.chart_options['show_rolling_avg']:
+            mark = cb.overlay_mark(ax)
             window = self.ui.chart_options['rolling_window']
             cb.add_rolling_average(ax, x_data, times, window=window, 
                                   label=f'{window}-match average',
                                   is_comparison=False)
+            cb.register_overlay('show_rolling_avg', ax, mark)
         
         # Rolling median (if enabled)
         if self.ui.chart_options['show_rolling_median']:
+            mark = cb.overlay_mark(ax)
             window = self.ui.chart_options['rolling_window']
             cb.add_rolling_median(ax, x_data, times, window=window, 
                                  label=f'{window}-match median',
                                  is_comparison=False)
+            cb.register_overlay('show_rolling_median', ax, mark)
         
         # PB line (if enabled)
         if self.ui.chart_options['show_pb_line']:
+            mark = cb.overlay_mark(ax)
             cb.add_pb_line(ax, x_data, times, label='PB')
+            cb.register_overlay('show_pb_line', ax, mark)
         
         cb.set_labels(ax, 
                      title=f'{self.ui.analyzer.username} - Performance Progression',
@@ -392,6 +456,7 @@ class ProgressionChart(ChartViewBase):
         cb.set_grid(ax, self.ui.chart_options['show_grid'])
         cb.set_log_scale(ax, self.ui.chart_options['log_scale'], self.ui._minutes_to_str)
         cb.set_legend(ax)
+        cb.enable_overlay_blitting(ax)
 
         # Only rotate labels for date mode
         if not use_match_numbers:
@@ -0,0 +1,268 @@
+"""
+Test suite for the columnar match filter.
+
+filter_matches narrows boolean masks over column arrays (packed category bits
+and a fused range kernel); these tests check it selects and orders exactly the
+matches a per-match predicate does, for every combination of filters.
+"""
+
+import unittest
+import itertools
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+
+import sys
+import os
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.analyzer import MCSRAnalyzer
+from src.core.match import Match
+from src.core import _filter_kernels
+from src.core._filter_kernels import range_mask, DATE_MIN, DATE_MAX
+
+
+def create_match(match_id, rng):
+    """Create a Match with random results, times and categories."""
+    match = Match.__new__(Match)
+    match.id = match_id
+    match.date = 1704067200 + rng.randint(0, 400) * 3600  # Repeated dates test sort ties
+    match.datetime_obj = datetime.fromtimestamp(match.date)
+    match.is_draw = rng.random() < 0.1
+    match.is_user_win = None if match.is_draw or rng.random() < 0.1 else rng.random() < 0.5
+    match.forfeited = rng.random() < 0.25
+    match.user_completed = rng.random() < 0.6
+    match.match_time = rng.choice((None, rng.randint(200000, 1200000)))
+    match.match_type = rng.choice((1, 1, 2, 3))
+    match.player_count = rng.choice((1, 2, 2, 3, 4))
+    match.season = rng.choice((3, 4, 5, 6))
+    match.seed_type = rng.choice(('VILLAGE', 'SHIPWRECK', 'TEMPLE', None))
+    match.has_detailed_data = rng.random() < 0.5
+    match.user_uuid = rng.choice(('test-uuid-123', None))
+    return match
+
+
+def reference_filter(matches, completed_only=False, user_completed=None, include_draws=True,
+                     include_forfeits=True, include_wins=True, include_losses=True,
+                     require_time=False, min_time_ms=None, max_time_ms=None,
+                     include_private_rooms=True, match_types=None, max_player_count=None,
+                     seasons=None, seed_types=None, has_detailed_data=None,
+                     require_user_identified=False, date_from=None, date_to=None,
+                     sort_by='date', sort_descending=True):
+    """filter_matches written as one predicate per match"""
+    def keep(m):
+        if completed_only and not (m.user_completed and m.match_time is not None and not m.is_draw):
+            return False
+        if user_completed is not None and m.user_completed != user_completed:
+            return False
+        if not include_draws and m.is_draw:
+            return False
+        if not include_forfeits and m.forfeited:
+            return False
+        if not include_wins and m.is_user_win is True:
+            return False
+        if not include_losses and m.is_user_win is False:
+            return False
+        if require_time and m.match_time is None:
+            return False
+        if min_time_ms is not None and (m.match_time is None or m.match_time < min_time_ms):
+            return False
+        if max_time_ms is not None and (m.match_time is None or m.match_time > max_time_ms):
+            return False
+        if not include_private_rooms and (m.match_type == 3 or m.player_count > 2):
+            return False
+        if match_types is not None and m.match_type not in match_types:
+            return False
+        if max_player_count is not None and m.player_count > max_player_count:
+            return False
+        if require_user_identified and m.user_uuid is None and m.player_count != 1:
+            return False
+        if has_detailed_data is not None and m.has_detailed_data != has_detailed_data:
+            return False
+        if seasons is not None and m.season not in seasons:
+            return False
+        if seed_types is not None and m.seed_type not in seed_types:
+            return False
+        if date_from is not None and m.datetime_obj < date_from:
+            return False
+        if date_to is not None and m.datetime_obj > date_to:
+            return False
+        return True
+
+    filtered = [m for m in matches if keep(m)]
+    if sort_by == 'date':
+        filtered.sort(key=lambda m: m.date, reverse=sort_descending)
+    elif sort_by == 'time':
+        filtered.sort(key=lambda m: m.match_time if m.match_time is not None else float('inf'),
+                      reverse=sort_descending)
+    elif sort_by == 'season':
+        filtered.sort(key=lambda m: m.season, reverse=sort_descending)
+    return filtered
+
+
+class TestFilterMaskMatchesPredicate(unittest.TestCase):
+    """Mask-based filter_matches against the per-match predicate"""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        rng = random.Random(42)
+        self.rng = rng
+        self.analyzer = MCSRAnalyzer.__new__(MCSRAnalyzer)
+        self.analyzer.matches = [create_match(i, rng) for i in range(150)]
+
+    def assertSameMatches(self, **kwargs):
+        expected = [m.id for m in reference_filter(self.analyzer.matches, **kwargs)]
+        actual = [m.id for m in self.analyzer.filter_matches(**kwargs)]
+        self.assertEqual(actual, expected, kwargs)
+
+    def test_flag_combinations(self):
+        """Every combination of the boolean and tri-state filters"""
+        flags = ('completed_only', 'include_draws', 'include_forfeits', 'include_wins',
+                 'include_losses', 'require_time', 'include_private_rooms',
+                 'require_user_identified')
+        for values in itertools.product((False, True), repeat=len(flags)):
+            for user_completed, has_detailed_data in itertools.product((None, False, True), repeat=2):
+                kwargs = dict(zip(flags, values))
+                with self.subTest(user_completed=user_completed, has_detailed_data=has_detailed_data, **kwargs):
+                    self.assertSameMatches(user_completed=user_completed,
+                                           has_detailed_data=has_detailed_data, **kwargs)
+
+    def test_value_filter_combinations(self):
+        """Every combination of the range and categorical filters being set or open"""
+        base = datetime.fromtimestamp(1704067200)
+        options = {
+            'min_time_ms': (None, 400000),
+            'max_time_ms': (None, 900000),
+            'match_types': (None, [1, 3]),
+            'max_player_count': (None, 2),
+            'seasons': (None, [4, 6], [99]),
+            'seed_types': (None, ['VILLAGE', None], []),
+            'date_from': (None, base + timedelta(hours=100)),
+            'date_to': (None, base + timedelta(hours=300)),
+        }
+        keys = list(options)
+        for values in itertools.product(*(options[k] for k in keys)):
+            kwargs = dict(zip(keys, values))
+            with self.subTest(**kwargs):
+                self.assertSameMatches(**kwargs)
+
+    def test_random_combinations(self):
+        """Random mixes of all filters, sort keys and sort directions"""
+        rng = self.rng
+        for _ in range(300):
+            kwargs = {
+                'completed_only': rng.random() < 0.3,
+                'include_draws': rng.random() < 0.8,
+                'include_wins': rng.random() < 0.8,
+                'include_private_rooms': rng.random() < 0.7,
+                'sort_by': rng.choice(('date', 'time', 'season', 'none')),
+                'sort_descending': rng.random() < 0.5,
+            }
+            if rng.random() < 0.4:
+                kwargs['min_time_ms'] = rng.randint(200000, 1200000)
+            if rng.random() < 0.4:
+                kwargs['max_time_ms'] = rng.randint(200000, 1200000)
+            if rng.random() < 0.4:
+                kwargs['seasons'] = rng.sample((3, 4, 5, 6, 7), 2)
+            if rng.random() < 0.4:
+                kwargs['seed_types'] = rng.sample(('VILLAGE', 'SHIPWRECK', 'TEMPLE', 'RUINED_PORTAL'), 2)
+            if rng.random() < 0.4:
+                kwargs['date_from'] = rng.choice(self.analyzer.matches).datetime_obj
+            if rng.random() < 0.4:
+                kwargs['date_to'] = rng.choice(self.analyzer.matches).datetime_obj
+            with self.subTest(**kwargs):
+                self.assertSameMatches(**kwargs)
+
+    def test_columns_follow_match_changes(self):
+        """The column store is rebuilt when matches are added or matches_version changes"""
+        self.assertSameMatches(seasons=[5])
+        self.analyzer.matches.append(create_match(1000, self.rng))
+        self.assertSameMatches(seasons=[5])
+        self.analyzer.matches[0].season = 5
+        self.analyzer.matches_version += 1
+        self.assertSameMatches(seasons=[5])
+
+    def test_empty_matches(self):
+        """Filtering no matches returns an empty list"""
+        self.analyzer.matches = []
+        self.assertEqual(self.analyzer.filter_matches(seasons=[5], min_time_ms=1), [])
+
+
+class TestRangeMaskNumpy(unittest.TestCase):
+    """The NumPy fallback of the fused range kernel"""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.category = np.array([0b01, 0b10, 0b11, 0b01, 0b00], dtype=np.int64)
+        self.dates = np.array([10, 20, 30, 40, 50], dtype=np.int64)
+        self.times = np.array([100.0, np.nan, 300.0, 400.0, 500.0])
+
+    def run_numpy(self, select=0, wanted=0, date_lo=DATE_MIN, date_hi=DATE_MAX,
+                  time_lo=None, time_hi=None, mask=None):
+        """Call the NumPy implementation the way range_mask does"""
+        if mask is None:
+            mask = np.ones(len(self.dates), dtype=bool)
+        check_time = time_lo is not None or time_hi is not None
+        return _filter_kernels._range_mask_numpy(
+            mask, self.category, np.int64(select), np.int64(wanted), self.dates,
+            np.int64(date_lo), np.int64(date_hi), self.times,
+            -np.inf if time_lo is None else float(time_lo),
+            np.inf if time_hi is None else float(time_hi), check_time)
+
+    def test_open_bounds_keep_everything(self):
+        """No category bits and None/open bounds leave the mask unchanged"""
+        self.assertEqual(self.run_numpy().tolist(), [True] * 5)
+        mask = np.array([True, False, True, False, True])
+        self.assertEqual(self.run_numpy(mask=mask.copy()).tolist(), mask.tolist())
+
+    def test_category_bits(self):
+        """Rows need the selected bits to equal the wanted values"""
+        self.assertEqual(self.run_numpy(select=0b01, wanted=0b01).tolist(),
+                         [True, False, True, True, False])
+        self.assertEqual(self.run_numpy(select=0b11, wanted=0b10).tolist(),
+                         [False, True, False, False, False])
+
+    def test_date_bounds_are_inclusive(self):
+        """Date bounds keep rows equal to either bound"""
+        self.assertEqual(self.run_numpy(date_lo=20, date_hi=40).tolist(),
+                         [False, True, True, True, False])
+        self.assertEqual(self.run_numpy(date_lo=30).tolist(), [False, False, True, True, True])
+        self.assertEqual(self.run_numpy(date_hi=30).tolist(), [True, True, True, False, False])
+
+    def test_time_bounds_drop_missing_times(self):
+        """Either time bound drops rows without a time (NaN)"""
+        self.assertEqual(self.run_numpy(time_lo=300).tolist(), [False, False, True, True, True])
+        self.assertEqual(self.run_numpy(time_hi=400).tolist(), [True, False, True, True, False])
+        self.assertEqual(self.run_numpy(time_lo=0, time_hi=10 ** 9).tolist(),
+                         [True, False, True, True, True])
+
+    def test_empty_input(self):
+        """Empty columns give an empty mask"""
+        empty = np.array([], dtype=np.int64)
+        result = _filter_kernels._range_mask_numpy(
+            np.ones(0, dtype=bool), empty, np.int64(1), np.int64(1), empty,
+            np.int64(0), np.int64(10), np.array([], dtype=np.float64), 0.0, 1.0, True)
+        self.assertEqual(result.shape, (0,))
+        self.assertEqual(range_mask(np.ones(0, dtype=bool), empty, 0, 0, empty,
+                                    times=np.array([], dtype=np.float64)).shape, (0,))
+
+    def test_range_mask_matches_numpy(self):
+        """range_mask (numba or not) gives the NumPy fallback's results"""
+        rng = random.Random(3)
+        for _ in range(50):
+            select = rng.choice((0, 0b01, 0b10, 0b11))
+            wanted = select & rng.randint(0, 3)
+            date_lo = rng.choice((DATE_MIN, rng.randint(0, 60)))
+            date_hi = rng.choice((DATE_MAX, rng.randint(0, 60)))
+            time_lo = rng.choice((None, rng.randint(0, 600)))
+            time_hi = rng.choice((None, rng.randint(0, 600)))
+            expected = self.run_numpy(select, wanted, date_lo, date_hi, time_lo, time_hi)
+            actual = range_mask(np.ones(5, dtype=bool), self.category, select, wanted, self.dates,
+                                date_lo, date_hi, self.times, time_lo, time_hi)
+            self.assertEqual(actual.tolist(), expected.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
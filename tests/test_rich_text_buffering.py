@@ -0,0 +1,126 @@
+"""
+Test suite for RichTextWidget insert buffering.
+
+Content added between clear() and finalize() is buffered, merged into runs
+that share tags and sent to Tk in one insert or replace; the widget must end
+up with the same text and tag ranges as inserting each piece directly.
+"""
+
+import unittest
+import tkinter as tk
+
+import sys
+import os
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ui.widgets.rich_text_widget import RichTextWidget
+
+
+TAGS = ('h1', 'h2', 'h3', 'bold', 'monospace', 'accent', 'success', 'warning', 'error',
+        'muted', 'separator')
+
+
+def add_sample_content(widget):
+    """Content that mixes repeated, changing and empty tag runs"""
+    widget.add_heading("Summary", level=1)
+    widget.add_line("Plain line")
+    widget.add_text("Wins: ", ['muted'])
+    widget.add_text("12", ['muted'])  # Same tags as the previous run
+    widget.add_line(" (60%)", ['success'])
+    widget.add_text("", ['error'])
+    widget.add_line("Mixed", ['bold', 'accent'])
+    widget.add_stats_block("Times", {"Best": "9:59.000", "Average": "12:30.500"})
+    widget.add_separator()
+    widget.add_heading("Details", level=3)
+    widget.add_line()
+
+
+class TestRichTextBuffering(unittest.TestCase):
+    """Buffered RichTextWidget output against unbuffered inserts"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("Tk display not available")
+        self.root.withdraw()  # Hide the window during tests
+
+    def tearDown(self):
+        """Clean up after tests"""
+        try:
+            self.root.destroy()
+        except:
+            pass
+
+    def unbuffered(self, fill):
+        """Widget filled by inserting each piece directly (no batch is open)"""
+        widget = RichTextWidget(self.root)
+        fill(widget)
+        return widget
+
+    def buffered(self, fill, old_content=None):
+        """Widget filled between clear() and finalize(), optionally over earlier content"""
+        widget = RichTextWidget(self.root)
+        if old_content is not None:
+            widget.add_line(old_content, ['error'])
+        widget.clear()
+        fill(widget)
+        widget.finalize()
+        return widget
+
+    def assertSameContent(self, actual, expected):
+        """Same text, same tag ranges and embedded windows at the same places"""
+        self.assertEqual(actual.get('1.0', tk.END), expected.get('1.0', tk.END))
+        for tag in TAGS:
+            self.assertEqual([str(i) for i in actual.tag_ranges(tag)],
+                             [str(i) for i in expected.tag_ranges(tag)], tag)
+        self.assertEqual([(key, index) for key, _, index in actual.dump('1.0', tk.END, window=True)],
+                         [(key, index) for key, _, index in expected.dump('1.0', tk.END, window=True)])
+
+    def test_buffered_matches_unbuffered(self):
+        """clear() then content then finalize() gives the direct-insert result"""
+        self.assertSameContent(self.buffered(add_sample_content),
+                               self.unbuffered(add_sample_content))
+
+    def test_replace_after_clear_drops_old_content(self):
+        """Content added after clear() replaces what was there before"""
+        widget = self.buffered(add_sample_content, old_content="Old player stats")
+        self.assertSameContent(widget, self.unbuffered(add_sample_content))
+        self.assertNotIn("Old player stats", widget.get('1.0', tk.END))
+        self.assertEqual(widget.tag_ranges('error'), ())
+
+    def test_clear_without_content_empties_widget(self):
+        """A clear() with nothing added still removes the old content"""
+        widget = self.buffered(lambda w: None, old_content="Old player stats")
+        self.assertEqual(widget.get('1.0', tk.END), '\n')
+        self.assertEqual(str(widget.cget('state')), tk.DISABLED)
+
+    def test_unfinalized_content_is_flushed_when_idle(self):
+        """Content added after clear() shows up at the next idle even without finalize()"""
+        widget = RichTextWidget(self.root)
+        widget.clear()
+        widget.add_line("Loading...", ['muted'])
+        self.root.update_idletasks()
+        self.assertEqual(widget.get('1.0', tk.END), "Loading...\n\n")
+        self.assertEqual([str(i) for i in widget.tag_ranges('muted')], ['1.0', '2.0'])
+
+    def test_table_follows_buffered_text(self):
+        """add_table flushes earlier text first, so the table sits between the lines around it"""
+        def fill(widget):
+            widget.add_heading("Recent Matches", level=2)
+            widget.add_line("Before the table", ['muted'])
+            widget.add_table(["Date", "Time"], [["2024-01-15", "23:45.123"], ["2024-01-14", "24:12.456"]])
+            widget.add_line("After the table", ['accent'])
+
+        widget = self.buffered(fill)
+        self.assertSameContent(widget, self.unbuffered(fill))
+        windows = [index for key, _, index in widget.dump('1.0', tk.END, window=True)]
+        self.assertEqual(windows, ['3.0'])
+        self.assertEqual(widget.get('1.0', '3.0'), "Recent Matches\nBefore the table\n")
+        self.assertEqual(widget.get('3.1', tk.END), "\nAfter the table\n\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
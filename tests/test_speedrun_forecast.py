@@ -0,0 +1,142 @@
+"""
+Test suite for SpeedrunForecaster.
+
+Checks the precomputed rolling tables against the per-call history scan
+they replaced, so forecasts stay the same.
+"""
+
+import unittest
+import random
+
+import sys
+import os
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.match import Match
+from src.core.segment_constants import SEGMENT_ORDER
+from src.utils.speedrun_forecast import SpeedrunForecaster, create_forecast_results
+
+
+def _percentile(data, percentile):
+    """Linear-interpolation percentile, as the forecaster used per call"""
+    sorted_data = sorted(data)
+    n = len(sorted_data)
+    if percentile <= 0:
+        return sorted_data[0]
+    if percentile >= 100:
+        return sorted_data[-1]
+    index = (percentile / 100.0) * (n - 1)
+    lower_index = int(index)
+    upper_index = min(lower_index + 1, n - 1)
+    if lower_index == upper_index:
+        return sorted_data[lower_index]
+    weight = index - lower_index
+    return sorted_data[lower_index] * (1 - weight) + sorted_data[upper_index] * weight
+
+
+class ScanForecaster(SpeedrunForecaster):
+    """Forecaster that rescans the match history on every lookup"""
+
+    def _history(self, match, up_to_index):
+        return [m for m in self.matches[:up_to_index]
+                if m.user_completed and m.has_detailed_data and m.date < match.date]
+
+    def _history_count(self, match, up_to_index):
+        return len(self._history(match, up_to_index))
+
+    def _calculate_rolling_percentiles(self, match, up_to_index):
+        history = self._history(match, up_to_index)[-self.rolling_window:]
+        rolling_percentiles = {}
+        for segment in SEGMENT_ORDER:
+            times = [m.segments[segment]['absolute_time'] for m in history
+                     if segment in m.segments and 'absolute_time' in m.segments[segment]]
+            if len(times) >= 3:
+                rolling_percentiles[segment] = _percentile(times, self.percentile)
+        return rolling_percentiles
+
+    def _split_percentile(self, current_match, up_to_index, segment):
+        splits = [m.segments[segment]['split_time'] for m in self._history(current_match, up_to_index)
+                  if segment in m.segments and 'split_time' in m.segments[segment]
+                  and m.segments[segment]['split_time'] > 0]
+        splits = splits[-self.rolling_window:]
+        return _percentile(splits, self.percentile) if splits else None
+
+
+def create_match(match_id, date, rng):
+    """Create a Match with random completion state and partial segment data."""
+    match = Match.__new__(Match)
+    match.id = match_id
+    match.date = date
+    match.user_completed = rng.random() < 0.6
+    match.has_detailed_data = rng.random() < 0.85
+    match.match_time = rng.randint(400000, 900000) if match.user_completed else None
+
+    match.segments = {}
+    if match.has_detailed_data:
+        # Completed runs reach the end; others stop early, and some segments are skipped
+        reached = len(SEGMENT_ORDER) if match.user_completed else rng.randint(0, len(SEGMENT_ORDER))
+        absolute_time = 0
+        for segment in SEGMENT_ORDER[:reached]:
+            split_time = rng.choice((0, rng.randint(20000, 120000)))
+            absolute_time += split_time
+            if rng.random() < 0.15:
+                continue
+            data = {'split_time': split_time}
+            if rng.random() < 0.9:
+                data['absolute_time'] = absolute_time
+            match.segments[segment] = data
+    return match
+
+
+class TestForecastTables(unittest.TestCase):
+    """The precomputed tables must give the same forecasts as scanning the history"""
+
+    def _assert_same_forecasts(self, matches, rolling_window, percentile):
+        fast = SpeedrunForecaster(matches, rolling_window=rolling_window, percentile=percentile)
+        scan = ScanForecaster(matches, rolling_window=rolling_window, percentile=percentile)
+        for i, match in enumerate(fast.matches):
+            self.assertEqual(fast._history_count(match, i), scan._history_count(match, i))
+            expected = scan._calculate_rolling_percentiles(match, i)
+            actual = fast._calculate_rolling_percentiles(match, i)
+            self.assertEqual(actual.keys(), expected.keys())
+            for segment, value in expected.items():
+                self.assertAlmostEqual(actual[segment], value, places=6)
+            for segment in SEGMENT_ORDER:
+                expected_split = scan._split_percentile(match, i, segment)
+                actual_split = fast._split_percentile(match, i, segment)
+                if expected_split is None:
+                    self.assertIsNone(actual_split)
+                else:
+                    self.assertAlmostEqual(actual_split, expected_split, places=6)
+            self.assertEqual(fast.calculate_forecast(match), scan.calculate_forecast(match))
+            self.assertEqual(fast.get_forecast_breakdown(match), scan.get_forecast_breakdown(match))
+
+    def test_random_histories(self):
+        """Random histories, including repeated dates, across windows and percentiles"""
+        rng = random.Random(7)
+        for trial in range(20):
+            dates = sorted(rng.randint(0, 60) for _ in range(rng.randint(0, 80)))
+            matches = [create_match(i, date, rng) for i, date in enumerate(dates)]
+            rng.shuffle(matches)
+            for rolling_window in (1, 3, 20):
+                for percentile in (0, 25, 50, 90, 100):
+                    with self.subTest(trial=trial, window=rolling_window, percentile=percentile):
+                        self._assert_same_forecasts(matches, rolling_window, percentile)
+
+    def test_empty_history(self):
+        """No matches gives no forecasts"""
+        self.assertEqual(create_forecast_results([]), [])
+
+    def test_completed_match_returns_actual_time(self):
+        """Completed runs are reported with their own time"""
+        rng = random.Random(1)
+        match = create_match(1, 100, rng)
+        match.user_completed = True
+        match.match_time = 500000
+        forecaster = SpeedrunForecaster([match])
+        self.assertEqual(forecaster.calculate_forecast(match), 500000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Test suite for VirtualTreeview.
+
+Checks that only the scrolled-to window of rows exists as Tk items, and that
+scrolling, selection and re-sorting map back to the right row ids.
+"""
+
+import unittest
+import tkinter as tk
+
+import sys
+import os
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ui.widgets.virtual_treeview import VirtualTreeview
+
+
+class TestVirtualTreeview(unittest.TestCase):
+    """Windowed rendering of VirtualTreeview"""
+
+    HEIGHT = 10  # Rows shown while the tree is not mapped
+
+    def setUp(self):
+        """Set up test fixtures"""
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("Tk display not available")
+        self.root.withdraw()  # Hide the window during tests; unmapped trees show HEIGHT rows
+        self.tree = VirtualTreeview(self.root, columns=('name', 'value'), show='headings',
+                                    height=self.HEIGHT)
+        self.rows = [(f'row{i}', f'{i * 10} ms') for i in range(100)]  # Not numeric, so Tk keeps them as str
+        self.iids = [f'm{i}' for i in range(100)]
+
+    def tearDown(self):
+        """Clean up after tests"""
+        try:
+            self.root.destroy()
+        except:
+            pass
+
+    def assertWindow(self, first):
+        """The Tk items are exactly the rows from first, in order and with their values"""
+        expected = self.tree.row_ids()[first:first + self.HEIGHT]
+        self.assertEqual(list(self.tree.get_children()), expected)
+        for iid in expected:
+            index = self.tree.row_ids().index(iid)
+            self.assertEqual(tuple(self.tree.item(iid, 'values')), self.tree._rows[index])
+
+    def test_set_rows_renders_only_the_window(self):
+        """More rows than fit give items for the first window only"""
+        self.tree.set_rows(self.rows, self.iids)
+        self.assertEqual(self.tree.row_ids(), self.iids)
+        self.assertEqual(len(self.tree.get_children()), self.HEIGHT)
+        self.assertWindow(0)
+
+    def test_set_rows_default_iids(self):
+        """Without iids the rows are numbered"""
+        self.tree.set_rows(self.rows[:3])
+        self.assertEqual(list(self.tree.get_children()), ['0', '1', '2'])
+
+    def test_yview_rows_clamps_at_both_ends(self):
+        """Scrolling past either end stops at the first or last full window"""
+        self.tree.set_rows(self.rows, self.iids)
+        self.tree.yview_rows('moveto', '2.0')
+        self.assertWindow(100 - self.HEIGHT)
+        self.tree.yview_rows('scroll', '5', 'units')
+        self.assertWindow(100 - self.HEIGHT)
+
+        self.tree.yview_rows('moveto', '-1.0')
+        self.assertWindow(0)
+        self.tree.yview_rows('scroll', '-3', 'units')
+        self.assertWindow(0)
+
+        self.tree.yview_rows('scroll', '1', 'pages')
+        self.assertWindow(self.HEIGHT)
+        self.tree.yview_rows('moveto', '0.5')
+        self.assertWindow(50)
+
+    def test_selection_maps_to_row_id_after_scroll(self):
+        """A row selected after scrolling reports its own id, and keeps it while scrolled away"""
+        selected = []
+        self.tree.on_select(lambda event: selected.append(self.tree.selection()[0]))
+        self.tree.set_rows(self.rows, self.iids)
+
+        self.tree.yview_rows('moveto', '0.5')
+        self.tree.selection_set('m55')
+        self.root.update()
+        self.assertEqual(selected, ['m55'])
+        self.assertEqual(tuple(self.tree.item('m55', 'values')), self.rows[55])
+
+        # Scrolled out of view the item is gone, but the selection comes back with it
+        self.tree.yview_rows('moveto', '0.0')
+        self.assertNotIn('m55', self.tree.get_children())
+        self.tree.yview_rows('moveto', '0.5')
+        self.assertEqual(self.tree.selection(), ('m55',))
+        self.root.update()
+        self.assertEqual(selected, ['m55'])  # Reselecting the same row is not a change
+
+    def test_resort_while_scrolled(self):
+        """Reordering the same rows keeps the scroll position and the selected id"""
+        self.tree.set_rows(self.rows, self.iids)
+        self.tree.yview_rows('moveto', '0.5')
+        self.tree.selection_set('m55')
+        self.root.update()
+
+        order = list(reversed(range(100)))
+        self.tree.set_rows([self.rows[i] for i in order], [self.iids[i] for i in order],
+                           keep_selection=True)
+        self.assertEqual(self.tree.row_ids(), [self.iids[i] for i in order])
+        self.assertWindow(50)
+        self.assertNotIn('m55', self.tree.get_children())  # Now at position 44
+
+        self.tree.yview_rows('moveto', '0.44')
+        self.assertWindow(44)
+        self.assertEqual(self.tree.selection(), ('m55',))
+
+    def test_new_rows_reset_scroll_and_selection(self):
+        """Rows replaced without keep_selection start from the top with nothing selected"""
+        self.tree.set_rows(self.rows, self.iids)
+        self.tree.yview_rows('moveto', '0.5')
+        self.tree.selection_set('m55')
+        self.root.update()
+
+        self.tree.set_rows(self.rows, self.iids)
+        self.assertWindow(0)
+        self.tree.yview_rows('moveto', '0.5')
+        self.assertEqual(self.tree.selection(), ())
+
+
+if __name__ == '__main__':
+    unittest.main()